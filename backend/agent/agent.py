@@ -29,18 +29,27 @@ from __future__ import annotations
 import json
 import logging
 import re
+import time
 from typing import Any
 
 from groq import Groq
 
+from core.cancellation import CancellationToken, cancellation_scope, current_token
 from core.tools.base import ToolResult
 from core.tools.registry import ToolRegistry
+from core.tracing import Tracer, span
 from execution.executor import ToolExecutor
+from execution.metrics import MetricsRegistry
+from execution.profiling import Profiler
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_MODEL = "llama-3.3-70b-versatile"
 
+# Share of a run's remaining time budget granted to the Groq request; the
+# rest (plus whatever the request didn't use) is left for the tool.
+_DEFAULT_LLM_BUDGET = 0.5
+
 # --------------------------------------------------------------------------- #
 #  Prompt templates                                                             #
 # --------------------------------------------------------------------------- #
@@ -74,23 +83,12 @@ USER INSTRUCTION:
 """
 
 
-def _build_tool_listing(metadata: list[dict]) -> str:
-    """Render tool metadata into a readable block for the prompt."""
-    lines: list[str] = []
-    for i, tool in enumerate(metadata, start=1):
-        lines.append(f"{i}. Tool name: {tool['name']}")
-        lines.append(f"   Description: {tool['description']}")
-        props = tool["input_schema"].get("properties", {})
-        required = tool["input_schema"].get("required", [])
-        if props:
-            lines.append("   Arguments:")
-            for arg_name, spec in props.items():
-                req_marker = " (required)" if arg_name in required else " (optional)"
-                arg_type = spec.get("type", "any")
-                arg_desc = spec.get("description", "")
-                lines.append(f"     - {arg_name} [{arg_type}]{req_marker}: {arg_desc}")
-        lines.append("")
-    return "\n".join(lines).rstrip()
+def _cancelled(token: CancellationToken) -> ToolResult:
+    """Result of a run stopped by its token."""
+    status = token.status
+    msg = f"Instruction {status.replace('_', ' ')}: {token.reason}"
+    logger.warning(msg)
+    return ToolResult(success=False, error=msg, metadata={"status": status})
 
 
 def _extract_json(text: str) -> str:
@@ -123,6 +121,15 @@ class Agent:
     executor   : ToolExecutor   -- dispatches the tool call decided by the model.
     api_key    : str            -- Groq API key from console.groq.com.
     model_name : str            -- Groq model identifier. Defaults to llama-3.3-70b-versatile.
+    metrics    : MetricsRegistry -- optional; records LLM latency and run outcomes.
+    tracer     : Tracer         -- optional; each run becomes one trace whose spans
+                                   cover prompt building, the Groq call, parsing
+                                   and (via the executor) the tool call.
+    profiler   : Profiler       -- optional; profiles selected runs end-to-end.
+    timeout    : float          -- optional per-run deadline in seconds, spanning
+                                   the Groq request and the tool call.
+    llm_budget : float          -- fraction of the remaining budget used as the
+                                   Groq request timeout. Defaults to 0.5.
     """
 
     def __init__(
@@ -131,10 +138,22 @@ class Agent:
         executor: ToolExecutor,
         api_key: str,
         model_name: str = _DEFAULT_MODEL,
+        metrics: MetricsRegistry | None = None,
+        tracer: Tracer | None = None,
+        profiler: Profiler | None = None,
+        timeout: float | None = None,
+        llm_budget: float = _DEFAULT_LLM_BUDGET,
     ) -> None:
+        if not 0.0 < llm_budget <= 1.0:
+            raise ValueError("llm_budget must be in (0, 1].")
         self._registry = registry
         self._executor = executor
         self._model_name = model_name
+        self._metrics = metrics
+        self._span = tracer.start_span if tracer is not None else span
+        self._profiler = profiler
+        self._timeout = timeout
+        self._llm_budget = llm_budget
 
         # Official Groq Python SDK — mirrors OpenAI client interface
         self._client = Groq(api_key=api_key)
@@ -149,7 +168,14 @@ class Agent:
     #  Public API                                                          #
     # ------------------------------------------------------------------ #
 
-    def run(self, instruction: str) -> ToolResult:
+    def run(
+        self,
+        instruction: str,
+        *,
+        profile: bool = False,
+        timeout: float | None = None,
+        token: CancellationToken | None = None,
+    ) -> ToolResult:
         """
         Process a natural-language instruction end-to-end.
 
@@ -161,46 +187,107 @@ class Agent:
         4. Validate the decision structure.
         5. Delegate execution to ToolExecutor and return ToolResult.
 
+        Parameters
+        ----------
+        instruction : str
+        profile     : bool -- profile this run with the agent's Profiler, even
+                              if the profiler is disabled. Ignored without one.
+        timeout     : float -- deadline for this run in seconds; overrides the
+                               agent's default timeout.
+        token       : CancellationToken -- lets the caller cancel the run
+                               (e.g. from another thread). The run's own
+                               token is a child of it.
+
         Returns
         -------
-        ToolResult -- always returned, never raises.
+        ToolResult -- always returned, never raises. A cancelled run or one
+        past its deadline has metadata["status"] "cancelled" or
+        "deadline_exceeded".
         """
+        budget = timeout if timeout is not None else self._timeout
+        token = (
+            token.child(budget) if token is not None
+            else CancellationToken.with_timeout(budget)
+        )
+        with cancellation_scope(token), \
+                self._span("agent.run", model=self._model_name) as trace_span:
+            if self._profiler is None:
+                result = self._run(instruction)
+            else:
+                with self._profiler.profile("agent.run", tool=False, force=profile) as recorded:
+                    result = self._run(instruction)
+                if recorded is not None:
+                    result.metadata["profile_id"] = recorded.id
+            if not result.success:
+                trace_span.record_error(result.error or "failed")
+        if self._metrics is not None:
+            self._metrics.increment(
+                "agent_runs_total", outcome="success" if result.success else "failure"
+            )
+        return result
+
+    def _run(self, instruction: str) -> ToolResult:
+        """Body of `run`; every exit path returns a ToolResult."""
         if not instruction.strip():
             return ToolResult(success=False, error="Instruction must not be empty.")
 
+        token = current_token()
+        if token.cancelled:
+            return _cancelled(token)
+
         # --- 1. Build prompt -------------------------------------------- #
-        tool_metadata = self._registry.list_metadata()
-        tool_listing = _build_tool_listing(tool_metadata)
-        user_prompt = _USER_PROMPT_TEMPLATE.format(
-            tool_listing=tool_listing,
-            instruction=instruction,
-        )
+        with span("agent.prompt"):
+            tool_listing = self._registry.prompt_listing()
+            user_prompt = _USER_PROMPT_TEMPLATE.format(
+                tool_listing=tool_listing,
+                instruction=instruction,
+            )
 
         logger.info("Sending instruction to Groq/Llama: %r", instruction[:120])
 
         # --- 2. Call Groq ----------------------------------------------- #
+        remaining = token.remaining()
+        request_options: dict[str, Any] = {}
+        if remaining is not None:
+            request_options["timeout"] = remaining * self._llm_budget
+
+        started = time.perf_counter()
         try:
-            response = self._client.chat.completions.create(
-                model=self._model_name,
-                messages=[
-                    {"role": "system", "content": _SYSTEM_PROMPT},
-                    {"role": "user",   "content": user_prompt},
-                ],
-                temperature=0,      # deterministic tool selection
-                max_tokens=512,     # tool calls are short JSON blobs
-            )
+            with span("agent.llm", model=self._model_name):
+                response = self._client.chat.completions.create(
+                    model=self._model_name,
+                    messages=[
+                        {"role": "system", "content": _SYSTEM_PROMPT},
+                        {"role": "user",   "content": user_prompt},
+                    ],
+                    temperature=0,      # deterministic tool selection
+                    max_tokens=512,     # tool calls are short JSON blobs
+                    **request_options,
+                )
             raw_text: str = response.choices[0].message.content or ""
         except Exception as exc:  # noqa: BLE001
+            if token.cancelled:
+                return _cancelled(token)
             msg = f"Groq API call failed: {exc}"
             logger.error(msg)
             return ToolResult(success=False, error=msg)
+        finally:
+            if self._metrics is not None:
+                self._metrics.observe(
+                    "llm_request_duration_seconds",
+                    time.perf_counter() - started,
+                    model=self._model_name,
+                )
 
         logger.debug("Groq raw response: %s", raw_text)
 
+        if token.cancelled:
+            return _cancelled(token)
+
         # --- 3. Parse JSON ---------------------------------------------- #
-        json_str = _extract_json(raw_text)
         try:
-            decision: dict[str, Any] = json.loads(json_str)
+            with span("agent.parse"):
+                decision: dict[str, Any] = json.loads(_extract_json(raw_text))
         except json.JSONDecodeError as exc:
             msg = (
                 f"Model returned invalid JSON: {exc}\n"
@@ -247,6 +334,16 @@ class Agent:
     #  Introspection                                                       #
     # ------------------------------------------------------------------ #
 
+    @property
+    def metrics(self) -> MetricsRegistry | None:
+        """The MetricsRegistry this agent records into, if any."""
+        return self._metrics
+
+    @property
+    def profiler(self) -> Profiler | None:
+        """The Profiler this agent (and its executor) report to, if any."""
+        return self._profiler
+
     def __repr__(self) -> str:
         return (
             f"<Agent model={self._model_name!r}  "
@@ -0,0 +1,7 @@
+"""
+benchmarks/__init__.py
+
+Standalone micro-benchmarks. Run from the backend directory, e.g.:
+
+    python -m benchmarks.bench_validation
+"""
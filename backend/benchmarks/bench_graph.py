@@ -0,0 +1,83 @@
+"""
+benchmarks/bench_graph.py
+
+Throughput of GraphExecutor on synthetic graphs, against worker count:
+
+- wide : N independent steps (embarrassingly parallel).
+- deep : a single chain of N steps (no parallelism available).
+- tree : a binary fan-out, each step depending on its parent.
+
+Each step simulates a short I/O-bound tool (sleeps `_STEP_SECONDS`).
+
+    python -m benchmarks.bench_graph
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from core.tools.base import BaseTool, ToolResult
+from core.tools.registry import ToolRegistry
+from execution.executor import ToolExecutor
+from execution.graph import GraphExecutor, ToolGraph, ref
+
+_STEP_SECONDS = 0.002
+_STEPS = 400
+
+
+class _SleepTool(BaseTool):
+    name = "sleep"
+    description = "Sleeps briefly and echoes its input."
+    input_schema: dict[str, Any] = {
+        "type": "object",
+        "properties": {"value": {"type": ["integer", "null"]}},
+    }
+
+    def execute(self, **kwargs: Any) -> ToolResult:
+        time.sleep(_STEP_SECONDS)
+        return ToolResult(success=True, output=(kwargs.get("value") or 0) + 1)
+
+
+def _wide(n: int) -> ToolGraph:
+    graph = ToolGraph()
+    for i in range(n):
+        graph.add(f"s{i}", "sleep", {"value": i})
+    return graph
+
+
+def _deep(n: int) -> ToolGraph:
+    graph = ToolGraph()
+    graph.add("s0", "sleep", {"value": 0})
+    for i in range(1, n):
+        graph.add(f"s{i}", "sleep", {"value": ref(f"s{i - 1}")})
+    return graph
+
+
+def _tree(n: int) -> ToolGraph:
+    graph = ToolGraph()
+    graph.add("s0", "sleep", {"value": 0})
+    for i in range(1, n):
+        graph.add(f"s{i}", "sleep", {"value": ref(f"s{(i - 1) // 2}")})
+    return graph
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    registry = ToolRegistry()
+    registry.register(_SleepTool())
+    executor = ToolExecutor(registry)
+
+    print(f"{'shape':>6}  {'workers':>7}  {'seconds':>8}  {'steps/s':>9}")
+    for shape, build in (("wide", _wide), ("deep", _deep), ("tree", _tree)):
+        for workers in (1, 4, 16, 64):
+            graph = build(_STEPS)
+            result = GraphExecutor(executor, max_workers=workers).run(graph)
+            assert result.success, result
+            print(f"{shape:>6}  {workers:>7}  {result.duration:8.3f}  "
+                  f"{_STEPS / result.duration:9.0f}")
+
+
+if __name__ == "__main__":
+    main()
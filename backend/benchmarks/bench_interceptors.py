@@ -0,0 +1,101 @@
+"""
+benchmarks/bench_interceptors.py
+
+Per-call cost of interceptors: `ToolExecutor.execute` on a trivial tool
+with 0, 1, 2, 4 and 8 pass-through interceptors, and with 8 interceptors
+that do not apply to the tool (whose calls must cost the same as with
+none). "per interceptor" is the added cost per interceptor over an
+executor built without any; "pipeline" times the composed chain alone,
+without the rest of the executor, which isolates the same cost from noise.
+Scenarios are interleaved and the best of several rounds is kept.
+
+    python -m benchmarks.bench_interceptors
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from core.tools.base import BaseTool, ToolResult
+from core.tools.registry import ToolRegistry
+from execution.executor import ToolExecutor
+from execution.interceptors import Interceptor, ToolCall, build_pipeline
+
+_CALLS = 20_000
+_ROUNDS = 7                     # best of
+
+
+class _Echo(BaseTool):
+    name = "echo"
+    description = "Returns its input."
+    input_schema: dict[str, Any] = {
+        "type": "object",
+        "properties": {"value": {"type": "integer"}},
+        "required": ["value"],
+    }
+
+    def execute(self, **kwargs: Any) -> ToolResult:
+        return ToolResult(success=True, output=kwargs["value"])
+
+
+class _PassThrough(Interceptor):
+    def intercept(self, call, proceed):
+        return proceed(call)
+
+
+class _Elsewhere(_PassThrough):
+    def applies_to(self, tool: BaseTool) -> bool:
+        return False
+
+
+def _per_call(executor: ToolExecutor) -> float:
+    started = time.perf_counter()
+    for i in range(_CALLS):
+        executor.execute("echo", value=i)
+    return (time.perf_counter() - started) / _CALLS
+
+
+def _per_pipeline_call(tool: BaseTool, interceptors: list[Interceptor]) -> float:
+    done = ToolResult(success=True, output=None)
+    pipeline = build_pipeline(interceptors, tool, lambda call: done) or (lambda call: done)
+    call = ToolCall(tool, {"value": 1}, None)
+    started = time.perf_counter()
+    for _ in range(_CALLS):
+        pipeline(call)
+    return (time.perf_counter() - started) / _CALLS
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    registry = ToolRegistry()
+    registry.register(_Echo())
+
+    scenarios: list[tuple[str, list[Interceptor]]] = [
+        ("none", []),
+        *((f"{n} pass-through", [_PassThrough() for _ in range(n)]) for n in (1, 2, 4, 8)),
+        ("8 not applicable", [_Elsewhere() for _ in range(8)]),
+    ]
+
+    executors = [ToolExecutor(registry, interceptors=chain) for _, chain in scenarios]
+    tool = registry.get("echo")
+    full = [float("inf")] * len(scenarios)
+    alone = [float("inf")] * len(scenarios)
+    for _ in range(_ROUNDS):
+        for i, (executor, (_, chain)) in enumerate(zip(executors, scenarios)):
+            full[i] = min(full[i], _per_call(executor))
+            alone[i] = min(alone[i], _per_pipeline_call(tool, chain))
+
+    print(f"{'interceptors':>18}  {'per call':>10}  {'per interceptor':>15}  {'pipeline':>10}")
+    for (label, chain), cost, bare in zip(scenarios, full, alone):
+        if chain:
+            added = f"{(cost - full[0]) / len(chain) * 1e9:.0f}ns"
+            alone_added = f"{(bare - alone[0]) / len(chain) * 1e9:.0f}ns"
+        else:
+            added = alone_added = "—"
+        print(f"{label:>18}  {cost * 1e6:8.2f}µs  {added:>15}  {alone_added:>10}")
+
+
+if __name__ == "__main__":
+    main()
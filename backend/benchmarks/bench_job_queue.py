@@ -0,0 +1,78 @@
+"""
+benchmarks/bench_job_queue.py
+
+End-to-end throughput of the durable JobQueue: batched enqueue, then
+workers draining it through a ToolExecutor with a trivial tool, so the
+numbers are dominated by queue overhead.
+
+    python -m benchmarks.bench_job_queue
+"""
+
+from __future__ import annotations
+
+import logging
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from core.tools.base import BaseTool, ToolResult
+from core.tools.registry import ToolRegistry
+from execution.executor import ToolExecutor
+from execution.job_queue import JobQueue, JobWorker
+
+_JOBS = 20_000
+
+
+class _EchoTool(BaseTool):
+    name = "echo"
+    description = "Returns its input."
+    input_schema: dict[str, Any] = {
+        "type": "object",
+        "required": ["value"],
+        "properties": {"value": {"type": "integer"}},
+    }
+
+    def execute(self, **kwargs: Any) -> ToolResult:
+        return ToolResult(success=True, output=kwargs["value"])
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    registry = ToolRegistry()
+    registry.register(_EchoTool())
+    executor = ToolExecutor(registry)
+
+    for workers, batch_size in ((1, 64), (1, 256), (4, 256)):
+        with tempfile.TemporaryDirectory() as tmp:
+            queue = JobQueue(Path(tmp) / "jobs.sqlite3")
+
+            started = time.perf_counter()
+            for offset in range(0, _JOBS, 1000):
+                queue.enqueue_many(("echo", {"value": i}) for i in range(offset, offset + 1000))
+            enqueue_s = time.perf_counter() - started
+
+            pool = [
+                JobWorker(queue, executor, worker_id=f"w{i}", batch_size=batch_size)
+                for i in range(workers)
+            ]
+            started = time.perf_counter()
+            threads = [threading.Thread(target=w.run_until_empty) for w in pool]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            drain_s = time.perf_counter() - started
+
+            assert queue.stats()["done"] == _JOBS, queue.stats()
+            print(
+                f"workers={workers} batch={batch_size:<4} "
+                f"enqueue {_JOBS / enqueue_s:8.0f} jobs/s   "
+                f"execute+complete {_JOBS / drain_s:8.0f} jobs/s"
+            )
+            queue.close()
+
+
+if __name__ == "__main__":
+    main()
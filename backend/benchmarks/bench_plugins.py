@@ -0,0 +1,126 @@
+"""
+benchmarks/bench_plugins.py
+
+Startup cost of registering 500 plugin tools eagerly (import and
+instantiate each), lazily from a manifest (import on first use), and
+from a registry snapshot file (core/tools/persistence.py; saved by a
+previous lazy start).
+
+Each variant runs in a fresh interpreter so module imports aren't shared;
+startup excludes importing the framework itself, which all modes share.
+The plugin modules are generated into a temporary directory; each one
+carries a moderately sized constant table to stand in for real
+dependencies.
+
+    python -m benchmarks.bench_plugins
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+_TOOLS = 500
+
+_MODULE = '''\
+from core.tools.base import BaseTool, ToolResult
+
+_TABLE = {{i: str(i) * 8 for i in range(2000)}}
+
+
+class Tool{i}(BaseTool):
+    name = "plugin_{i}"
+    description = "Synthetic plugin tool #{i}."
+    input_schema = {schema!r}
+
+    def execute(self, **kwargs):
+        return ToolResult(success=True, output=_TABLE[len(kwargs)])
+'''
+
+_SCHEMA = {
+    "type": "object",
+    "required": ["path"],
+    "properties": {
+        "path": {"type": "string"},
+        "mode": {"type": "string", "enum": ["r", "w"]},
+        "limit": {"type": "integer"},
+    },
+}
+
+_PROBE = '''\
+import json, sys, time, tracemalloc
+sys.path[:0] = [{backend!r}, {plugins!r}]
+import logging; logging.disable(logging.CRITICAL)
+from core.tools.registry import ToolRegistry
+tracemalloc.start()
+started = time.perf_counter()
+registry = ToolRegistry()
+if {mode!r} == "snapshot":
+    assert registry.load_snapshot({snapshot!r})
+elif {mode!r} == "lazy":
+    registry.register_manifest({manifest!r})
+else:
+    import importlib
+    for i in range({tools}):
+        module = importlib.import_module(f"plugin_{{i}}")
+        registry.register(getattr(module, f"Tool{{i}}")())
+startup = time.perf_counter() - started
+memory = tracemalloc.get_traced_memory()[0]
+started = time.perf_counter()
+registry.prompt_listing()
+describe = time.perf_counter() - started
+started = time.perf_counter()
+registry.get("plugin_7")
+first_get = time.perf_counter() - started
+print(json.dumps([startup, memory, describe, first_get]))
+if {mode!r} == "lazy":
+    registry.save_snapshot({snapshot!r})
+'''
+
+
+def _generate(directory: Path) -> Path:
+    entries = []
+    for i in range(_TOOLS):
+        (directory / f"plugin_{i}.py").write_text(_MODULE.format(i=i, schema=_SCHEMA))
+        entries.append({
+            "name": f"plugin_{i}",
+            "description": f"Synthetic plugin tool #{i}.",
+            "input_schema": _SCHEMA,
+            "target": f"plugin_{i}:Tool{i}",
+        })
+    manifest = directory / "manifest.json"
+    manifest.write_text(json.dumps({"tools": entries}))
+    return manifest
+
+
+def main() -> None:
+    backend = str(Path(__file__).resolve().parent.parent)
+    with tempfile.TemporaryDirectory() as tmp:
+        plugins = Path(tmp)
+        manifest = _generate(plugins)
+        # Warm the bytecode cache so both variants pay the same compile cost.
+        subprocess.run(
+            [sys.executable, "-m", "compileall", "-q", str(plugins)], check=True
+        )
+
+        print(f"{'mode':>8}  {'startup':>10}  {'memory':>9}  {'prompt listing':>14}  {'first get':>10}")
+        for mode in ("eager", "lazy", "snapshot"):
+            probe = textwrap.dedent(_PROBE).format(
+                backend=backend, plugins=str(plugins), mode=mode,
+                manifest=str(manifest), snapshot=str(plugins / "registry.snapshot"),
+                tools=_TOOLS,
+            )
+            out = subprocess.run(
+                [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+            ).stdout
+            startup, memory, describe, first_get = json.loads(out)
+            print(f"{mode:>8}  {startup * 1e3:8.1f}ms  "
+                  f"{memory / 2**20:7.1f}MB  {describe * 1e3:12.2f}ms  {first_get * 1e3:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+benchmarks/bench_records.py
+
+Allocation cost of execution records, measured with tracemalloc: the
+former shapes (ToolResult as a regular dataclass with an eagerly created
+metadata dict, events as fresh five-key dicts each holding the ISO
+timestamp `_now()` formatted for it) against the slotted ToolResult and
+Event records, which keep a monotonic reading and format no timestamp
+unless it is read.
+
+For each, N "executions" worth of records (one result and five events)
+are built and kept alive; the table shows retained bytes and allocated
+blocks per execution, build time, and the gen-0 garbage collections
+triggered while building them. The last line measures the same through
+ToolExecutor itself (result plus every event it emits).
+
+    python -m benchmarks.bench_records
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from core.tools.base import BaseTool, ToolResult
+from core.tools.registry import ToolRegistry
+from execution.events import Clock, Event
+from execution.executor import ToolExecutor
+
+_EXECUTIONS = 50_000
+_STAGES = ("tool_lookup_started", "tool_lookup_completed", "validation_started",
+           "execution_started", "execution_completed")
+
+
+@dataclass
+class _LegacyResult:
+    """ToolResult as it was: a plain dataclass."""
+
+    success: bool
+    output: Any = None
+    error: str | None = None
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+def _legacy(i: int) -> list[Any]:
+    events: list[Any] = [
+        {
+            "type": "status",
+            "stage": stage,
+            "message": "m",
+            "tool": "echo",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        for stage in _STAGES
+    ]
+    events.append(_LegacyResult(success=True, output=i))
+    return events
+
+
+def _slotted(i: int) -> list[Any]:
+    clock = Clock()
+    events: list[Any] = [Event("status", stage, "m", "echo", clock) for stage in _STAGES]
+    events.append(ToolResult(success=True, output=i))
+    return events
+
+
+class _Echo(BaseTool):
+    name = "echo"
+    description = "Returns its input."
+    input_schema: dict[str, Any] = {
+        "type": "object",
+        "properties": {"value": {"type": "integer"}},
+        "required": ["value"],
+    }
+
+    def execute(self, **kwargs: Any) -> ToolResult:
+        return ToolResult(success=True, output=kwargs["value"])
+
+
+def _measure(build: Callable[[int], Any], count: int) -> tuple[float, float, float, int]:
+    """(bytes, blocks, seconds) per item built and kept, and gen-0 collections."""
+    gc.collect()
+    collections = gc.get_stats()[0]["collections"]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    started = time.perf_counter()
+    kept = [build(i) for i in range(count)]
+    elapsed = time.perf_counter() - started
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    collected = gc.get_stats()[0]["collections"] - collections
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del kept
+    return size / count, blocks / count, elapsed / count, collected
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    registry = ToolRegistry()
+    registry.register(_Echo())
+    executor = ToolExecutor(registry)
+
+    def through_executor(i: int) -> Any:
+        events: list[Any] = []
+        return executor.execute("echo", event_callback=events.append, value=i), events
+
+    rows = [
+        ("dataclass + dicts", _legacy, _EXECUTIONS),
+        ("slotted records", _slotted, _EXECUTIONS),
+        ("ToolExecutor", through_executor, _EXECUTIONS // 5),
+    ]
+    print(f"{'records':>18}  {'bytes/exec':>10}  {'blocks/exec':>11}  {'build':>9}  {'gen-0 GCs':>9}")
+    for label, build, count in rows:
+        size, blocks, seconds, collected = _measure(build, count)
+        print(f"{label:>18}  {size:10.0f}  {blocks:11.1f}  {seconds * 1e6:7.2f}µs  {collected:9d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+benchmarks/bench_registry.py
+
+Lookup throughput of ToolRegistry under 32 reader threads, with and
+without a writer hot-registering tools as fast as it can, against a
+baseline registry that guards a plain dict with a lock (the usual way to
+make the old mutable registry thread-safe).
+
+Readers alternate `get_or_none` on a random known tool with an occasional
+`list_names()`; a lookup that misses a tool that was registered before
+the run started counts as an error (it must never happen).
+
+    python -m benchmarks.bench_registry
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from typing import Any
+
+from core.tools.base import BaseTool, ToolResult
+from core.tools.registry import ToolRegistry
+
+_READERS = 32
+_TOOLS = 1_000
+_DURATION = 1.0                 # seconds per scenario
+_LIST_EVERY = 64                # one list_names() per this many lookups
+
+
+class _Tool(BaseTool):
+    description = "Synthetic tool."
+    input_schema: dict[str, Any] = {"type": "object", "properties": {}}
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def execute(self, **kwargs: Any) -> ToolResult:
+        return ToolResult(success=True, output=None)
+
+
+class _LockedRegistry:
+    """Baseline: one dict, one lock, names sorted on every listing."""
+
+    def __init__(self) -> None:
+        self._tools: dict[str, BaseTool] = {}
+        self._lock = threading.Lock()
+
+    def register(self, tool: BaseTool) -> None:
+        with self._lock:
+            self._tools[tool.name] = tool
+
+    force_register = register
+
+    def get_or_none(self, name: str) -> BaseTool | None:
+        with self._lock:
+            return self._tools.get(name)
+
+    def list_names(self) -> list[str]:
+        with self._lock:
+            return sorted(self._tools)
+
+
+def _run(registry: Any, names: list[str], hot: bool) -> tuple[float, int, int]:
+    """Returns (lookups per second, errors, registrations)."""
+    stop = threading.Event()
+    start = threading.Barrier(_READERS + 2)
+    counts = [0] * _READERS
+    errors = [0] * _READERS
+    written = [0]
+
+    def reader(slot: int) -> None:
+        rng = random.Random(slot)
+        done = missing = 0
+        start.wait()
+        while not stop.is_set():
+            for _ in range(_LIST_EVERY):
+                if registry.get_or_none(rng.choice(names)) is None:
+                    missing += 1
+            registry.list_names()
+            done += _LIST_EVERY
+        counts[slot], errors[slot] = done, missing
+
+    def writer() -> None:
+        i = 0
+        start.wait()
+        while not stop.is_set():
+            # Alternate new names with replacements of existing ones.
+            registry.force_register(_Tool(f"hot_{i}" if i % 2 else names[i % len(names)]))
+            i += 1
+        written[0] = i
+
+    threads = [threading.Thread(target=reader, args=(slot,)) for slot in range(_READERS)]
+    threads.append(threading.Thread(target=writer if hot else start.wait))
+    for thread in threads:
+        thread.start()
+    start.wait()
+    began = time.perf_counter()
+    time.sleep(_DURATION)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - began
+    return sum(counts) / elapsed, sum(errors), written[0]
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    names = [f"tool_{i}" for i in range(_TOOLS)]
+
+    print(f"{_READERS} readers, {_TOOLS} tools, {_DURATION:.0f}s per row\n")
+    print(f"{'registry':>15}  {'writes':>7}  {'lookups/s':>12}  {'errors':>6}  {'registered':>10}")
+    for label, factory in (("locked dict", _LockedRegistry), ("copy-on-write", ToolRegistry)):
+        for hot in (False, True):
+            registry = factory()
+            for name in names:
+                registry.register(_Tool(name))
+            rate, errors, written = _run(registry, names, hot)
+            print(f"{label:>15}  {'hot' if hot else 'none':>7}  {rate:12,.0f}  "
+                  f"{errors:6d}  {written:10d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+benchmarks/bench_resolver.py
+
+Cost of resolving tool names against 10,000 registered tools: building
+the NameIndex, then per-lookup latency for exact names, alias-style
+variants ("FileCreation", "creation_file"), typos that need the trigram
+index, and names that match nothing. A linear scan with
+`difflib.get_close_matches` is shown for comparison.
+
+    python -m benchmarks.bench_resolver
+"""
+
+from __future__ import annotations
+
+import difflib
+import itertools
+import logging
+import random
+import time
+from typing import Callable
+
+from core.tools.plugins import ToolSpec
+from core.tools.registry import ToolRegistry
+
+_TOOLS = 10_000
+_QUERIES = 500
+
+_VERBS = ["create", "read", "update", "delete", "list", "search", "fetch", "send",
+          "parse", "render", "export", "import", "sync", "archive", "convert"]
+_NOUNS = ["file", "user", "issue", "invoice", "report", "message", "event", "image",
+          "ticket", "order", "project", "table", "record", "chart", "comment",
+          "repository", "calendar", "contact", "document", "payment"]
+_SCOPES = ["", "github", "slack", "jira", "drive", "s3", "sql", "mail", "crm",
+           "billing", "docs", "notion", "zendesk", "stripe", "figma", "linear",
+           "sheets", "gitlab", "teams", "dropbox", "box", "asana", "trello",
+           "hubspot", "okta", "pagerduty", "datadog", "sentry", "airtable",
+           "salesforce", "intercom", "shopify", "twilio", "segment", "mixpanel",
+           "amplitude", "looker", "snowflake", "bigquery", "redshift"]
+
+
+def _names() -> list[str]:
+    names = [
+        "_".join(part for part in (scope, verb, noun) if part)
+        for scope, verb, noun in itertools.product(_SCOPES, _VERBS, _NOUNS)
+    ]
+    return names[:_TOOLS]
+
+
+def _typo(name: str, rng: random.Random) -> str:
+    i = rng.randrange(1, len(name) - 1)
+    return name[:i] + name[i + 1:] if rng.random() < 0.5 else name[:i] + name[i] + name[i:]
+
+
+def _variant(name: str) -> str:
+    words = name.split("_")
+    return "".join(word.capitalize() for word in reversed(words))
+
+
+def _per_lookup(fn: Callable[[str], object], queries: list[str]) -> float:
+    started = time.perf_counter()
+    for query in queries:
+        fn(query)
+    return (time.perf_counter() - started) / len(queries)
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(7)
+    names = _names()
+    registry = ToolRegistry()
+    registry.register_lazy_many([ToolSpec(name, f"plugins:{name}") for name in names])
+
+    started = time.perf_counter()
+    index = registry.snapshot().index()
+    built = time.perf_counter() - started
+
+    picks = rng.sample(names, _QUERIES)
+    workloads = {
+        "exact": picks,
+        "alias": [_variant(name) for name in picks],
+        "typo": [_typo(name, rng) for name in picks],
+        "unknown": [f"quantum_{rng.randrange(10**6)}_flux" for _ in picks],
+    }
+
+    print(f"{len(names):,} tools, index of {len(index):,} spellings built in {built * 1e3:.0f}ms\n")
+    print(f"{'query':>8}  {'resolve':>10}  {'resolved':>8}  {'difflib scan':>12}")
+    for label, queries in workloads.items():
+        resolved = sum(registry.resolve(query) is not None for query in queries)
+        cost = _per_lookup(registry.resolve, queries)
+        scan = _per_lookup(
+            lambda query: difflib.get_close_matches(query, names, n=1, cutoff=0.7),
+            queries[:20],
+        )
+        print(f"{label:>8}  {cost * 1e6:8.1f}µs  {resolved:4d}/{len(queries):<3d}  {scan * 1e3:10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
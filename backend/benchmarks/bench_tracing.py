@@ -0,0 +1,80 @@
+"""
+benchmarks/bench_tracing.py
+
+Overhead of tracing on `ToolExecutor.execute`, for a trivial in-memory
+tool (worst case: the tool itself costs almost nothing) and for
+FileCreationTool writing a small file:
+
+- off       : no trace in progress (spans are no-ops).
+- sampled 0 : every call starts a trace that is not sampled.
+- sampled 1%, 100% : traces recorded into a ring buffer.
+
+    python -m benchmarks.bench_tracing
+"""
+
+from __future__ import annotations
+
+import logging
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any
+
+from core.tools import FileCreationTool
+from core.tools.base import BaseTool, ToolResult
+from core.tools.registry import ToolRegistry
+from core.tracing import RingBufferExporter, Tracer
+from execution.executor import ToolExecutor
+
+_ITERATIONS = 5_000
+
+
+class _EchoTool(BaseTool):
+    name = "echo"
+    description = "Returns its input."
+    input_schema: dict[str, Any] = {
+        "type": "object",
+        "required": ["value"],
+        "properties": {"value": {"type": "string"}},
+    }
+
+    def execute(self, **kwargs: Any) -> ToolResult:
+        return ToolResult(success=True, output=kwargs["value"])
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    registry = ToolRegistry()
+    registry.register(_EchoTool())
+    registry.register(FileCreationTool())
+    target = Path(tempfile.mkdtemp()) / "bench.txt"
+
+    calls = {
+        "echo": lambda executor: executor.execute("echo", value="x"),
+        "file_creation": lambda executor: executor.execute(
+            "file_creation", filename=str(target), content="x", overwrite=True
+        ),
+    }
+    configs = {
+        "off": None,
+        "sampled 0": 0.0,
+        "sampled 1%": 0.01,
+        "sampled 100%": 1.0,
+    }
+
+    print(f"{'tool':>14}  {'tracing':>13}  {'per call':>10}  {'overhead':>9}")
+    for tool, call in calls.items():
+        baseline = None
+        for label, rate in configs.items():
+            tracer = None if rate is None else Tracer([RingBufferExporter()], sample_rate=rate)
+            executor = ToolExecutor(registry, tracer=tracer)
+            call(executor)
+            seconds = min(timeit.repeat(lambda: call(executor), number=_ITERATIONS, repeat=3))
+            per_call = seconds / _ITERATIONS
+            baseline = baseline or per_call
+            print(f"{tool:>14}  {label:>13}  {per_call * 1e6:8.2f}µs  "
+                  f"{(per_call / baseline - 1) * 100:8.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+benchmarks/bench_validation.py
+
+Compares the cost of validating tool inputs with the original per-call
+required-list scan against the validator compiled at registration time,
+for schemas with a growing number of properties.
+
+    python -m benchmarks.bench_validation
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any
+
+from core.tools.schema import compile_schema
+
+_ITERATIONS = 20_000
+
+
+def _make_schema(n_props: int) -> dict[str, Any]:
+    """Build a synthetic schema mixing strings, integers, enums and booleans."""
+    properties: dict[str, Any] = {}
+    for i in range(n_props):
+        kind = i % 4
+        if kind == 0:
+            properties[f"p{i}"] = {"type": "string", "maxLength": 256}
+        elif kind == 1:
+            properties[f"p{i}"] = {"type": "integer"}
+        elif kind == 2:
+            properties[f"p{i}"] = {"type": "string", "enum": ["a", "b", "c"]}
+        else:
+            properties[f"p{i}"] = {"type": "boolean", "default": False}
+    required = [name for i, name in enumerate(properties) if i % 2 == 0]
+    return {"type": "object", "required": required, "properties": properties}
+
+
+def _make_kwargs(n_props: int) -> dict[str, Any]:
+    values = ("text", 7, "b", True)
+    return {f"p{i}": values[i % 4] for i in range(n_props)}
+
+
+def _legacy_missing(input_schema: dict[str, Any], kwargs: dict[str, Any]) -> list[str]:
+    """The pre-compilation `BaseTool.validate_inputs` body, kept for comparison."""
+    required = [
+        key
+        for key, spec in input_schema.get("properties", {}).items()
+        if key in input_schema.get("required", [])
+    ]
+    return [field for field in required if field not in kwargs]
+
+
+def main() -> None:
+    print(f"{'props':>6}  {'legacy presence':>16}  {'compiled presence':>18}  {'compiled full':>14}")
+    for n_props in (5, 20, 50, 100, 200):
+        schema = _make_schema(n_props)
+        kwargs = _make_kwargs(n_props)
+        compiled = compile_schema(schema)
+        assert compiled.validate(kwargs) == []
+
+        legacy = timeit.timeit(lambda: _legacy_missing(schema, kwargs), number=_ITERATIONS)
+        presence = timeit.timeit(lambda: compiled.missing(kwargs), number=_ITERATIONS)
+        full = timeit.timeit(lambda: compiled.validate(kwargs), number=_ITERATIONS)
+
+        per_call = lambda total: f"{total / _ITERATIONS * 1e6:9.2f} µs"  # noqa: E731
+        print(f"{n_props:>6}  {per_call(legacy):>16}  {per_call(presence):>18}  {per_call(full):>14}")
+
+
+if __name__ == "__main__":
+    main()
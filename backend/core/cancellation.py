@@ -0,0 +1,209 @@
+"""
+core/cancellation.py
+
+Cooperative cancellation and run-level deadlines.
+
+A CancellationToken is created per run (Agent.run makes one) and installed
+in a context variable, from where ToolExecutor and tool code pick it up
+with `current_token()`. Nothing is pre-empted: the executor checks the
+token between stages and between streamed chunks, and long-running tools
+are expected to call `check_cancelled()` (or `token.wait(...)` instead of
+`time.sleep`) at convenient points.
+
+A token ends in one of two ways:
+    cancelled          `cancel()` was called (e.g. Ctrl-C in the REPL).
+    deadline_exceeded  its deadline passed.
+
+Child tokens (`token.child(timeout)`) get a deadline no later than their
+parent's and are cancelled with it, so a budget can be split between
+stages of a run.
+
+Usage
+-----
+token = CancellationToken.with_timeout(30)
+with cancellation_scope(token):
+    result = executor.execute("file_creation", ...)
+
+# inside a tool
+for row in rows:
+    check_cancelled()            # raises Cancelled / DeadlineExceeded
+    ...
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator
+
+CANCELLED = "cancelled"
+DEADLINE_EXCEEDED = "deadline_exceeded"
+
+
+class Cancelled(Exception):
+    """Raised by `check()` once the token has been cancelled."""
+
+    status = CANCELLED
+
+
+class DeadlineExceeded(Cancelled):
+    """Raised by `check()` once the token's deadline has passed."""
+
+    status = DEADLINE_EXCEEDED
+
+
+class CancellationToken:
+    """
+    Cancellation flag plus an optional deadline. Thread-safe.
+
+    Parameters
+    ----------
+    deadline : float | None -- absolute `time.monotonic()` deadline.
+    """
+
+    def __init__(self, deadline: float | None = None) -> None:
+        self.deadline = deadline
+        self._event = threading.Event()
+        self._reason: str | None = None
+        self._callbacks: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def with_timeout(cls, seconds: float | None) -> "CancellationToken":
+        """A token whose deadline is `seconds` from now (None = no deadline)."""
+        return cls(None if seconds is None else time.monotonic() + seconds)
+
+    # ------------------------------------------------------------------ #
+    #  State                                                               #
+    # ------------------------------------------------------------------ #
+
+    def cancel(self, reason: str = "Cancelled.") -> None:
+        """Cancel the token (idempotent) and run the on_cancel callbacks."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    @property
+    def status(self) -> str | None:
+        """None while live, else CANCELLED or DEADLINE_EXCEEDED."""
+        if self._event.is_set():
+            return CANCELLED
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return DEADLINE_EXCEEDED
+        return None
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancelled or past the deadline."""
+        return self.status is not None
+
+    @property
+    def reason(self) -> str | None:
+        status = self.status
+        if status == CANCELLED:
+            return self._reason
+        if status == DEADLINE_EXCEEDED:
+            return "Deadline exceeded."
+        return None
+
+    def remaining(self) -> float | None:
+        """Seconds until the deadline (never negative), or None if unbounded."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def check(self) -> None:
+        """
+        Raises:
+            Cancelled:        If the token was cancelled.
+            DeadlineExceeded: If the deadline has passed.
+        """
+        status = self.status
+        if status == CANCELLED:
+            raise Cancelled(self._reason)
+        if status == DEADLINE_EXCEEDED:
+            raise DeadlineExceeded("Deadline exceeded.")
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Sleep up to `timeout` seconds (capped at the deadline), waking early
+        on cancellation. Returns True if the token is cancelled or expired.
+        """
+        remaining = self.remaining()
+        if remaining is not None:
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        self._event.wait(timeout)
+        return self.cancelled
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        """Run `callback` on `cancel()` (immediately if already cancelled)."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def child(self, timeout: float | None = None) -> "CancellationToken":
+        """
+        A token cancelled together with this one, whose deadline is the
+        earlier of this token's and `timeout` seconds from now.
+        """
+        deadlines = [d for d in (
+            self.deadline,
+            None if timeout is None else time.monotonic() + timeout,
+        ) if d is not None]
+        child = CancellationToken(min(deadlines) if deadlines else None)
+        self.on_cancel(lambda: child.cancel(self._reason or "Cancelled."))
+        return child
+
+    def __repr__(self) -> str:
+        remaining = self.remaining()
+        budget = "∞" if remaining is None else f"{remaining:.2f}s"
+        return f"<CancellationToken status={self.status or 'live'} remaining={budget}>"
+
+
+class _NeverCancelled(CancellationToken):
+    """
+    The token of code running outside any scope. It is shared by the whole
+    process, so `cancel()` is a no-op: it must not cancel every later
+    unscoped execution.
+    """
+
+    def cancel(self, reason: str = "Cancelled.") -> None:
+        pass
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        pass                            # never fires; don't keep callbacks alive
+
+
+# A token that is never cancelled; returned when no scope is active.
+NEVER = _NeverCancelled()
+
+_current: ContextVar[CancellationToken] = ContextVar("gladden_cancellation", default=NEVER)
+
+
+def current_token() -> CancellationToken:
+    """The token of the run executing in this context."""
+    return _current.get()
+
+
+def check_cancelled() -> None:
+    """Shorthand for `current_token().check()`."""
+    _current.get().check()
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken) -> Iterator[CancellationToken]:
+    """Make `token` current for the enclosed block (and work it spawns)."""
+    reset = _current.set(token)
+    try:
+        yield token
+    finally:
+        _current.reset(reset)
@@ -1,10 +1,22 @@
 from core.tools.base import BaseTool, ToolResult
+from core.tools.output import OutputHandle
+from core.tools.progress import ProgressReporter, progress
+from core.tools.resources import ConnectionPool, ResourceContext
+from core.tools.schema import CompiledSchema, SchemaError, compile_schema
 from core.tools.registry import ToolRegistry, registry
 from core.tools.file_creation_tool import FileCreationTool
 
 __all__ = [
     "BaseTool",
     "ToolResult",
+    "OutputHandle",
+    "ProgressReporter",
+    "progress",
+    "ResourceContext",
+    "ConnectionPool",
+    "CompiledSchema",
+    "SchemaError",
+    "compile_schema",
     "ToolRegistry",
     "registry",
     "FileCreationTool",
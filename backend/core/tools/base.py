@@ -7,30 +7,103 @@ This enforces a consistent contract across all tool implementations.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any, Generator
+
+from core.tools.output import OutputHandle, preview
+from core.tools.prompt import render_tool
+from core.tools.schema import CompiledSchema, compile_schema
+
+if TYPE_CHECKING:
+    from core.tools.resources import ResourceContext
 
 
-@dataclass
 class ToolResult:
     """
     Standardized result returned by every tool execution.
 
     Attributes:
         success:  Whether the tool executed without error.
-        output:   The primary return value (string, path, data, etc.).
+        output:   The primary return value (string, path, data, etc.). Large
+                  outputs are replaced by an OutputHandle to a spill file
+                  (see core/tools/output.py).
         error:    Human-readable error message if success is False.
         metadata: Optional dict for extra context (e.g. file size, duration).
+
+    Slotted, and `metadata` is only allocated when first read or written:
+    at high call rates most results never need one.
     """
 
-    success: bool
-    output: Any = None
-    error: str | None = None
-    metadata: dict[str, Any] = field(default_factory=dict)
+    __slots__ = ("success", "output", "error", "_metadata")
+    __hash__ = None     # mutable, compared by value
+
+    def __init__(
+        self,
+        success: bool,
+        output: Any = None,
+        error: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        self.success = success
+        self.output = output
+        self.error = error
+        self._metadata = metadata
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        metadata = self._metadata
+        if metadata is None:
+            metadata = self._metadata = {}
+        return metadata
+
+    @metadata.setter
+    def metadata(self, value: dict[str, Any]) -> None:
+        self._metadata = value
+
+    @property
+    def has_metadata(self) -> bool:
+        """Whether any metadata was recorded (without allocating the dict)."""
+        return bool(self._metadata)
+
+    @property
+    def handle(self) -> OutputHandle | None:
+        """The spill-file handle when the output was spilled, else None."""
+        return self.output if isinstance(self.output, OutputHandle) else None
+
+    def copy(self) -> "ToolResult":
+        """A shallow copy with its own metadata dict."""
+        metadata = self._metadata
+        return ToolResult(
+            self.success, self.output, self.error, dict(metadata) if metadata else None
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ToolResult):
+            return NotImplemented
+        return (
+            self.success == other.success
+            and self.output == other.output
+            and self.error == other.error
+            and (self._metadata or {}) == (other._metadata or {})
+        )
+
+    # Same state as the former dataclass, so older pickles (disk cache) load.
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "success": self.success,
+            "output": self.output,
+            "error": self.error,
+            "metadata": self._metadata,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.success = state["success"]
+        self.output = state.get("output")
+        self.error = state.get("error")
+        self._metadata = state.get("metadata") or None
 
     def __repr__(self) -> str:
         if self.success:
-            return f"ToolResult(success=True, output={self.output!r})"
+            return f"ToolResult(success=True, output={preview(self.output)})"
         return f"ToolResult(success=False, error={self.error!r})"
 
 
@@ -43,7 +116,11 @@ class BaseTool(ABC):
       - description : plain-English explanation used by the LLM to choose tools.
       - input_schema: JSON-Schema-style dict describing accepted parameters.
 
+    `aliases` optionally lists other names the LLM may use for the tool
+    (see core/tools/resolver.py).
+
     The only method a subclass must implement is `execute(**kwargs)`.
+    Tools holding expensive resources override `setup` / `teardown`.
     """
 
     # ------------------------------------------------------------------ #
@@ -52,6 +129,13 @@ class BaseTool(ABC):
     name: str = ""
     description: str = ""
     input_schema: dict[str, Any] = {}
+    aliases: tuple[str, ...] = ()
+
+    # ------------------------------------------------------------------ #
+    #  Optional result caching (see execution/cache.py)                    #
+    # ------------------------------------------------------------------ #
+    cacheable: bool = False     # True only for side-effect-free tools
+    version: str = "1"          # bump to invalidate previously cached results
 
     # ------------------------------------------------------------------ #
     #  Concrete interface                                                  #
@@ -70,6 +154,76 @@ class BaseTool(ABC):
         """
         ...
 
+    def execute_batch(self, calls: list[dict[str, Any]]) -> list[ToolResult]:
+        """
+        Execute several calls in one invocation.
+
+        Used by `ToolExecutor.execute_many`. The default simply runs
+        `execute` per call; override it when a tool can amortise work
+        across calls (shared setup, fewer syscalls, ...).
+
+        Args:
+            calls: One kwargs dict per call, already coerced and validated.
+
+        Returns:
+            One ToolResult per call, in the same order as `calls`.
+        """
+        return [self.execute(**kwargs) for kwargs in calls]
+
+    def execute_stream(
+        self, **kwargs: Any
+    ) -> Generator[str | bytes, None, ToolResult | None]:
+        """
+        Optional streaming counterpart of `execute`.
+
+        Override it as a generator that yields output chunks (str or bytes)
+        as they are produced. When a tool overrides it, ToolExecutor uses it
+        instead of `execute`: each chunk is forwarded as an `output_chunk`
+        event and the output is assembled (or spilled to disk when large)
+        by the executor, so the tool never holds the whole output.
+
+        The generator may `return` a ToolResult to report failure or add
+        metadata; its `output` is replaced by the assembled output. Returning
+        nothing means success.
+
+        Args:
+            **kwargs: Parameters defined in `input_schema`.
+
+        Raises:
+            NotImplementedError: If the tool does not stream.
+        """
+        raise NotImplementedError(f"Tool {self.name!r} does not stream its output.")
+
+    # ------------------------------------------------------------------ #
+    #  Lifecycle                                                           #
+    # ------------------------------------------------------------------ #
+
+    def setup(self, context: "ResourceContext") -> None:
+        """
+        Acquire resources and warm up, once, before the first execution.
+
+        Called by the registry when the tool is registered (a lazily
+        registered tool: when it is first loaded), so the first call
+        doesn't pay for connecting or loading. Shared connection pools,
+        thread pools and sessions come from `context` (see
+        core/tools/resources.py) and are closed by it.
+
+        Args:
+            context: The registry's ResourceContext.
+
+        Raises:
+            Exception: Anything raised here refuses the registration.
+        """
+
+    def teardown(self) -> None:
+        """
+        Release what `setup` acquired for this instance alone.
+
+        Called when the tool is unregistered or replaced — once executions
+        still using it have finished — and when the registry is closed.
+        Exceptions are logged and ignored.
+        """
+
     # ------------------------------------------------------------------ #
     #  Helpers                                                             #
     # ------------------------------------------------------------------ #
@@ -85,6 +239,23 @@ class BaseTool(ABC):
             "input_schema": self.input_schema,
         }
 
+    def prompt_fragment(self) -> str:
+        """How the tool is described in the agent's prompt (see core/tools/prompt.py)."""
+        return render_tool(self.get_metadata())
+
+    @property
+    def validator(self) -> CompiledSchema:
+        """
+        The compiled form of `input_schema`.
+
+        Built on first access (the registry touches it at registration time)
+        and cached on the instance afterwards.
+        """
+        validator = self.__dict__.get("_validator")
+        if validator is None:
+            validator = self._validator = compile_schema(self.input_schema)
+        return validator
+
     def validate_inputs(self, kwargs: dict[str, Any]) -> list[str]:
         """
         Basic validation: checks that all required fields from input_schema
@@ -92,12 +263,17 @@ class BaseTool(ABC):
 
         Returns a list of missing field names (empty list = valid).
         """
-        required = [
-            key
-            for key, spec in self.input_schema.get("properties", {}).items()
-            if key in self.input_schema.get("required", [])
-        ]
-        return [field for field in required if field not in kwargs]
+        return self.validator.missing(kwargs)
+
+    def cache_keys(self, **kwargs: Any) -> tuple[Any, ...]:
+        """
+        Extra invalidation keys mixed into the result-cache key for a call.
+
+        Override to tie cached results to external state, e.g. return
+        `file_fingerprint(kwargs["path"])` so an edited file misses the
+        cache. Only consulted when `cacheable` is True.
+        """
+        return ()
 
     def __repr__(self) -> str:
         return f"<Tool name={self.name!r}>"
\ No newline at end of file
@@ -35,6 +35,7 @@ class FileCreationTool(BaseTool):
     """
 
     name: str = "file_creation"
+    aliases: tuple[str, ...] = ("create_file", "write_file")
 
     description: str = (
         "Creates a new text file with the specified filename and content. "
@@ -78,44 +79,111 @@ class FileCreationTool(BaseTool):
         5. Write content and return a structured result.
         """
 
+        # --- 1–3. Validate, resolve and guard ---------------------------
+        target_path, failure = self._resolve_target(kwargs)
+        if failure is not None:
+            return failure
+
+        # --- 4. Create parent directories if necessary ------------------
+        try:
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            return ToolResult(
+                success=False,
+                error=f"Could not create parent directories: {exc}",
+            )
+
+        # --- 5. Write file ----------------------------------------------
+        return self._write(target_path, kwargs["content"])
+
+    def execute_batch(self, calls: list[dict[str, Any]]) -> list[ToolResult]:
+        """
+        Create many files in one pass.
+
+        Same steps as `execute`, but each distinct parent directory is
+        created (or found missing) once for the whole batch instead of once
+        per file. Calls run in order: a later call targeting a file an
+        earlier one created is refused unless it passes overwrite=True,
+        exactly as with sequential `execute` calls.
+        """
+        targets = [self._resolve_target(kwargs) for kwargs in calls]
+
+        # --- 4. One mkdir per distinct parent ---------------------------
+        parent_errors: dict[Path, str] = {}
+        for parent in {path.parent for path, failure in targets if failure is None}:
+            try:
+                parent.mkdir(parents=True, exist_ok=True)
+            except OSError as exc:
+                parent_errors[parent] = f"Could not create parent directories: {exc}"
+
+        # --- 5. Write files ---------------------------------------------
+        # The overwrite guard ran before anything was written; re-apply it
+        # to the files this batch has created since.
+        written: set[Path] = set()
+        results: list[ToolResult] = []
+        for kwargs, (target_path, failure) in zip(calls, targets):
+            if failure is not None:
+                results.append(failure)
+            elif target_path.parent in parent_errors:
+                results.append(ToolResult(
+                    success=False, error=parent_errors[target_path.parent],
+                ))
+            elif target_path in written and not kwargs.get("overwrite", False):
+                results.append(self._exists(target_path))
+            else:
+                result = self._write(target_path, kwargs["content"])
+                if result.success:
+                    written.add(target_path)
+                results.append(result)
+        return results
+
+    # ------------------------------------------------------------------ #
+    #  Steps                                                               #
+    # ------------------------------------------------------------------ #
+
+    def _resolve_target(self, kwargs: dict[str, Any]) -> tuple[Path, ToolResult | None]:
+        """
+        Steps 1–3: validate inputs, resolve the path and apply the
+        overwrite guard. Returns (path, None) or (path, failure result).
+        """
+
         # --- 1. Input validation ----------------------------------------
         missing = self.validate_inputs(kwargs)
         if missing:
-            return ToolResult(
+            return Path(), ToolResult(
                 success=False,
                 error=f"Missing required input(s): {', '.join(missing)}",
             )
 
         filename: str = kwargs["filename"]
-        content: str = kwargs["content"]
         overwrite: bool = kwargs.get("overwrite", False)
 
         if not filename.strip():
-            return ToolResult(success=False, error="'filename' must not be empty.")
+            return Path(), ToolResult(success=False, error="'filename' must not be empty.")
 
         # --- 2. Resolve path --------------------------------------------
         target_path = Path(filename).resolve()
 
         # --- 3. Overwrite guard -----------------------------------------
         if target_path.exists() and not overwrite:
-            return ToolResult(
-                success=False,
-                error=(
-                    f"File already exists: {target_path}. "
-                    "Pass overwrite=True to replace it."
-                ),
-            )
+            return target_path, self._exists(target_path)
 
-        # --- 4. Create parent directories if necessary ------------------
-        try:
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-        except OSError as exc:
-            return ToolResult(
-                success=False,
-                error=f"Could not create parent directories: {exc}",
-            )
+        return target_path, None
 
-        # --- 5. Write file ----------------------------------------------
+    @staticmethod
+    def _exists(target_path: Path) -> ToolResult:
+        """The overwrite guard's refusal."""
+        return ToolResult(
+            success=False,
+            error=(
+                f"File already exists: {target_path}. "
+                "Pass overwrite=True to replace it."
+            ),
+        )
+
+    @staticmethod
+    def _write(target_path: Path, content: str) -> ToolResult:
+        """Step 5: write the file and describe it in a ToolResult."""
         try:
             target_path.write_text(content, encoding="utf-8")
         except OSError as exc:
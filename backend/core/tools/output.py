@@ -0,0 +1,172 @@
+"""
+core/tools/output.py
+
+Large tool outputs kept on disk instead of in memory.
+
+When an executor is given a spill threshold (it has none by default) and
+an output is bigger, the output is written to a spill file and the
+ToolResult's `output` becomes an OutputHandle that refers to it. Logs and events only ever see `preview(...)` — a bounded
+excerpt plus the reference — so a multi-megabyte output is never copied
+into them.
+
+Readers get the bytes without copying through `handle.memoryview()`,
+which memory-maps the file read-only. The spill file belongs to the
+caller: it is kept until `handle.delete()` is called.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import reprlib
+import tempfile
+from pathlib import Path
+from typing import Any
+
+# Characters of an output copied into logs and event messages.
+PREVIEW_CHARS = 512
+
+# Bounded repr for structured outputs (dicts, lists, ...).
+_repr = reprlib.Repr()
+_repr.maxstring = _repr.maxother = PREVIEW_CHARS
+_repr.maxdict = _repr.maxlist = _repr.maxtuple = 20
+
+
+class OutputHandle:
+    """
+    Reference to a tool output stored in a spill file.
+
+    Attributes:
+        path:     Location of the spill file.
+        size:     Size of the output in bytes.
+        encoding: Text encoding of the output, or None for binary output.
+    """
+
+    __slots__ = ("path", "size", "encoding", "_map", "_preview")
+
+    def __init__(
+        self,
+        path: str | Path,
+        size: int | None = None,
+        encoding: str | None = "utf-8",
+    ) -> None:
+        self.path = Path(path)
+        self.size = self.path.stat().st_size if size is None else size
+        self.encoding = encoding
+        self._map: mmap.mmap | None = None
+        self._preview: str | None = None
+
+    # ------------------------------------------------------------------ #
+    #  Access                                                              #
+    # ------------------------------------------------------------------ #
+
+    def memoryview(self) -> memoryview:
+        """Zero-copy, read-only view of the output (memory-mapped)."""
+        if self.size == 0:
+            return memoryview(b"")
+        if self._map is None:
+            with open(self.path, "rb") as fh:
+                self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(self._map)
+
+    def read_bytes(self) -> bytes:
+        return self.path.read_bytes()
+
+    def read_text(self) -> str:
+        """
+        Raises:
+            ValueError: If the output is binary.
+        """
+        if self.encoding is None:
+            raise ValueError(f"Output at {self.path} is binary; use read_bytes().")
+        return self.path.read_text(encoding=self.encoding)
+
+    def open(self, mode: str = "rb"):
+        if "b" not in mode:
+            return open(self.path, mode, encoding=self.encoding)
+        return open(self.path, mode)
+
+    @property
+    def preview(self) -> str:
+        """The first PREVIEW_CHARS characters of the output."""
+        if self._preview is None:
+            with open(self.path, "rb") as fh:
+                head = fh.read(PREVIEW_CHARS * 4)
+            text = head.decode(self.encoding or "utf-8", errors="replace")
+            self._preview = text[:PREVIEW_CHARS]
+        return self._preview
+
+    # ------------------------------------------------------------------ #
+    #  Lifetime                                                            #
+    # ------------------------------------------------------------------ #
+
+    def close(self) -> None:
+        """Release the memory map (views obtained earlier must be released first)."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def delete(self) -> None:
+        """Close the handle and remove the spill file."""
+        self.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __fspath__(self) -> str:
+        return str(self.path)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"path": str(self.path), "size": self.size, "encoding": self.encoding}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.path = Path(state["path"])
+        self.size = state["size"]
+        self.encoding = state["encoding"]
+        self._map = None
+        self._preview = None
+
+    def __str__(self) -> str:
+        return preview(self)
+
+    def __repr__(self) -> str:
+        return f"<OutputHandle path={str(self.path)!r} size={self.size}>"
+
+
+def output_size(value: Any) -> int | None:
+    """Size in bytes of a str/bytes output, or None for other types."""
+    if isinstance(value, str):
+        return len(value) if value.isascii() else len(value.encode("utf-8"))
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return memoryview(value).nbytes
+    return None
+
+
+def spill(value: str | bytes, directory: str | Path | None = None) -> OutputHandle:
+    """Write a str/bytes output to a new spill file and return its handle."""
+    if directory is not None:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+    text = isinstance(value, str)
+    data = value.encode("utf-8") if text else value
+    with tempfile.NamedTemporaryFile(
+        mode="wb", prefix="gladden-", suffix=".out", dir=directory, delete=False
+    ) as fh:
+        fh.write(data)
+    return OutputHandle(fh.name, size=len(data), encoding="utf-8" if text else None)
+
+
+def preview(value: Any, limit: int = PREVIEW_CHARS) -> str:
+    """
+    A bounded rendering of an output for logs and events: at most `limit`
+    characters, with the total size and, for spilled output, its location.
+    """
+    if isinstance(value, OutputHandle):
+        head = value.preview[:limit]
+        return f"{head!r}… ({value.size} bytes, spilled to {value.path})"
+    if isinstance(value, (str, bytes, bytearray)):
+        if len(value) <= limit:
+            return repr(value)
+        return f"{value[:limit]!r}… ({output_size(value)} bytes)"
+    text = _repr.repr(value)
+    return text if len(text) <= limit else f"{text[:limit]}…"
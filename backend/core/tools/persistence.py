@@ -0,0 +1,422 @@
+"""
+core/tools/persistence.py
+
+Registry snapshot files: start up without importing or describing tools.
+
+`save` writes what the registry knows about every tool — name, import
+target, description, input_schema, aliases and rendered prompt fragment —
+plus the names and aliases the name-resolution index is built from and
+the prompt listing into one file. `load` memory-maps it and hands back StoredSpecs: lazy registrations
+whose records are decoded only when first needed, so startup reads a
+small table of contents and nothing else, however many tools there are.
+
+A snapshot is only used while it is provably current. It records every
+source it was built from with a SHA-256 of its contents: the module file
+of each tool, every .py file of the top-level package that module lives
+in (a tool's description or schema can come from any module it imports,
+e.g. a shared base class), core/tools/prompt.py (the fragment renderer),
+and any extra files the caller names (e.g. a tool manifest, or code the
+tools depend on outside their package). Directories can be listed too;
+for them the sorted entry names are hashed, so installing a package into
+site-packages invalidates the snapshot. On load a file or package whose
+sizes and mtimes are unchanged is trusted, otherwise it is re-hashed. A
+missing, stale or unreadable snapshot makes `load` return None and the
+caller registers tools the usual way (and saves a fresh snapshot).
+
+Compiled validators hold closures and cannot be stored; they are
+recompiled from the stored schema when a tool is first loaded.
+
+Layout
+------
+    MAGIC | u32 format | u32 header length | header (JSON) | records | index | listing
+
+The header holds the caller's key, the sources and the table of contents
+(name, target, source, record offset and length); records are JSON; the
+index is the JSON list of [name, aliases] the NameIndex is rebuilt from
+(nothing in the file is unpickled, so a planted snapshot cannot run
+code), followed by the rendered prompt listing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from importlib import util as importlib_util
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+from core.tools import prompt as _prompt
+from core.tools.plugins import ToolSpec
+from core.tools.resolver import NameIndex
+
+if TYPE_CHECKING:
+    from core.tools.base import BaseTool
+    from core.tools.registry import RegistrySnapshot
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"GLADSNAP"
+FORMAT_VERSION = 2
+_PREFIX = struct.Struct("<8sII")
+
+
+class StoredSpec:
+    """
+    A tool registration read from a snapshot file.
+
+    Behaves like a ToolSpec; the record behind `description`,
+    `input_schema`, `aliases` and the prompt fragment is decoded from the
+    mapped file on first access.
+    """
+
+    __slots__ = ("name", "target", "source", "_store", "_offset", "_length", "_record")
+
+    def __init__(
+        self,
+        name: str,
+        target: str,
+        source: str,
+        store: "_Store",
+        offset: int,
+        length: int,
+    ) -> None:
+        self.name = name
+        self.target = target
+        self.source = source
+        self._store = store
+        self._offset = offset
+        self._length = length
+        self._record: dict[str, Any] | None = None
+
+    def _read(self) -> dict[str, Any]:
+        record = self._record
+        if record is None:
+            record = self._record = self._store.record(self._offset, self._length)
+        return record
+
+    @property
+    def description(self) -> str:
+        return self._read()["description"]
+
+    @property
+    def input_schema(self) -> dict[str, Any]:
+        return self._read()["input_schema"]
+
+    @property
+    def aliases(self) -> tuple[str, ...]:
+        return tuple(self._read()["aliases"])
+
+    def get_metadata(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "input_schema": self.input_schema,
+        }
+
+    def prompt_fragment(self) -> str:
+        return self._read()["prompt"]
+
+    def load(self) -> "BaseTool":
+        """Import and instantiate the tool (see `ToolSpec.load`)."""
+        return ToolSpec(
+            name=self.name,
+            target=self.target,
+            description=self.description,
+            input_schema=self.input_schema,
+            aliases=self.aliases,
+        ).load()
+
+    def __repr__(self) -> str:
+        return f"StoredSpec(name={self.name!r}, target={self.target!r})"
+
+
+class _Store:
+    """The mapped snapshot file, kept open while StoredSpecs reference it."""
+
+    __slots__ = ("path", "_map")
+
+    def __init__(self, path: Path, mapped: mmap.mmap) -> None:
+        self.path = path
+        self._map = mapped
+
+    def record(self, offset: int, length: int) -> Any:
+        return json.loads(self._map[offset:offset + length])
+
+    def text(self, offset: int, length: int) -> str:
+        return self._map[offset:offset + length].decode("utf-8")
+
+
+class StoredRegistry:
+    """
+    What `load` returns: the specs, plus the name index and prompt listing
+    that were built for exactly this set of tools.
+    """
+
+    def __init__(
+        self,
+        store: _Store,
+        specs: dict[str, StoredSpec],
+        index: tuple[int, int],
+        listing: tuple[int, int],
+    ) -> None:
+        self.path = store.path
+        self.specs = specs
+        self._store = store
+        self._index = index
+        self._listing = listing
+
+    def index(self) -> NameIndex:
+        return NameIndex(self._store.record(*self._index))
+
+    def prompt_listing(self) -> str:
+        return self._store.text(*self._listing)
+
+
+# --------------------------------------------------------------------------- #
+#  Sources                                                                     #
+# --------------------------------------------------------------------------- #
+
+def _hash_file(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _hash_listing(path: Path) -> str:
+    return hashlib.sha256("\n".join(sorted(os.listdir(path))).encode("utf-8")).hexdigest()
+
+
+def _tree_files(path: Path) -> list[Path]:
+    return sorted(
+        file for file in path.rglob("*.py") if "__pycache__" not in file.parts
+    )
+
+
+def _stamp_tree(path: Path) -> str:
+    """Cheap fingerprint of a package: its .py files' names, sizes and mtimes."""
+    digest = hashlib.sha256()
+    for file in _tree_files(path):
+        stat = file.stat()
+        line = f"{file.relative_to(path)}\0{stat.st_size}\0{stat.st_mtime_ns}\n"
+        digest.update(line.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _hash_tree(path: Path) -> str:
+    """SHA-256 over the names and contents of a package's .py files."""
+    digest = hashlib.sha256()
+    for file in _tree_files(path):
+        digest.update(f"{file.relative_to(path)}\0".encode("utf-8"))
+        digest.update(hashlib.sha256(file.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _describe_source(path: str, tree: bool = False) -> list[Any]:
+    """
+    [path, mtime_ns, size, sha256] — size is -1 for directory listings; for
+    a package `tree` it is -2 and mtime_ns is replaced by `_stamp_tree`.
+    """
+    resolved = Path(path).resolve()
+    if tree:
+        return [str(resolved), _stamp_tree(resolved), -2, _hash_tree(resolved)]
+    stat = resolved.stat()
+    if resolved.is_dir():
+        return [str(resolved), stat.st_mtime_ns, -1, _hash_listing(resolved)]
+    return [str(resolved), stat.st_mtime_ns, stat.st_size, _hash_file(resolved)]
+
+
+def _source_current(entry: list[Any]) -> bool:
+    path, mtime_ns, size, digest = entry
+    try:
+        if size == -2:
+            if _stamp_tree(Path(path)) == mtime_ns:
+                return True
+            return _hash_tree(Path(path)) == digest      # touched, maybe unchanged
+        stat = os.stat(path)
+        if size == -1:
+            return _hash_listing(Path(path)) == digest
+        if stat.st_size != size:
+            return False
+        if stat.st_mtime_ns == mtime_ns:
+            return True
+        return _hash_file(Path(path)) == digest          # touched, maybe unchanged
+    except OSError:
+        return False
+
+
+def _module_file(module_name: str) -> str:
+    module = sys.modules.get(module_name)
+    origin = getattr(module, "__file__", None)
+    if origin is None:
+        spec = importlib_util.find_spec(module_name)
+        origin = spec.origin if spec is not None else None
+    if not origin or not os.path.exists(origin):
+        raise ValueError(f"cannot locate the source of module {module_name!r}")
+    return origin
+
+
+def _package_dir(module_name: str) -> str | None:
+    """Directory of the top-level package `module_name` belongs to, if any."""
+    top = module_name.partition(".")[0]
+    module = sys.modules.get(top)
+    locations = getattr(module, "__path__", None)
+    if locations is None:
+        spec = importlib_util.find_spec(top)
+        locations = spec.submodule_search_locations if spec is not None else None
+    locations = list(locations or ())
+    return locations[0] if len(locations) == 1 else None     # not a namespace package
+
+
+def _target_of(tool: "BaseTool") -> str:
+    cls = type(tool)
+    if cls.__module__ == "__main__" or "." in cls.__qualname__:
+        raise ValueError(
+            f"tool {tool.name!r} ({cls.__module__}.{cls.__qualname__}) is not importable "
+            "by name; only module-level tool classes can be stored"
+        )
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+# --------------------------------------------------------------------------- #
+#  Save / load                                                                 #
+# --------------------------------------------------------------------------- #
+
+def save(
+    snapshot: "RegistrySnapshot",
+    path: str | Path,
+    *,
+    key: str = "",
+    extra_sources: Iterable[str | Path] = (),
+) -> Path:
+    """
+    Write `snapshot` to `path` (atomically: readers never see a partial file).
+
+    Every tool must be re-creatable from its class alone, like a lazily
+    registered tool: a module-level class instantiable without arguments.
+
+    Raises:
+        ValueError: If a tool's class or source cannot be located.
+        OSError:    If the file cannot be written.
+    """
+    path = Path(path)
+    entries: list[tuple[str, str, str, dict[str, Any]]] = []
+    for name, tool in snapshot.tools.items():
+        target = _target_of(tool)
+        entries.append((name, target, _module_file(type(tool).__module__), {
+            **tool.get_metadata(),
+            "aliases": list(tool.aliases),
+            "prompt": tool.prompt_fragment(),
+        }))
+    for name, spec in snapshot.lazy.items():
+        source = getattr(spec, "source", None) or _module_file(spec.target.partition(":")[0])
+        entries.append((name, spec.target, source, {
+            **spec.get_metadata(),
+            "aliases": list(spec.aliases),
+            "prompt": spec.prompt_fragment(),
+        }))
+
+    sources: dict[str | tuple[str, str], list[Any]] = {}
+    for source in [_prompt.__file__, *(entry[2] for entry in entries), *map(str, extra_sources)]:
+        described = _describe_source(source)
+        sources.setdefault(described[0], described)
+    source_ids = {source: i for i, source in enumerate(sources)}
+    packages = {_package_dir(target.partition(":")[0]) for _, target, _, _ in entries}
+    for package in sorted(filter(None, packages)):
+        described = _describe_source(package, tree=True)
+        sources.setdefault(("tree", described[0]), described)
+
+    body = bytearray()
+    toc: list[list[Any]] = []
+    for name, target, source, record in entries:
+        data = json.dumps(record, separators=(",", ":")).encode("utf-8")
+        toc.append([name, target, source_ids[str(Path(source).resolve())], len(body), len(data)])
+        body += data
+    index_at = len(body)
+    body += json.dumps(
+        [[name, record["aliases"]] for name, _, _, record in entries], separators=(",", ":")
+    ).encode("utf-8")
+    listing_at = len(body)
+    body += snapshot.prompt_listing().encode("utf-8")
+
+    header = json.dumps({
+        "key": key,
+        "sources": list(sources.values()),
+        "tools": toc,
+        "index": [index_at, listing_at - index_at],
+        "listing": [listing_at, len(body) - listing_at],
+        "size": len(body),
+    }, separators=(",", ":")).encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header)))
+            handle.write(header)
+            handle.write(body)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    logger.info("Saved registry snapshot of %d tool(s) to %s", len(entries), path)
+    return path
+
+
+def load(path: str | Path, *, key: str = "") -> StoredRegistry | None:
+    """
+    Map the snapshot at `path` and check it is current.
+
+    Returns:
+        The stored registry, or None when the file is missing, unreadable,
+        written for another `key`, or any of its sources changed.
+    """
+    path = Path(path)
+    try:
+        with open(path, "rb") as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as exc:        # ValueError: empty file
+        logger.info("No usable registry snapshot at %s (%s)", path, exc)
+        return None
+
+    try:
+        magic, version, header_len = _PREFIX.unpack_from(mapped, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("not a registry snapshot of this format")
+        start = _PREFIX.size
+        header = json.loads(mapped[start:start + header_len])
+        base = start + header_len
+        if len(mapped) != base + header["size"]:
+            raise ValueError("truncated")
+    except (struct.error, ValueError, KeyError) as exc:
+        mapped.close()
+        logger.warning("Ignoring registry snapshot %s: %s", path, exc)
+        return None
+
+    if header["key"] != key:
+        mapped.close()
+        logger.info("Registry snapshot %s was saved for another configuration", path)
+        return None
+    stale = [entry[0] for entry in header["sources"] if not _source_current(entry)]
+    if stale:
+        mapped.close()
+        logger.info("Registry snapshot %s is stale (%s changed)", path, stale[0])
+        return None
+
+    store = _Store(path, mapped)
+    sources = [entry[0] for entry in header["sources"]]
+    specs = {
+        name: StoredSpec(name, target, sources[source], store, base + offset, length)
+        for name, target, source, offset, length in header["tools"]
+    }
+    index_at, index_len = header["index"]
+    listing_at, listing_len = header["listing"]
+    return StoredRegistry(
+        store, specs, (base + index_at, index_len), (base + listing_at, listing_len)
+    )
@@ -0,0 +1,172 @@
+"""
+core/tools/plugins.py
+
+Lazy tool registrations.
+
+A ToolSpec carries everything the agent needs to *advertise* a tool —
+name, description, input_schema — plus an import target
+("package.module:ClassName"). ToolRegistry keeps specs registered with
+`register_lazy` and only imports and instantiates the tool the first time
+it is looked up, so startup cost no longer grows with the number of tools.
+
+Sources of specs
+----------------
+Manifest file (JSON):
+
+    {"tools": [
+        {"name": "file_creation",
+         "description": "...",
+         "input_schema": {...},
+         "target": "core.tools.file_creation_tool:FileCreationTool",
+         "aliases": ["create_file"]}
+    ]}
+
+("aliases" is optional.)
+
+Entry points, group "gladden.tools": each entry point is named after the
+tool and targets its class. Its metadata is read from a
+`gladden_tools.json` manifest shipped in the distribution's metadata
+directory, so discovering a plugin never imports it. Entry points without
+a manifest entry are returned with `metadata=None` and must be loaded to
+be described.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+from dataclasses import dataclass, field
+from importlib import metadata as importlib_metadata
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from core.tools.prompt import render_tool
+
+if TYPE_CHECKING:
+    from core.tools.base import BaseTool
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "gladden.tools"
+DISTRIBUTION_MANIFEST = "gladden_tools.json"
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """Metadata and import target of a not-yet-imported tool."""
+
+    name: str
+    target: str                                 # "package.module:ClassName"
+    description: str = ""
+    input_schema: dict[str, Any] = field(default_factory=dict)
+    aliases: tuple[str, ...] = ()
+
+    def get_metadata(self) -> dict[str, Any]:
+        """Same shape as `BaseTool.get_metadata`."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "input_schema": self.input_schema,
+        }
+
+    def prompt_fragment(self) -> str:
+        """Same as `BaseTool.prompt_fragment`."""
+        return render_tool(self.get_metadata())
+
+    def load(self) -> "BaseTool":
+        """
+        Import the target and instantiate the tool.
+
+        Raises:
+            ImportError: If the module or attribute cannot be imported.
+            ValueError:  If the instantiated tool's name doesn't match the spec.
+        """
+        module_name, _, attr = self.target.partition(":")
+        if not module_name or not attr:
+            raise ImportError(
+                f"Invalid target {self.target!r} for tool {self.name!r}; "
+                "expected 'package.module:ClassName'."
+            )
+        module = importlib.import_module(module_name)
+        try:
+            factory = getattr(module, attr)
+        except AttributeError as exc:
+            raise ImportError(f"{module_name!r} has no attribute {attr!r}") from exc
+
+        tool = factory()
+        if tool.name != self.name:
+            raise ValueError(
+                f"Target {self.target!r} produced tool {tool.name!r}, "
+                f"but it was registered as {self.name!r}."
+            )
+        if tool.input_schema != self.input_schema:
+            logger.warning(
+                "Tool %r: input_schema differs from its manifest entry; "
+                "the tool's own schema is used for validation.",
+                self.name,
+            )
+        return tool
+
+
+def _spec_from_entry(entry: dict[str, Any], origin: str) -> ToolSpec:
+    try:
+        return ToolSpec(
+            name=entry["name"],
+            target=entry["target"],
+            description=entry.get("description", ""),
+            input_schema=entry.get("input_schema", {}),
+            aliases=tuple(entry.get("aliases", ())),
+        )
+    except (KeyError, TypeError) as exc:
+        raise ValueError(f"Malformed tool entry in {origin}: {entry!r}") from exc
+
+
+def load_manifest(path: str | Path) -> list[ToolSpec]:
+    """
+    Read a JSON tool manifest.
+
+    Raises:
+        ValueError: If the file isn't a manifest or an entry lacks name/target.
+    """
+    path = Path(path)
+    data = json.loads(path.read_text(encoding="utf-8"))
+    entries = data.get("tools") if isinstance(data, dict) else None
+    if not isinstance(entries, list):
+        raise ValueError(f"{path} is not a tool manifest (expected a 'tools' list).")
+    return [_spec_from_entry(entry, str(path)) for entry in entries]
+
+
+def entry_point_specs(group: str = ENTRY_POINT_GROUP) -> list[tuple[ToolSpec, bool]]:
+    """
+    Specs for every entry point in `group`, each paired with whether its
+    metadata came from the distribution's manifest (False: name and target
+    only — the tool must be loaded to be described).
+    """
+    specs: list[tuple[ToolSpec, bool]] = []
+    manifests: dict[str, dict[str, dict[str, Any]]] = {}
+
+    for ep in importlib_metadata.entry_points(group=group):
+        dist = getattr(ep, "dist", None)
+        described: dict[str, dict[str, Any]] = {}
+        if dist is not None:
+            key = dist.metadata["Name"] or ""
+            if key not in manifests:
+                manifests[key] = {}
+                text = dist.read_text(DISTRIBUTION_MANIFEST)
+                if text:
+                    try:
+                        for entry in json.loads(text).get("tools", []):
+                            manifests[key][entry.get("name")] = entry
+                    except (ValueError, AttributeError) as exc:
+                        logger.warning("Ignoring malformed %s in %s: %s",
+                                       DISTRIBUTION_MANIFEST, key, exc)
+            described = manifests[key]
+
+        entry = described.get(ep.name)
+        if entry is not None:
+            spec = _spec_from_entry({**entry, "name": ep.name, "target": ep.value}, key)
+            specs.append((spec, True))
+        else:
+            specs.append((ToolSpec(name=ep.name, target=ep.value), False))
+    return specs
@@ -0,0 +1,183 @@
+"""
+core/tools/progress.py
+
+Progress reporting for long-running tools.
+
+While a tool runs, ToolExecutor installs a ProgressReporter in a context
+variable. Tool code fetches it with `progress()` and reports as often as
+it likes; the reporter coalesces updates and emits at most one
+`execution_progress` event per `min_interval`, always carrying the latest
+state. Reports between emissions cost a clock read and a few attribute
+stores, so progress reporting never dominates the tool's run time.
+
+Outside an execution (or when nobody listens for events) `progress()`
+returns a reporter that drops every report.
+
+Usage (inside BaseTool.execute)
+-------------------------------
+    from core.tools.progress import progress
+
+    reporter = progress()
+    reporter.start(total=len(rows), unit="items")
+    for row in rows:
+        ...
+        reporter.advance()
+
+Code running in other threads should capture `reporter` first and use it
+there; context variables do not follow work into thread pools.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable
+
+DEFAULT_MIN_INTERVAL = 0.25     # seconds between two progress events
+
+
+class ProgressReporter:
+    """
+    Collects progress reports for one execution and hands a coalesced
+    snapshot to `emit` at most once per `min_interval`.
+
+    `emit` receives a dict: done, total (or None), unit, percent (or
+    None) and message (or None).
+    """
+
+    __slots__ = (
+        "_emit", "_min_interval", "_next_at", "_lock",
+        "done", "total", "unit", "message", "_dirty",
+    )
+
+    def __init__(
+        self,
+        emit: Callable[[dict[str, Any]], None] | None,
+        *,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+    ) -> None:
+        self._emit = emit
+        self._min_interval = min_interval
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+        self.done: float = 0
+        self.total: float | None = None
+        self.unit = "items"
+        self.message: str | None = None
+        self._dirty = False
+
+    def start(
+        self,
+        total: float | None = None,
+        unit: str = "items",
+        message: str | None = None,
+    ) -> None:
+        """Declare the amount of work ahead ("items", "bytes", ...)."""
+        self.done = 0
+        self.total = total
+        self.unit = unit
+        self.message = message
+        self._report(force=True)
+
+    def advance(self, amount: float = 1, message: str | None = None) -> None:
+        """Record `amount` more units of work done."""
+        self.done += amount
+        if message is not None:
+            self.message = message
+        self._report()
+
+    def update(
+        self,
+        done: float | None = None,
+        *,
+        total: float | None = None,
+        percent: float | None = None,
+        message: str | None = None,
+    ) -> None:
+        """
+        Set the absolute progress: `done` units (of `total`), or a bare
+        `percent` when the tool has no natural unit.
+        """
+        if percent is not None:
+            self.total, self.unit, self.done = 100, "percent", percent
+        else:
+            if total is not None:
+                self.total = total
+            if done is not None:
+                self.done = done
+        if message is not None:
+            self.message = message
+        self._report()
+
+    def _report(self, force: bool = False) -> None:
+        if self._emit is None:
+            return
+        now = time.monotonic()
+        finished = self.total is not None and self.done >= self.total
+        if not (force or finished) and now < self._next_at:
+            self._dirty = True          # coalesced into the next emission
+            return
+        self._next_at = now + self._min_interval
+        self._dirty = False
+        self._send()
+
+    def flush(self) -> None:
+        """Emit the latest state if an update is still pending."""
+        if self._emit is not None and self._dirty:
+            self._dirty = False
+            self._send()
+
+    def snapshot(self) -> dict[str, Any]:
+        total = self.total
+        percent = (
+            round(min(100.0, 100.0 * self.done / total), 1) if total else None
+        )
+        return {
+            "done": self.done,
+            "total": total,
+            "unit": self.unit,
+            "percent": percent,
+            "message": self.message,
+        }
+
+    def _send(self) -> None:
+        with self._lock:
+            self._emit(self.snapshot())
+
+
+_NULL_REPORTER = ProgressReporter(None)
+
+_current: ContextVar[ProgressReporter] = ContextVar("gladden_progress", default=_NULL_REPORTER)
+
+
+def progress() -> ProgressReporter:
+    """The reporter of the execution running in this context."""
+    return _current.get()
+
+
+def use_reporter(reporter: ProgressReporter):
+    """Install `reporter` for the current context; returns the reset token."""
+    return _current.set(reporter)
+
+
+def reset_reporter(token) -> None:
+    _current.reset(token)
+
+
+def describe(snapshot: dict[str, Any]) -> str:
+    """Human-readable one-liner for a progress snapshot."""
+    done, total, unit = snapshot["done"], snapshot["total"], snapshot["unit"]
+    if unit == "percent":
+        text = f"{done:g}%"
+    elif total:
+        text = f"{snapshot['percent']:g}% ({_number(done)}/{_number(total)} {unit})"
+    else:
+        text = f"{_number(done)} {unit}"
+    if snapshot["message"]:
+        text += f" — {snapshot['message']}"
+    return text
+
+
+def _number(value: float) -> str:
+    return f"{value:,.0f}" if float(value).is_integer() else f"{value:,.2f}"
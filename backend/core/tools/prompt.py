@@ -0,0 +1,38 @@
+"""
+core/tools/prompt.py
+
+How tools are described to the LLM.
+
+Each tool renders to one prompt fragment; the agent numbers the fragments
+and joins them into the tool listing of its prompt. Fragments are cached
+per registry snapshot and stored in registry snapshot files
+(core/tools/persistence.py), so building a prompt doesn't re-render every
+tool's schema on each instruction.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def render_tool(metadata: dict[str, Any]) -> str:
+    """Prompt fragment for one tool, from its `get_metadata()` dict."""
+    lines = [
+        f"Tool name: {metadata['name']}",
+        f"   Description: {metadata['description']}",
+    ]
+    props = metadata["input_schema"].get("properties", {})
+    required = metadata["input_schema"].get("required", [])
+    if props:
+        lines.append("   Arguments:")
+        for arg_name, spec in props.items():
+            req_marker = " (required)" if arg_name in required else " (optional)"
+            arg_type = spec.get("type", "any")
+            arg_desc = spec.get("description", "")
+            lines.append(f"     - {arg_name} [{arg_type}]{req_marker}: {arg_desc}")
+    return "\n".join(lines)
+
+
+def render_listing(fragments: list[str]) -> str:
+    """Numbered tool listing built from per-tool fragments."""
+    return "\n\n".join(f"{i}. {fragment}" for i, fragment in enumerate(fragments, start=1))
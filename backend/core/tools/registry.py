@@ -8,13 +8,33 @@ looked up by name when the agent wants to execute them.
 Design goals:
   - Single source of truth for available tools.
   - Dynamic registration: tools can be added at any time.
+  - Lazy registration: a tool can be advertised from its ToolSpec (see
+    core/tools/plugins.py) and imported only on first lookup.
+  - Forgiving lookups: `resolve` maps misspelled or aliased names to the
+    registered tool.
+  - Safe under concurrency: readers use an immutable snapshot without
+    locking; writers publish a new one (copy-on-write).
+  - Tool lifecycle: `BaseTool.setup` runs when a tool is registered (or
+    lazily loaded) with the registry's ResourceContext; `teardown` runs
+    once it is unregistered or replaced and no execution still leases it.
   - Clean retrieval API consumed by the future Executor layer.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from core.tools import persistence
+from core.tools.persistence import StoredRegistry, StoredSpec
+from core.tools.plugins import ENTRY_POINT_GROUP, ToolSpec, entry_point_specs, load_manifest
+from core.tools.prompt import render_listing
+from core.tools.resolver import DEFAULT_MIN_SCORE, NameIndex, NameMatch
+from core.tools.resources import ResourceContext
+from core.tools.schema import SchemaError
 
 if TYPE_CHECKING:
     from core.tools.base import BaseTool
@@ -22,10 +42,88 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class RegistrySnapshot:
+    """
+    Immutable view of the registry at one point in time.
+
+    Readers take the current snapshot with a single attribute read and
+    never lock; writers build a new snapshot and publish it atomically.
+    A snapshot's dicts are never mutated after publication.
+    """
+
+    __slots__ = (
+        "tools", "lazy", "names", "version", "_metadata", "_listing", "_index", "_stored",
+    )
+
+    def __init__(
+        self,
+        tools: dict[str, "BaseTool"],
+        lazy: dict[str, ToolSpec | StoredSpec],
+        version: int,
+        stored: StoredRegistry | None = None,
+    ) -> None:
+        self.tools = tools
+        self.lazy = lazy                        # registered, not yet imported
+        self.names: tuple[str, ...] = tuple(sorted([*tools, *lazy]))
+        self.version = version
+        self._metadata: list[dict] | None = None
+        self._listing: str | None = None
+        self._index: NameIndex | None = None
+        self._stored = stored                   # loaded from a file, unchanged since
+
+    def metadata(self) -> list[dict]:
+        """Metadata of every tool, built once per snapshot."""
+        metadata = self._metadata
+        if metadata is None:
+            metadata = self._metadata = [
+                *(tool.get_metadata() for tool in self.tools.values()),
+                *(spec.get_metadata() for spec in self.lazy.values()),
+            ]
+        return metadata
+
+    def prompt_listing(self) -> str:
+        """The tools rendered for the agent's prompt, built once per snapshot."""
+        listing = self._listing
+        if listing is None and self._stored is not None:
+            listing = self._listing = self._stored.prompt_listing()
+        if listing is None:
+            listing = self._listing = render_listing([
+                *(tool.prompt_fragment() for tool in self.tools.values()),
+                *(spec.prompt_fragment() for spec in self.lazy.values()),
+            ])
+        return listing
+
+    def index(self) -> NameIndex:
+        """Alias / trigram index of the names, built once per snapshot."""
+        index = self._index
+        if index is None and self._stored is not None:
+            index = self._index = self._stored.index()
+        if index is None:
+            index = self._index = NameIndex([
+                *((name, tool.aliases) for name, tool in self.tools.items()),
+                *((name, spec.aliases) for name, spec in self.lazy.items()),
+            ])
+        return index
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.tools or name in self.lazy
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
 class ToolRegistry:
     """
     Maintains a name → tool instance mapping.
 
+    The mapping is copy-on-write: reads go to the current RegistrySnapshot
+    without locking, and every registration, unregistration or lazy load
+    publishes a new snapshot under a writer lock. Registering tools while
+    other threads look tools up is therefore safe.
+
+    `context` is the ResourceContext handed to every tool's `setup`; one
+    is created when omitted. `close()` tears the tools down and closes it.
+
     Usage
     -----
     registry = ToolRegistry()
@@ -34,8 +132,29 @@ class ToolRegistry:
     result = tool.execute(filename="test.txt", content="hello")
     """
 
-    def __init__(self) -> None:
-        self._tools: dict[str, "BaseTool"] = {}
+    def __init__(self, context: ResourceContext | None = None) -> None:
+        self.context = context if context is not None else ResourceContext()
+        self._snapshot = RegistrySnapshot({}, {}, version=0)
+        self._write_lock = threading.RLock()
+        # In-flight executions per tool instance, and replaced instances
+        # waiting for theirs to finish before being torn down.
+        self._leases: dict[int, int] = {}
+        self._retired: dict[int, "BaseTool"] = {}
+        self._lease_lock = threading.Lock()
+        self._torn_down = threading.Condition(self._lease_lock)   # a retired tool is gone
+
+    def snapshot(self) -> RegistrySnapshot:
+        """The current snapshot, for several consistent reads in a row."""
+        return self._snapshot
+
+    def _publish(
+        self,
+        tools: dict[str, "BaseTool"],
+        lazy: dict[str, ToolSpec | StoredSpec],
+        stored: StoredRegistry | None = None,
+    ) -> None:
+        """Swap in a new snapshot. Caller holds the write lock."""
+        self._snapshot = RegistrySnapshot(tools, lazy, self._snapshot.version + 1, stored)
 
     # ------------------------------------------------------------------ #
     #  Registration                                                        #
@@ -45,22 +164,37 @@ class ToolRegistry:
         """
         Register a tool instance.
 
+        The tool's `input_schema` is compiled here, once, so executions only
+        pay for the precomputed checks.
+
         Raises:
             ValueError: If a tool with the same name is already registered
-                        (prevents silent overwrites).
+                        (prevents silent overwrites), or if its
+                        `input_schema` cannot be compiled.
         """
         if not tool.name:
             raise ValueError(
                 f"Tool {tool.__class__.__name__!r} has no `name` defined."
             )
 
-        if tool.name in self._tools:
+        self._compile(tool)
+        if tool.name in self._snapshot:             # fail before paying for setup
+            raise ValueError(
+                f"A tool named {tool.name!r} is already registered. "
+                "Use `force_register` if you intend to overwrite it."
+            )
+        self._setup(tool)
+        with self._write_lock:
+            current = self._snapshot
+            taken = tool.name in current
+            if not taken:
+                self._publish({**current.tools, tool.name: tool}, current.lazy)
+        if taken:
+            self._teardown(tool)
             raise ValueError(
                 f"A tool named {tool.name!r} is already registered. "
                 "Use `force_register` if you intend to overwrite it."
             )
-
-        self._tools[tool.name] = tool
         logger.info("Registered tool: %s", tool.name)
 
     def force_register(self, tool: "BaseTool") -> None:
@@ -68,60 +202,442 @@ class ToolRegistry:
         Register a tool, silently replacing any existing tool with the same name.
         Useful during development / hot-reloading scenarios.
         """
-        if not tool.name:
-            raise ValueError(
-                f"Tool {tool.__class__.__name__!r} has no `name` defined."
+        self.force_register_many([tool])
+
+    def force_register_many(
+        self,
+        tools: list["BaseTool"],
+        unregister: Iterable[str] = (),
+    ) -> None:
+        """
+        Register (replacing) several tools and drop the names in
+        `unregister`, all in one snapshot swap. Lookups see either the old
+        set of tools or the new one, never a mix; executions already
+        holding an old instance finish on it.
+
+        New tools are set up before the swap; the instances they replace are
+        torn down after it, once no execution leases them.
+
+        Raises:
+            ValueError: If a tool has no name, an invalid `input_schema` or
+                        fails to set up; nothing is changed then.
+        """
+        for tool in tools:
+            if not tool.name:
+                raise ValueError(
+                    f"Tool {tool.__class__.__name__!r} has no `name` defined."
+                )
+            self._compile(tool)
+        for i, tool in enumerate(tools):
+            try:
+                self._setup(tool)
+            except ValueError:
+                for ready in tools[:i]:
+                    self._teardown(ready)
+                raise
+        with self._write_lock:
+            current = self._snapshot
+            replaced = {tool.name for tool in tools}
+            dropped = {name for name in unregister if name in current} - replaced
+            tools_map = {
+                name: tool for name, tool in current.tools.items() if name not in dropped
+            }
+            tools_map.update((tool.name, tool) for tool in tools)
+            lazy = current.lazy
+            if not (replaced | dropped).isdisjoint(lazy):
+                lazy = {
+                    name: spec for name, spec in lazy.items()
+                    if name not in replaced and name not in dropped
+                }
+            self._publish(tools_map, lazy)
+        self._retire(
+            current.tools[name] for name in replaced | dropped
+            if name in current.tools and current.tools[name] is not tools_map.get(name)
+        )
+        for tool in tools:
+            logger.info("Force-registered tool: %s", tool.name)
+        for name in dropped:
+            logger.info("Unregistered tool: %s", name)
+
+    def register_lazy(self, spec: ToolSpec) -> None:
+        """
+        Register a tool by its spec; it is imported on first `get`.
+
+        Raises:
+            ValueError: If the spec has no name or the name is taken.
+        """
+        self.register_lazy_many([spec])
+
+    def register_lazy_many(self, specs: list[ToolSpec]) -> None:
+        """
+        Register several specs in one snapshot swap (all or nothing).
+
+        Raises:
+            ValueError: If a spec has no name or a name is taken.
+        """
+        with self._write_lock:
+            current = self._snapshot
+            lazy = dict(current.lazy)
+            for spec in specs:
+                if not spec.name:
+                    raise ValueError(f"Tool spec for {spec.target!r} has no `name` defined.")
+                if spec.name in current.tools or spec.name in lazy:
+                    raise ValueError(
+                        f"A tool named {spec.name!r} is already registered. "
+                        "Use `force_register` if you intend to overwrite it."
+                    )
+                lazy[spec.name] = spec
+            self._publish(current.tools, lazy)
+        for spec in specs:
+            logger.debug("Registered lazy tool: %s → %s", spec.name, spec.target)
+
+    def register_manifest(self, path: str | Path) -> list[str]:
+        """
+        Lazily register every tool listed in a JSON manifest.
+
+        Returns:
+            The names registered.
+
+        Raises:
+            ValueError: If the manifest is malformed or a name is taken.
+        """
+        specs = load_manifest(path)
+        self.register_lazy_many(specs)
+        logger.info("Registered %d tool(s) from manifest %s", len(specs), path)
+        return [spec.name for spec in specs]
+
+    def discover_plugins(self, group: str = ENTRY_POINT_GROUP) -> list[str]:
+        """
+        Register the tools published as entry points in `group`.
+
+        Entry points described by their distribution's manifest are
+        registered lazily; the others have to be imported now to learn
+        their description and schema. A plugin that fails is logged and
+        skipped.
+
+        Returns:
+            The names registered.
+        """
+        names: list[str] = []
+        for spec, described in entry_point_specs(group):
+            try:
+                if described:
+                    self.register_lazy(spec)
+                else:
+                    logger.warning(
+                        "Plugin tool %r has no manifest entry; importing it eagerly.",
+                        spec.name,
+                    )
+                    self.register(spec.load())
+            except Exception as exc:  # noqa: BLE001
+                logger.error("Skipping plugin tool %r (%s): %s", spec.name, spec.target, exc)
+                continue
+            names.append(spec.name)
+        return names
+
+    def save_snapshot(
+        self,
+        path: str | Path,
+        *,
+        key: str = "",
+        extra_sources: Iterable[str | Path] = (),
+    ) -> Path:
+        """
+        Persist the current tools to a snapshot file (see
+        core/tools/persistence.py), for `load_snapshot` at the next start.
+
+        Args:
+            key:           Identifies the configuration the tools came from;
+                           `load_snapshot` must pass the same key.
+            extra_sources: Further files (or directories) the registration
+                           depended on, e.g. a tool manifest.
+
+        Raises:
+            ValueError: If a tool cannot be re-created from its class.
+            OSError:    If the file cannot be written.
+        """
+        return persistence.save(self._snapshot, path, key=key, extra_sources=extra_sources)
+
+    def load_snapshot(self, path: str | Path, *, key: str = "") -> bool:
+        """
+        Register the tools of a snapshot file lazily, if it is current.
+
+        Returns:
+            True if the snapshot was used; False if it is missing or stale,
+            in which case nothing was registered.
+
+        Raises:
+            ValueError: If a stored tool's name is already registered.
+        """
+        stored = persistence.load(path, key=key)
+        if stored is None:
+            return False
+        with self._write_lock:
+            current = self._snapshot
+            taken = [name for name in stored.specs if name in current]
+            if taken:
+                raise ValueError(
+                    f"Tools {taken} from snapshot {path} are already registered."
+                )
+            # The stored index and listing describe exactly the stored tools.
+            self._publish(
+                current.tools,
+                {**current.lazy, **stored.specs},
+                stored if not len(current) else None,
             )
-        self._tools[tool.name] = tool
-        logger.info("Force-registered tool: %s", tool.name)
+        logger.info("Loaded %d tool(s) from registry snapshot %s", len(stored.specs), path)
+        return True
 
     def unregister(self, name: str) -> None:
         """Remove a tool from the registry by name."""
-        if name not in self._tools:
-            raise KeyError(f"No tool named {name!r} is registered.")
-        del self._tools[name]
+        with self._write_lock:
+            current = self._snapshot
+            if name in current.lazy:
+                lazy = {n: spec for n, spec in current.lazy.items() if n != name}
+                self._publish(current.tools, lazy)
+            elif name in current.tools:
+                tools = {n: tool for n, tool in current.tools.items() if n != name}
+                self._publish(tools, current.lazy)
+            else:
+                raise KeyError(f"No tool named {name!r} is registered.")
+        if name in current.tools:
+            self._retire([current.tools[name]])
         logger.info("Unregistered tool: %s", name)
 
+    @staticmethod
+    def _compile(tool: "BaseTool") -> None:
+        """Compile the tool's input_schema, re-raising failures with context."""
+        try:
+            tool.validator
+        except SchemaError as exc:
+            raise ValueError(
+                f"Tool {tool.name!r} has an invalid input_schema: {exc}"
+            ) from exc
+
     # ------------------------------------------------------------------ #
     #  Retrieval                                                           #
     # ------------------------------------------------------------------ #
 
     def get(self, name: str) -> "BaseTool":
         """
-        Retrieve a registered tool by name.
+        Retrieve a registered tool by name, importing it if it was
+        registered lazily.
 
         Raises:
-            KeyError: If the tool is not found.
+            KeyError: If the tool is not found or fails to load.
         """
-        if name not in self._tools:
+        current = self._snapshot
+        tool = current.tools.get(name)
+        if tool is not None:
+            return tool
+        if name not in current.lazy:
             raise KeyError(
                 f"Tool {name!r} not found. "
-                f"Available tools: {self.list_names()}"
+                f"Available tools: {list(current.names)}"
             )
-        return self._tools[name]
+        try:
+            return self._load(name)
+        except Exception as exc:  # noqa: BLE001
+            raise KeyError(f"Tool {name!r} failed to load: {exc}") from exc
 
     def get_or_none(self, name: str) -> "BaseTool | None":
-        """Return the tool or None if not found (no exception)."""
-        return self._tools.get(name)
+        """Return the tool or None if not found or not loadable (no exception)."""
+        current = self._snapshot
+        tool = current.tools.get(name)
+        if tool is not None or name not in current.lazy:
+            return tool
+        try:
+            return self._load(name)
+        except Exception as exc:  # noqa: BLE001
+            logger.error("Tool %r failed to load: %s", name, exc)
+            return None
+
+    def acquire(self, name: str) -> "BaseTool | None":
+        """
+        `get_or_none` and lease the tool in one step; pair with `release`.
+
+        The lease is taken under the same lock `_retire` checks, against
+        the current snapshot: a tool replaced or unregistered concurrently
+        is either leased before its retirement (which then waits for
+        `release`) or not returned at all. A separate `get` + `lease`
+        leaves a window in which the instance can be torn down first.
+
+        Returns:
+            The leased tool, or None if not found or not loadable.
+        """
+        while True:
+            with self._lease_lock:
+                tool = self._snapshot.tools.get(name)
+                if tool is not None:
+                    self._leases[id(tool)] = self._leases.get(id(tool), 0) + 1
+                    return tool
+            if self.get_or_none(name) is None:      # missing, or lazy and failed to load
+                return None
+
+    def release(self, tool: "BaseTool") -> None:
+        """End a lease taken with `acquire` (tearing the tool down if it was retired)."""
+        key = id(tool)
+        with self._lease_lock:
+            count = self._leases[key] - 1
+            if count:
+                self._leases[key] = count
+                return
+            del self._leases[key]
+            retired = self._retired.get(key)
+        if retired is not None:
+            self._teardown(retired)
+            with self._torn_down:
+                del self._retired[key]
+                self._torn_down.notify_all()
+
+    def resolve(self, name: str, min_score: float = DEFAULT_MIN_SCORE) -> NameMatch | None:
+        """
+        Find the registered tool `name` refers to: itself when registered,
+        else a tool whose name or alias matches it up to case, separators
+        and word order, else the closest name by trigram similarity (see
+        core/tools/resolver.py).
+
+        Returns:
+            The match, or None when nothing scores `min_score` or the best
+            candidates are too close to call.
+        """
+        current = self._snapshot
+        if name in current:
+            return NameMatch(name, 1.0, "exact")
+        return current.index().resolve(name, min_score)
+
+    def _load(self, name: str) -> "BaseTool":
+        """Import a lazily registered tool and promote it to a regular one."""
+        with self._write_lock:
+            current = self._snapshot
+            tool = current.tools.get(name)
+            if tool is not None:                # loaded by another thread
+                return tool
+            spec = current.lazy.get(name)
+            if spec is None:
+                raise KeyError(f"No tool named {name!r} is registered.")
+            tool = spec.load()
+            self._compile(tool)
+            self._setup(tool)
+            lazy = {n: s for n, s in current.lazy.items() if n != name}
+            self._publish({**current.tools, name: tool}, lazy)
+        logger.info("Loaded lazy tool: %s (%s)", name, spec.target)
+        return tool
+
+    # ------------------------------------------------------------------ #
+    #  Lifecycle                                                           #
+    # ------------------------------------------------------------------ #
+
+    def _setup(self, tool: "BaseTool") -> None:
+        """Run the tool's setup hook, re-raising failures with context."""
+        try:
+            tool.setup(self.context)
+        except Exception as exc:  # noqa: BLE001
+            raise ValueError(f"Tool {tool.name!r} failed to set up: {exc}") from exc
+
+    @staticmethod
+    def _teardown(tool: "BaseTool") -> None:
+        try:
+            tool.teardown()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Teardown of tool %r failed: %s", tool.name, exc)
+
+    def _retire(self, tools: Iterable["BaseTool"]) -> None:
+        """Tear replaced instances down now, or when their last lease ends."""
+        for tool in tools:
+            with self._lease_lock:
+                if self._leases.get(id(tool)):
+                    self._retired[id(tool)] = tool
+                    continue
+            self._teardown(tool)
+
+    @contextmanager
+    def lease(self, tool: "BaseTool") -> Iterator["BaseTool"]:
+        """
+        Mark `tool` as in use for the enclosed block: if it is replaced or
+        unregistered meanwhile, its teardown waits until the block exits.
+
+        The tool must still be registered when the block starts; code that
+        looks a tool up to run it should use `acquire` / `release`, as
+        ToolExecutor does.
+        """
+        key = id(tool)
+        with self._lease_lock:
+            self._leases[key] = self._leases.get(key, 0) + 1
+        try:
+            yield tool
+        finally:
+            self.release(tool)
+
+    def warm_up(self, names: Iterable[str] | None = None) -> list[str]:
+        """
+        Load and set up lazily registered tools now (all of them by
+        default) so their first call doesn't pay for it. Tools that fail
+        to load are logged and skipped.
+
+        Returns:
+            The names of the tools that are ready.
+        """
+        pending = list(self._snapshot.lazy) if names is None else list(names)
+        return [name for name in pending if self.get_or_none(name) is not None]
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Tear down every loaded tool and close the ResourceContext. The
+        registry is empty afterwards.
+
+        Tools still leased by executions (including ones replaced earlier)
+        are torn down when those finish; the ResourceContext is closed only
+        after that, since they may still be using it.
+
+        Args:
+            timeout: Seconds to wait for leased tools (None: no limit). If
+                     they are still running then, the context is closed
+                     anyway and a warning is logged.
+        """
+        with self._write_lock:
+            current = self._snapshot
+            self._publish({}, {})
+        self._retire(current.tools.values())
+        with self._torn_down:
+            if not self._torn_down.wait_for(lambda: not self._retired, timeout):
+                logger.warning(
+                    "Closing the resource context with %d tool(s) still in use: %s",
+                    len(self._retired), sorted(tool.name for tool in self._retired.values()),
+                )
+        self.context.close()
+        logger.info("Closed tool registry (%d tool(s) torn down)", len(current.tools))
 
     # ------------------------------------------------------------------ #
     #  Introspection                                                       #
     # ------------------------------------------------------------------ #
 
     def list_names(self) -> list[str]:
-        """Return a sorted list of all registered tool names."""
-        return sorted(self._tools.keys())
+        """Return a sorted list of all registered tool names (loaded or not)."""
+        return list(self._snapshot.names)
 
     def list_metadata(self) -> list[dict]:
         """
         Return metadata for all registered tools.
         This is what the future agent layer will pass to the LLM so it
-        can reason about which tool to call.
+        can reason about which tool to call. Lazy tools are described from
+        their spec, without importing them.
         """
-        return [tool.get_metadata() for tool in self._tools.values()]
+        return list(self._snapshot.metadata())
+
+    def prompt_listing(self) -> str:
+        """All tools, numbered and rendered for the agent's prompt."""
+        return self._snapshot.prompt_listing()
+
+    def is_loaded(self, name: str) -> bool:
+        """True if the tool is registered and already imported."""
+        return name in self._snapshot.tools
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._snapshot
 
     def __len__(self) -> int:
-        return len(self._tools)
+        return len(self._snapshot)
 
     def __repr__(self) -> str:
         return f"<ToolRegistry tools={self.list_names()}>"
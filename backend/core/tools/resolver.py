@@ -0,0 +1,159 @@
+"""
+core/tools/resolver.py
+
+Resolution of tool names the model got slightly wrong.
+
+LLMs regularly ask for "File_Creation", "fileCreation" or "create_file"
+instead of "file_creation". Rather than failing the call (and paying a
+full model round trip for the retry), ToolRegistry resolves unknown names
+through a NameIndex:
+
+1. Alias index — every registered name and declared alias is reduced to
+   its lower-case tokens, both in order ("file_creation" → "filecreation")
+   and sorted ("creation_file" → "creationfile"). A requested name that
+   reduces to the same key resolves with score 1.0.
+2. Trigram index — an inverted index from the trigrams of each token
+   (padded, so token order doesn't matter) to the spellings containing
+   them. Candidates sharing trigrams with the request are scored with the
+   Dice coefficient. Only the postings of the request's rarest trigrams
+   are read (prefix filtering), so a lookup never scans every tool.
+
+A fuzzy match is only accepted when it scores at least `min_score` and
+clearly beats the runner-up (by `AMBIGUITY_MARGIN`); otherwise the name
+stays unresolved. The index is built once per registry snapshot, on the
+first lookup that needs it.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, Iterable
+
+DEFAULT_MIN_SCORE = 0.7         # Dice similarity required for a fuzzy match
+AMBIGUITY_MARGIN = 0.05         # best match must lead the runner-up by this
+
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+_SEPARATORS = re.compile(r"[^0-9A-Za-z]+")
+
+
+def tokens(name: str) -> list[str]:
+    """Lower-case word tokens of a name ("createFile-v2" → create, file, v2)."""
+    return [t.lower() for t in _SEPARATORS.split(_CAMEL_BOUNDARY.sub("_", name)) if t]
+
+
+def normalize(name: str) -> str:
+    """Canonical snake_case spelling of a name."""
+    return "_".join(tokens(name))
+
+
+def _keys(name: str) -> tuple[str, ...]:
+    """Alias keys of a name: its tokens joined in order and sorted."""
+    words = tokens(name)
+    ordered, reordered = "".join(words), "".join(sorted(words))
+    return (ordered,) if ordered == reordered else (ordered, reordered)
+
+
+def _trigrams(words: list[str]) -> frozenset[str]:
+    """Trigrams of each token, padded at both ends — independent of token order."""
+    grams: set[str] = set()
+    for word in words:
+        padded = f"^{word}$"
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+@dataclass(frozen=True)
+class NameMatch:
+    """A registered tool name found for a requested one."""
+
+    name: str
+    score: float                # 1.0 for exact and alias matches
+    method: str                 # "exact" | "alias" | "fuzzy"
+
+    def describe(self, requested: str) -> dict[str, Any]:
+        """The record stored in `ToolResult.metadata["name_resolution"]`."""
+        return {
+            "requested": requested,
+            "resolved": self.name,
+            "method": self.method,
+            "score": round(self.score, 3),
+        }
+
+
+class NameIndex:
+    """
+    Alias and trigram index over a fixed set of tool names.
+
+    Parameters
+    ----------
+    names : iterable of (name, aliases) -- each tool's registered name and
+            the extra names it declares.
+    """
+
+    def __init__(self, names: Iterable[tuple[str, Iterable[str]]]) -> None:
+        owners: dict[str, set[str]] = {}
+        spelled: dict[str, tuple[str, ...]] = {}
+        for name, aliases in names:
+            spelled[name] = (name, *aliases)
+            for spelling in spelled[name]:
+                for key in _keys(spelling):
+                    owners.setdefault(key, set()).add(name)
+
+        # A key claimed by two tools can't resolve either of them.
+        self._aliases: dict[str, str] = {
+            key: next(iter(tools)) for key, tools in owners.items() if len(tools) == 1
+        }
+
+        self._entries: list[tuple[str, frozenset[str]]] = []   # (tool, trigrams)
+        self._postings: dict[str, list[int]] = {}
+        for name, spellings in spelled.items():
+            for grams in {_trigrams(tokens(spelling)) for spelling in spellings}:
+                entry = len(self._entries)
+                self._entries.append((name, grams))
+                for gram in grams:
+                    self._postings.setdefault(gram, []).append(entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def resolve(self, requested: str, min_score: float = DEFAULT_MIN_SCORE) -> NameMatch | None:
+        """The tool `requested` most likely refers to, or None."""
+        keys = _keys(requested)
+        if not keys[0]:
+            return None
+        for key in keys:
+            tool = self._aliases.get(key)
+            if tool is not None:
+                return NameMatch(tool, 1.0, "alias")
+
+        # Prefix filter: a spelling scoring `floor` shares at least `need` of
+        # the request's n trigrams, so it appears in the postings of any
+        # n - need + 1 of them — take the rarest. Candidates down to the
+        # ambiguity margin are kept so a close runner-up is still seen.
+        grams = _trigrams(tokens(requested))
+        size = len(grams)
+        floor = max(min_score - AMBIGUITY_MARGIN, 0.0)
+        need = max(1, math.ceil(floor * size / (2.0 - floor) - 1e-9))
+        postings = sorted((self._postings.get(gram, ()) for gram in grams), key=len)
+        candidates: set[int] = set()
+        for posting in postings[:size - need + 1]:
+            candidates.update(posting)
+
+        best: dict[str, float] = {}
+        for entry in candidates:
+            tool, entry_grams = self._entries[entry]
+            score = 2.0 * len(grams & entry_grams) / (size + len(entry_grams))
+            if score > best.get(tool, 0.0):
+                best[tool] = score
+
+        ranked = heapq.nlargest(2, best.items(), key=itemgetter(1))
+        if not ranked or ranked[0][1] < min_score:
+            return None
+        tool, score = ranked[0]
+        if len(ranked) > 1 and score - ranked[1][1] < AMBIGUITY_MARGIN:
+            return None
+        return NameMatch(tool, score, "fuzzy")
@@ -0,0 +1,232 @@
+"""
+core/tools/resources.py
+
+Shared resources for tools.
+
+A ResourceContext belongs to a ToolRegistry and is handed to every tool's
+`BaseTool.setup`. Tools get long-lived resources from it instead of
+creating them per call or keeping ad-hoc globals:
+
+    resource(name, factory)   any object, created once and shared by name
+                              (an HTTP session, a client, a loaded model).
+    pool(name, factory, ...)  a ConnectionPool of up to `size` connections
+                              (DB connections, HTTP connections).
+    executor(name)            a shared ThreadPoolExecutor.
+
+Resources are created on first request and closed, in reverse order of
+creation, when the context closes (`ToolRegistry.close()`).
+
+Usage (inside a tool)
+---------------------
+    def setup(self, context):
+        self._db = context.pool("orders-db", lambda: sqlite3.connect(DB_PATH,
+                                check_same_thread=False), size=4)
+
+    def execute(self, **kwargs):
+        with self._db.connection() as conn:
+            ...
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+def _default_close(resource: Any) -> None:
+    close = getattr(resource, "close", None)
+    if callable(close):
+        close()
+
+
+class ConnectionPool:
+    """
+    Bounded pool of reusable connections. Thread-safe.
+
+    Parameters
+    ----------
+    factory : callable      -- opens a new connection.
+    size    : int           -- most connections open at once; `connection()`
+                               blocks while all of them are in use.
+    close   : callable      -- closes one connection (default: its `close()`).
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        *,
+        size: int = 8,
+        close: Callable[[Any], None] | None = None,
+    ) -> None:
+        if size < 1:
+            raise ValueError("ConnectionPool size must be at least 1.")
+        self._factory = factory
+        self._size = size
+        self._close = close or _default_close
+        self._idle: list[Any] = []
+        self._open = 0
+        self._closed = False
+        self._available = threading.Condition()
+
+    @contextmanager
+    def connection(self, timeout: float | None = None) -> Iterator[Any]:
+        """
+        Borrow a connection for the enclosed block. A block that raises
+        discards its connection rather than returning a possibly broken
+        one to the pool.
+
+        Raises:
+            TimeoutError: If no connection frees up within `timeout`.
+            RuntimeError: If the pool is closed.
+        """
+        conn = self._acquire(timeout)
+        try:
+            yield conn
+        except BaseException:
+            self._discard(conn)
+            raise
+        self._release(conn)
+
+    def _acquire(self, timeout: float | None) -> Any:
+        with self._available:
+            if not self._available.wait_for(
+                lambda: self._closed or self._idle or self._open < self._size, timeout
+            ):
+                raise TimeoutError(f"No pooled connection became free within {timeout}s.")
+            if self._closed:
+                raise RuntimeError("ConnectionPool is closed.")
+            if self._idle:
+                return self._idle.pop()
+            self._open += 1
+        try:
+            return self._factory()
+        except BaseException:
+            with self._available:
+                self._open -= 1
+                self._available.notify()
+            raise
+
+    def _release(self, conn: Any) -> None:
+        with self._available:
+            if not self._closed:
+                self._idle.append(conn)
+                self._available.notify()
+                return
+            self._open -= 1
+        self._close_quietly(conn)
+
+    def _discard(self, conn: Any) -> None:
+        with self._available:
+            self._open -= 1
+            self._available.notify()
+        self._close_quietly(conn)
+
+    def _close_quietly(self, conn: Any) -> None:
+        try:
+            self._close(conn)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Closing a pooled connection failed: %s", exc)
+
+    @property
+    def in_use(self) -> int:
+        with self._available:
+            return self._open - len(self._idle)
+
+    def close(self) -> None:
+        """Close idle connections now and borrowed ones when they come back."""
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._available.notify_all()
+        for conn in idle:
+            self._close_quietly(conn)
+
+    def __repr__(self) -> str:
+        return f"<ConnectionPool open={self._open} idle={len(self._idle)} size={self._size}>"
+
+
+class ResourceContext:
+    """Named resources shared by the tools of one registry. Thread-safe."""
+
+    def __init__(self) -> None:
+        self._resources: dict[str, Any] = {}
+        self._closers: list[tuple[str, Callable[[], None]]] = []
+        self._lock = threading.RLock()
+        self._closed = False
+
+    def resource(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        close: Callable[[Any], None] | None = None,
+    ) -> Any:
+        """
+        The resource called `name`, created with `factory()` on first use.
+        `close` releases it when the context closes (default: its
+        `close()` method, if any).
+
+        Raises:
+            RuntimeError: If the context is closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ResourceContext is closed.")
+            if name in self._resources:
+                return self._resources[name]
+            resource = factory()
+            self._resources[name] = resource
+            closer = close or _default_close
+            self._closers.append((name, lambda: closer(resource)))
+            logger.debug("Created shared resource %r", name)
+            return resource
+
+    def pool(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        *,
+        size: int = 8,
+        close: Callable[[Any], None] | None = None,
+    ) -> ConnectionPool:
+        """The ConnectionPool called `name` (see ConnectionPool for the arguments)."""
+        return self.resource(
+            f"pool:{name}", lambda: ConnectionPool(factory, size=size, close=close)
+        )
+
+    def executor(self, name: str = "default", max_workers: int | None = None) -> ThreadPoolExecutor:
+        """The shared thread pool called `name`."""
+        return self.resource(
+            f"executor:{name}",
+            lambda: ThreadPoolExecutor(max_workers, thread_name_prefix=f"tool-{name}"),
+            close=lambda pool: pool.shutdown(wait=False, cancel_futures=True),
+        )
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._resources
+
+    def close(self) -> None:
+        """Close every resource, most recently created first (idempotent)."""
+        with self._lock:
+            self._closed = True
+            closers, self._closers = self._closers, []
+            self._resources.clear()
+        for name, closer in reversed(closers):
+            try:
+                closer()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Closing shared resource %r failed: %s", name, exc)
+
+    def __enter__(self) -> "ResourceContext":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<ResourceContext resources={sorted(self._resources)}>"
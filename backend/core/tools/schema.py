@@ -0,0 +1,418 @@
+"""
+core/tools/schema.py
+
+Compiles a tool's JSON-Schema-style `input_schema` into a specialised
+validator. Compilation happens once, when the tool is registered; every
+execution afterwards only runs the precomputed checks.
+
+Supported keywords
+------------------
+- object level  : properties, required, additionalProperties (bool only)
+- property level: type, enum, default, minLength, maxLength, pattern
+
+Anything else in the schema is ignored (it is still shown to the LLM,
+it just isn't enforced here).
+
+The same compiled form also drives argument coercion: LLMs routinely send
+`"true"` for booleans or `"3"` for integers, and `CompiledSchema.coerce`
+normalises those before validation instead of failing the call.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import math
+import re
+from typing import Any, Callable
+
+# A property check returns a human-readable problem, or None when the value
+# is acceptable.
+PropertyCheck = Callable[[Any], "str | None"]
+
+# A coercer returns the converted value, or _NO_COERCION when the value
+# cannot be converted to any of the declared types.
+Coercer = Callable[[Any], Any]
+_NO_COERCION = object()
+
+# JSON-Schema type name → accepted Python types. `bool` is a subclass of
+# `int` in Python, so integer/number checks exclude it explicitly below.
+_JSON_TYPES: dict[str, tuple[type, ...]] = {
+    "string":  (str,),
+    "integer": (int,),
+    "number":  (int, float),
+    "boolean": (bool,),
+    "array":   (list, tuple),
+    "object":  (dict,),
+    "null":    (type(None),),
+}
+
+
+_TRUE_STRINGS = frozenset({"true", "yes", "y", "on", "1"})
+_FALSE_STRINGS = frozenset({"false", "no", "n", "off", "0"})
+
+
+class SchemaError(ValueError):
+    """Raised when an `input_schema` cannot be compiled."""
+
+
+# --------------------------------------------------------------------------- #
+#  Property check builders                                                     #
+# --------------------------------------------------------------------------- #
+
+def _type_check(name: str, type_spec: str | list[str]) -> PropertyCheck:
+    type_names = [type_spec] if isinstance(type_spec, str) else list(type_spec)
+    unknown = [t for t in type_names if t not in _JSON_TYPES]
+    if unknown:
+        raise SchemaError(f"Property {name!r} uses unknown type(s): {unknown}")
+
+    accepted = tuple({py for t in type_names for py in _JSON_TYPES[t]})
+    rejects_bool = "boolean" not in type_names
+    expected = " or ".join(type_names)
+
+    def check(value: Any) -> str | None:
+        if isinstance(value, accepted) and not (rejects_bool and isinstance(value, bool)):
+            return None
+        return f"'{name}' must be {expected}, got {type(value).__name__}"
+
+    return check
+
+
+def _enum_check(name: str, options: list[Any]) -> PropertyCheck:
+    try:
+        allowed: frozenset | tuple = frozenset(options)
+    except TypeError:           # unhashable members (lists, dicts) — fall back
+        allowed = tuple(options)
+
+    def check(value: Any) -> str | None:
+        try:
+            if value in allowed:
+                return None
+        except TypeError:       # unhashable value against a frozenset
+            pass
+        return f"'{name}' must be one of {list(options)}, got {value!r}"
+
+    return check
+
+
+def _length_check(name: str, min_len: int | None, max_len: int | None) -> PropertyCheck:
+    def check(value: Any) -> str | None:
+        if not isinstance(value, str):
+            return None
+        if min_len is not None and len(value) < min_len:
+            return f"'{name}' must be at least {min_len} character(s) long"
+        if max_len is not None and len(value) > max_len:
+            return f"'{name}' must be at most {max_len} character(s) long"
+        return None
+
+    return check
+
+
+def _pattern_check(name: str, pattern: str) -> PropertyCheck:
+    try:
+        regex = re.compile(pattern)
+    except re.error as exc:
+        raise SchemaError(f"Property {name!r} has an invalid pattern: {exc}") from exc
+
+    def check(value: Any) -> str | None:
+        if not isinstance(value, str) or regex.search(value):
+            return None
+        return f"'{name}' must match pattern {pattern!r}"
+
+    return check
+
+
+# --------------------------------------------------------------------------- #
+#  Coercion                                                                     #
+# --------------------------------------------------------------------------- #
+
+def _to_boolean(value: Any) -> Any:
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    elif isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    return _NO_COERCION
+
+
+def _to_integer(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            value = _to_number(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return _NO_COERCION
+
+
+def _to_number(value: Any) -> Any:
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            return int(text)
+        except ValueError:
+            pass
+        try:
+            number = float(text)
+        except ValueError:
+            pass
+        else:
+            if math.isfinite(number):       # "nan" / "inf" are not numbers here
+                return number
+    return _NO_COERCION
+
+
+def _to_string(value: Any) -> Any:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return _NO_COERCION
+
+
+def _json_container(expected: type) -> Coercer:
+    def coerce(value: Any) -> Any:
+        if isinstance(value, str):
+            try:
+                decoded = json.loads(value)
+            except ValueError:
+                return _NO_COERCION
+            if isinstance(decoded, expected):
+                return decoded
+        return _NO_COERCION
+
+    return coerce
+
+
+def _to_null(value: Any) -> Any:
+    if isinstance(value, str) and value.strip().lower() in {"null", "none", ""}:
+        return None
+    return _NO_COERCION
+
+
+_COERCERS: dict[str, Coercer] = {
+    "boolean": _to_boolean,
+    "integer": _to_integer,
+    "number":  _to_number,
+    "string":  _to_string,
+    "array":   _json_container(list),
+    "object":  _json_container(dict),
+    "null":    _to_null,
+}
+
+
+def _compile_coercer(spec: dict[str, Any]) -> Coercer | None:
+    """
+    Build a coercer for a property, or None if it declares no type.
+
+    Types are tried in declaration order and the first successful
+    conversion wins.
+    """
+    type_spec = spec.get("type")
+    if type_spec is None:
+        return None
+    type_names = [type_spec] if isinstance(type_spec, str) else list(type_spec)
+    coercers = tuple(_COERCERS[t] for t in type_names)
+
+    def coerce(value: Any) -> Any:
+        for coercer in coercers:
+            converted = coercer(value)
+            if converted is not _NO_COERCION:
+                return converted
+        return _NO_COERCION
+
+    return coerce
+
+
+def _compile_property(name: str, spec: dict[str, Any]) -> tuple[PropertyCheck, ...]:
+    """Build the ordered list of checks for a single property."""
+    if not isinstance(spec, dict):
+        raise SchemaError(f"Property {name!r} must be described by a dict.")
+
+    checks: list[PropertyCheck] = []
+    if "type" in spec:
+        checks.append(_type_check(name, spec["type"]))
+    if "enum" in spec:
+        checks.append(_enum_check(name, spec["enum"]))
+    if "minLength" in spec or "maxLength" in spec:
+        checks.append(_length_check(name, spec.get("minLength"), spec.get("maxLength")))
+    if "pattern" in spec:
+        checks.append(_pattern_check(name, spec["pattern"]))
+    return tuple(checks)
+
+
+# --------------------------------------------------------------------------- #
+#  Compiled validator                                                           #
+# --------------------------------------------------------------------------- #
+
+def _immutable(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+class CompiledSchema:
+    """
+    Immutable, precomputed validator for one `input_schema`.
+
+    Attributes
+    ----------
+    required   : frozenset[str]          -- names that must be supplied.
+    properties : frozenset[str]          -- every declared property name.
+    defaults   : dict[str, Any]          -- declared `default` values.
+    additional : bool                    -- whether undeclared keys are allowed.
+    """
+
+    __slots__ = (
+        "required", "properties", "defaults", "additional",
+        "_checks", "_coercers", "_strip_unknown", "_declared",
+    )
+
+    def __init__(
+        self,
+        required: frozenset[str],
+        properties: frozenset[str],
+        defaults: dict[str, Any],
+        additional: bool,
+        checks: dict[str, tuple[PropertyCheck, ...]],
+        coercers: dict[str, Coercer] | None = None,
+        strip_unknown: bool = False,
+    ) -> None:
+        self.required = required
+        self.properties = properties
+        self.defaults = defaults
+        self.additional = additional
+        self._checks = checks
+        self._coercers = coercers or {}
+        self._strip_unknown = strip_unknown
+        # A name listed in `required` is declared even without a property.
+        self._declared = properties | required
+
+    def missing(self, kwargs: dict[str, Any]) -> list[str]:
+        """Return the required names absent from `kwargs` (sorted)."""
+        if self.required.issubset(kwargs):
+            return []
+        return sorted(self.required.difference(kwargs))
+
+    def validate(self, kwargs: dict[str, Any]) -> list[str]:
+        """
+        Validate `kwargs` against the schema.
+
+        Returns a list of human-readable problems (empty list = valid).
+        """
+        errors = [f"missing required input '{key}'" for key in self.missing(kwargs)]
+
+        for key, value in kwargs.items():
+            checks = self._checks.get(key)
+            if checks is None:
+                if not self.additional and key not in self._declared:
+                    errors.append(f"unexpected input '{key}'")
+                continue
+            for check in checks:
+                problem = check(value)
+                if problem is not None:
+                    errors.append(problem)
+                    break
+
+        return errors
+
+    def coerce(self, kwargs: dict[str, Any]) -> tuple[dict[str, Any], list[str]]:
+        """
+        Normalise `kwargs` towards the schema before validation.
+
+        - Converts values whose type doesn't match but can be losslessly
+          read as the declared type (e.g. "true" → True, "3" → 3).
+        - Fills in declared `default` values for absent optional inputs.
+        - Drops undeclared inputs (neither a property nor required), unless
+          the schema has no properties or explicitly sets
+          `additionalProperties: true`.
+
+        Values that cannot be converted are passed through untouched so that
+        `validate` reports them.
+
+        Returns
+        -------
+        (coerced_kwargs, coercions) -- a new dict, plus one human-readable
+        line per change made (empty list = nothing changed).
+        """
+        coerced: dict[str, Any] = {}
+        coercions: list[str] = []
+
+        for key, value in kwargs.items():
+            if key not in self.properties:
+                if self._strip_unknown and key not in self._declared:
+                    coercions.append(f"dropped unknown input '{key}'")
+                    continue
+                coerced[key] = value
+                continue
+
+            checks = self._checks[key]
+            coercer = self._coercers.get(key)
+            if coercer is not None and checks and checks[0](value) is not None:
+                converted = coercer(value)
+                if converted is not _NO_COERCION:
+                    coercions.append(
+                        f"'{key}': {value!r} ({type(value).__name__}) → "
+                        f"{converted!r} ({type(converted).__name__})"
+                    )
+                    value = converted
+            coerced[key] = value
+
+        for key, default in self.defaults.items():
+            if key not in coerced:
+                # A list/dict default must not be shared between calls.
+                coerced[key] = default if _immutable(default) else copy.deepcopy(default)
+                coercions.append(f"'{key}': applied default {default!r}")
+
+        return coerced, coercions
+
+    def __repr__(self) -> str:
+        return (
+            f"<CompiledSchema properties={sorted(self.properties)} "
+            f"required={sorted(self.required)}>"
+        )
+
+
+def compile_schema(input_schema: dict[str, Any]) -> CompiledSchema:
+    """
+    Compile an `input_schema` dict into a CompiledSchema.
+
+    Declared `default` values are checked against their own property's
+    constraints so a broken default is caught at registration, not at call time.
+
+    Raises:
+        SchemaError: If the schema is malformed.
+    """
+    if not isinstance(input_schema, dict):
+        raise SchemaError("input_schema must be a dict.")
+
+    properties = input_schema.get("properties", {})
+    if not isinstance(properties, dict):
+        raise SchemaError("input_schema['properties'] must be a dict.")
+
+    required = frozenset(input_schema.get("required", []))
+
+    checks: dict[str, tuple[PropertyCheck, ...]] = {}
+    coercers: dict[str, Coercer] = {}
+    defaults: dict[str, Any] = {}
+    for name, spec in properties.items():
+        checks[name] = _compile_property(name, spec)
+        coercer = _compile_coercer(spec)
+        if coercer is not None:
+            coercers[name] = coercer
+        if "default" in spec:
+            for check in checks[name]:
+                problem = check(spec["default"])
+                if problem is not None:
+                    raise SchemaError(f"Invalid default: {problem}")
+            defaults[name] = spec["default"]
+
+    return CompiledSchema(
+        required=required,
+        properties=frozenset(properties),
+        defaults=defaults,
+        additional=input_schema.get("additionalProperties", True) is not False,
+        checks=checks,
+        coercers=coercers,
+        strip_unknown=bool(properties) and input_schema.get("additionalProperties") is not True,
+    )
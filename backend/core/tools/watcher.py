@@ -0,0 +1,260 @@
+"""
+core/tools/watcher.py
+
+Hot reloading of tools from a directory.
+
+ToolWatcher polls the `*.py` files of a tools directory (mtime and size,
+stdlib only) and, for every file that appeared or changed:
+
+1. re-imports the module from source under its usual module name;
+2. instantiates every concrete BaseTool subclass it defines and compiles
+   their input schemas;
+3. swaps the new instances in with one `force_register_many` call, and
+   unregisters tools the file no longer defines.
+
+A file that fails at any step leaves the previous version registered (the
+error is logged) and is retried once it changes again. Deleted files have
+their tools unregistered. Because the registry is copy-on-write, an
+execution that already looked a tool up finishes on the old instance;
+only later lookups see the new one.
+
+A tool name already registered by something other than the watcher (e.g.
+FileCreationTool in main.py) is never replaced. Cached results are keyed
+by `tool.version`, so bump it when a change alters a cacheable tool's
+results.
+
+Usage
+-----
+watcher = ToolWatcher(registry, "plugins/").start()   # initial load + thread
+...
+watcher.stop()
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import inspect
+import logging
+import sys
+import threading
+from pathlib import Path
+from types import ModuleType
+
+from core.tools.base import BaseTool
+from core.tools.registry import ToolRegistry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 1.0     # seconds between two scans
+
+
+class ToolWatcher:
+    """
+    Keeps the tools defined in `directory` registered and up to date.
+
+    Parameters
+    ----------
+    registry  : ToolRegistry -- where the tools are (re)registered.
+    directory : str | Path   -- the tools directory; files starting with
+                                "_" are ignored.
+    interval  : float        -- seconds between two background scans.
+    package   : str | None   -- dotted package of `directory`. By default
+                                it is derived from sys.path, falling back
+                                to the bare file name.
+    """
+
+    def __init__(
+        self,
+        registry: ToolRegistry,
+        directory: str | Path,
+        *,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        package: str | None = None,
+    ) -> None:
+        self._registry = registry
+        self._directory = Path(directory).resolve()
+        self._interval = interval
+        self._package = package if package is not None else self._infer_package()
+        self._seen: dict[Path, tuple[int, int]] = {}        # path → (mtime_ns, size)
+        self._owned: dict[Path, tuple[str, ...]] = {}       # path → tool names
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # ------------------------------------------------------------------ #
+    #  Lifecycle                                                           #
+    # ------------------------------------------------------------------ #
+
+    def start(self) -> "ToolWatcher":
+        """Load the directory's tools now, then keep polling in the background."""
+        if self._thread is not None:
+            return self
+        self.poll()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="tool-watcher", daemon=True)
+        self._thread.start()
+        logger.info("Watching %s for tool changes every %.1fs", self._directory, self._interval)
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background thread (tools stay registered)."""
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def __enter__(self) -> "ToolWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self.poll()
+            except Exception:  # noqa: BLE001
+                logger.exception("Tool watcher scan of %s failed", self._directory)
+
+    # ------------------------------------------------------------------ #
+    #  Scanning                                                            #
+    # ------------------------------------------------------------------ #
+
+    def poll(self) -> list[str]:
+        """
+        Scan the directory once and apply what changed.
+
+        Returns:
+            The names of the tools registered, replaced or removed.
+        """
+        with self._lock:
+            current: dict[Path, tuple[int, int]] = {}
+            for path in sorted(self._directory.glob("*.py")):
+                if path.name.startswith("_"):
+                    continue
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:           # deleted mid-scan
+                    continue
+                current[path] = (stat.st_mtime_ns, stat.st_size)
+
+            touched: list[str] = []
+            for path in [p for p in self._seen if p not in current]:
+                del self._seen[path]
+                touched += self._remove(path)
+            for path, signature in current.items():
+                if self._seen.get(path) != signature:
+                    # Recorded even on failure: a broken file is retried
+                    # once it changes again, not on every scan.
+                    self._seen[path] = signature
+                    touched += self._reload(path)
+            return touched
+
+    def _reload(self, path: Path) -> list[str]:
+        module_name = self._module_name(path)
+        previous = self._owned.get(path, ())
+        try:
+            module = self._import(module_name, path)
+            tools = [cls() for cls in _tool_classes(module)]
+            names = [tool.name for tool in tools]
+            if len(set(names)) != len(names):
+                raise ValueError(f"duplicate tool names {names}")
+            for name in names:
+                if name in self._registry and name not in previous and not self._owns(name):
+                    raise ValueError(f"tool {name!r} is already registered by another source")
+            removed = [name for name in previous if name not in names]
+            self._registry.force_register_many(tools, unregister=removed)
+        except Exception as exc:  # noqa: BLE001
+            logger.error(
+                "Not loading %s%s: %s",
+                path.name, "; keeping the previous version" if previous else "", exc,
+            )
+            return []
+
+        sys.modules[module_name] = module
+        for other, owned in self._owned.items():    # a tool moved between files
+            if other != path and not set(owned).isdisjoint(names):
+                self._owned[other] = tuple(name for name in owned if name not in names)
+        self._owned[path] = tuple(names)
+        logger.info(
+            "%s %s: %s", "Reloaded" if previous else "Loaded", path.name, names or "no tools"
+        )
+        return names + removed
+
+    def _remove(self, path: Path) -> list[str]:
+        names = self._owned.pop(path, ())
+        if names:
+            self._registry.force_register_many([], unregister=names)
+            logger.info("Removed %s: unregistered %s", path.name, list(names))
+        return list(names)
+
+    def _owns(self, name: str) -> bool:
+        return any(name in owned for owned in self._owned.values())
+
+    # ------------------------------------------------------------------ #
+    #  Importing                                                           #
+    # ------------------------------------------------------------------ #
+
+    def _infer_package(self) -> str:
+        """The dotted package `directory` is importable as, or "" if none."""
+        candidates = []
+        for entry in sys.path:
+            try:
+                relative = self._directory.relative_to(Path(entry or ".").resolve())
+            except ValueError:
+                continue
+            candidates.append(".".join(relative.parts))
+        return min(candidates, key=len) if candidates else ""
+
+    def _module_name(self, path: Path) -> str:
+        return f"{self._package}.{path.stem}" if self._package else path.stem
+
+    @staticmethod
+    def _import(module_name: str, path: Path) -> ModuleType:
+        """
+        Execute `path` as a fresh module named `module_name`.
+
+        The source is compiled directly, bypassing .pyc files, whose
+        one-second mtime resolution can miss quick successive edits. The
+        module is only published in sys.modules by the caller, once its
+        tools have been registered.
+        """
+        existing = sys.modules.get(module_name)
+        existing_file = getattr(existing, "__file__", None)
+        if existing is not None and (
+            existing_file is None or Path(existing_file).resolve() != path
+        ):
+            raise ImportError(
+                f"{module_name!r} is already imported from {existing_file}; "
+                "refusing to shadow it"
+            )
+
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        code = compile(path.read_bytes(), str(path), "exec")
+        # Visible while it executes (dataclasses, typing and pickle look
+        # modules up by name), then restored until the reload succeeds.
+        sys.modules[module_name] = module
+        try:
+            exec(code, module.__dict__)
+        finally:
+            if existing is not None:
+                sys.modules[module_name] = existing
+            else:
+                sys.modules.pop(module_name, None)
+        return module
+
+
+def _tool_classes(module: ModuleType) -> list[type[BaseTool]]:
+    """Concrete BaseTool subclasses defined (not just imported) in `module`."""
+    return [
+        obj for obj in vars(module).values()
+        if inspect.isclass(obj)
+        and issubclass(obj, BaseTool)
+        and obj.__module__ == module.__name__
+        and not inspect.isabstract(obj)
+    ]
@@ -0,0 +1,381 @@
+"""
+core/tracing.py
+
+Lightweight in-process tracing: trace/span IDs, monotonic durations and
+attributes, propagated implicitly through `contextvars` from Agent.run
+into ToolExecutor.execute and on into tool code.
+
+Model
+-----
+- A *trace* is one end-to-end operation (e.g. one instruction); a *span*
+  is one timed step within it. Spans nest: a span started while another
+  is current becomes its child.
+- Only a Tracer can start a new trace. Everywhere else — executor
+  stages, tools — `span(name)` opens a child of the current span, and is a
+  no-op when there is no trace in progress. Tools therefore never need a
+  reference to the tracer.
+- Sampling is decided once per trace, at its root (`sample_rate`). An
+  unsampled trace still marks the context so every nested `span()` call
+  returns immediately; the cost of an unsampled call is one ContextVar
+  lookup per span site.
+- Durations come from `time.perf_counter_ns()`; the wall-clock start is
+  kept alongside for export.
+- Finished spans are handed to every exporter of the tracer. Exporter
+  errors are logged and swallowed, never raised into the traced code.
+
+Exporters
+---------
+    RingBufferExporter   keeps the last N spans in memory (debugging, REPL).
+    JsonlExporter        appends one JSON object per span to a file.
+    OtlpJsonExporter     appends one OTLP/JSON ExportTraceServiceRequest
+                         per span to a file, for collectors that accept it.
+
+Usage
+-----
+tracer = Tracer([RingBufferExporter()], sample_rate=0.1)
+with tracer.start_span("agent.run", instruction=text):
+    ...                           # executor and tool spans nest in here
+
+# inside a tool
+from core.tracing import span
+with span("render", rows=len(rows)):
+    ...
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar, Token
+from pathlib import Path
+from typing import Any, Iterable, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class SpanExporter(Protocol):
+    """Anything with an `export(span)` method can receive finished spans."""
+
+    def export(self, span: "Span") -> None: ...
+
+
+# --------------------------------------------------------------------------- #
+#  Spans                                                                        #
+# --------------------------------------------------------------------------- #
+
+class Span:
+    """
+    One timed, attributed step of a trace. Use as a context manager; the
+    span becomes current on entry and is finished and exported on exit.
+    An exception escaping the block marks the span as an error.
+    """
+
+    __slots__ = (
+        "trace_id", "span_id", "parent_id", "name", "attributes",
+        "status", "error", "start_unix_ns", "duration_ns",
+        "_start_ns", "_tracer", "_token",
+    )
+
+    sampled = True
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: str,
+        parent_id: str | None,
+        attributes: dict[str, Any],
+    ) -> None:
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = attributes
+        self.status = "ok"
+        self.error: str | None = None
+        self.start_unix_ns = 0
+        self.duration_ns: int | None = None
+        self._start_ns = 0
+        self._tracer = tracer
+        self._token: Token | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def record_error(self, error: BaseException | str) -> None:
+        """Mark the span as failed without raising."""
+        self.status = "error"
+        self.error = error if isinstance(error, str) else f"{type(error).__name__}: {error}"
+
+    def __enter__(self) -> "Span":
+        self._token = _current.set(self)
+        self.start_unix_ns = time.time_ns()
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.duration_ns = time.perf_counter_ns() - self._start_ns
+        if exc is not None:
+            self.record_error(exc)
+        _current.reset(self._token)
+        self._tracer._finish(self)
+
+    @property
+    def duration(self) -> float | None:
+        """Duration in seconds, or None while the span is still open."""
+        return None if self.duration_ns is None else self.duration_ns / 1e9
+
+    def to_dict(self) -> dict[str, Any]:
+        """Flat, JSON-serialisable representation."""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_unix_ns": self.start_unix_ns,
+            "duration_ns": self.duration_ns,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+    def to_otlp(self) -> dict[str, Any]:
+        """The span in the OTLP/JSON `Span` shape."""
+        otlp: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,                                  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_unix_ns),
+            "endTimeUnixNano": str(self.start_unix_ns + (self.duration_ns or 0)),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": (
+                {"code": 2, "message": self.error or ""}    # STATUS_CODE_ERROR
+                if self.status == "error" else {"code": 1}  # STATUS_CODE_OK
+            ),
+        }
+        if self.parent_id is not None:
+            otlp["parentSpanId"] = self.parent_id
+        return otlp
+
+    def __repr__(self) -> str:
+        return (
+            f"<Span name={self.name!r} trace={self.trace_id[:8]} "
+            f"span={self.span_id[:8]} status={self.status!r}>"
+        )
+
+
+class _NoopSpan:
+    """
+    Stand-in returned when nothing is being recorded. Accepts the Span API
+    and does nothing. Instances created for an unsampled root also mark
+    the context, so spans nested under it are skipped too.
+    """
+
+    __slots__ = ("_token", "_marks")
+
+    sampled = False
+    trace_id = None
+    span_id = None
+
+    def __init__(self, marks_context: bool = False) -> None:
+        self._marks = marks_context
+        self._token: Token | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+    def record_error(self, error: BaseException | str) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        if self._marks:
+            self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+
+
+_NOOP = _NoopSpan()
+
+_current: ContextVar[Span | _NoopSpan | None] = ContextVar("gladden_span", default=None)
+
+
+def current_span() -> Span | _NoopSpan:
+    """The span current in this context (a no-op span if none)."""
+    return _current.get() or _NOOP
+
+
+def span(name: str, **attributes: Any) -> Span | _NoopSpan:
+    """
+    Open a child of the current span. Does nothing (cheaply) when no
+    sampled trace is in progress.
+    """
+    parent = _current.get()
+    if parent is None or not parent.sampled:
+        return _NOOP
+    return Span(parent._tracer, name, parent.trace_id, parent.span_id, attributes)
+
+
+# --------------------------------------------------------------------------- #
+#  Tracer                                                                       #
+# --------------------------------------------------------------------------- #
+
+class Tracer:
+    """
+    Starts traces, makes the sampling decision and fans finished spans out
+    to its exporters.
+
+    Parameters
+    ----------
+    exporters   : iterable of SpanExporter
+    sample_rate : float -- fraction of traces recorded, in [0, 1].
+    """
+
+    def __init__(
+        self,
+        exporters: Iterable[SpanExporter] = (),
+        *,
+        sample_rate: float = 1.0,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1.")
+        self._exporters = list(exporters)
+        self._sample_rate = sample_rate
+
+    def add_exporter(self, exporter: SpanExporter) -> None:
+        self._exporters.append(exporter)
+
+    def start_span(self, name: str, **attributes: Any) -> Span | _NoopSpan:
+        """
+        Open a span: a child of the current span if a trace is in
+        progress, otherwise the root of a new trace (subject to sampling).
+        """
+        parent = _current.get()
+        if parent is not None:
+            if not parent.sampled:
+                return _NOOP
+            return Span(self, name, parent.trace_id, parent.span_id, attributes)
+        if self._sample_rate < 1.0 and random.random() >= self._sample_rate:
+            return _NoopSpan(marks_context=True)
+        return Span(self, name, f"{random.getrandbits(128):032x}", None, attributes)
+
+    def _finish(self, finished: Span) -> None:
+        for exporter in self._exporters:
+            try:
+                exporter.export(finished)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Span exporter %r raised: %s", exporter, exc)
+
+    def __repr__(self) -> str:
+        return f"<Tracer sample_rate={self._sample_rate} exporters={len(self._exporters)}>"
+
+
+# --------------------------------------------------------------------------- #
+#  Exporters                                                                    #
+# --------------------------------------------------------------------------- #
+
+class RingBufferExporter:
+    """Keeps the most recent `capacity` finished spans in memory."""
+
+    def __init__(self, capacity: int = 4096) -> None:
+        self._spans: deque[Span] = deque(maxlen=capacity)
+
+    def export(self, span: Span) -> None:
+        self._spans.append(span)        # deque.append is atomic
+
+    def spans(self, trace_id: str | None = None) -> list[Span]:
+        """Buffered spans in finish order, optionally for one trace."""
+        spans = list(self._spans)
+        if trace_id is None:
+            return spans
+        return [s for s in spans if s.trace_id == trace_id]
+
+    def traces(self) -> dict[str, list[Span]]:
+        """Buffered spans grouped by trace ID, each ordered by start time."""
+        grouped: dict[str, list[Span]] = {}
+        for s in self._spans:
+            grouped.setdefault(s.trace_id, []).append(s)
+        for spans in grouped.values():
+            spans.sort(key=lambda s: s.start_unix_ns)
+        return grouped
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+
+class JsonlExporter:
+    """Appends each finished span as one JSON line (see `Span.to_dict`)."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self._path.open("a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def _line(self, span: Span) -> str:
+        return json.dumps(span.to_dict(), default=str)
+
+    def export(self, span: Span) -> None:
+        line = self._line(span)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class OtlpJsonExporter(JsonlExporter):
+    """
+    Appends each finished span as an OTLP/JSON ExportTraceServiceRequest,
+    one per line, so a collector (or `curl` to /v1/traces) can ingest it.
+    """
+
+    def __init__(self, path: str | Path, *, service_name: str = "gladden") -> None:
+        super().__init__(path)
+        self._resource = {
+            "attributes": [
+                {"key": "service.name", "value": {"stringValue": service_name}},
+            ],
+        }
+
+    def _line(self, span: Span) -> str:
+        return json.dumps({
+            "resourceSpans": [{
+                "resource": self._resource,
+                "scopeSpans": [{
+                    "scope": {"name": "gladden.tracing"},
+                    "spans": [span.to_otlp()],
+                }],
+            }],
+        }, default=str)
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(v) for v in value]}}
+    return {"stringValue": str(value)}
@@ -2,6 +2,39 @@
 execution/__init__.py
 """
 
+from execution.accounting import ResourceAccounting, ResourceUsage, session_scope
+from execution.cache import ResultCache
+from execution.circuit_breaker import CircuitBreaker, CircuitBreakers
+from execution.events import Event
 from execution.executor import ToolExecutor
+from execution.graph import GraphExecutor, GraphResult, ToolGraph, ref
+from execution.interceptors import Interceptor, RateLimit, ToolCall
+from execution.job_queue import Job, JobQueue, JobWorker
+from execution.metrics import MetricsRegistry
+from execution.profiling import Profile, Profiler
+from execution.scheduler import ExecutionScheduler
 
-__all__ = ["ToolExecutor"]
\ No newline at end of file
+__all__ = [
+    "ToolExecutor",
+    "ResultCache",
+    "CircuitBreaker",
+    "CircuitBreakers",
+    "Event",
+    "GraphExecutor",
+    "GraphResult",
+    "ToolGraph",
+    "ref",
+    "Interceptor",
+    "RateLimit",
+    "ToolCall",
+    "Job",
+    "JobQueue",
+    "JobWorker",
+    "ExecutionScheduler",
+    "MetricsRegistry",
+    "ResourceAccounting",
+    "ResourceUsage",
+    "session_scope",
+    "Profile",
+    "Profiler",
+]
\ No newline at end of file
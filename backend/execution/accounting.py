@@ -0,0 +1,293 @@
+"""
+execution/accounting.py
+
+Per-execution resource accounting: which tools are expensive, and for whom.
+
+With a ResourceAccounting attached, ToolExecutor measures every run of a
+tool (not cache hits) and stores the usage in
+``result.metadata["resources"]``:
+
+    wall_seconds       elapsed time of the run
+    cpu_seconds        CPU time of the executing thread (`time.thread_time`)
+    peak_memory_delta  bytes the process's peak RSS grew by during the run
+                       (`resource.getrusage`); 0 unless the run set a new
+                       high-water mark
+    bytes_read         bytes the thread read / wrote through syscalls
+    bytes_written      (/proc/thread-self/io on Linux; elsewhere block I/O
+                       counts from getrusage, or 0 without `resource`)
+
+Usage is also aggregated per tool and per session. The session is taken
+from a context variable: ExecutionScheduler sets it from `submit(...,
+session=)`, and callers can set it with `session_scope`.
+
+CPU and I/O are per thread: work a tool hands to other threads (a shared
+executor, a subprocess) is not attributed to it. Peak RSS is process-wide,
+so concurrent executions can claim each other's growth; it is an upper
+bound for capacity planning, not an exact attribution. The `resource`
+module is optional (it does not exist on Windows); without it memory and
+block I/O read as 0.
+
+Usage
+-----
+accounting = ResourceAccounting()
+executor = ToolExecutor(registry, accounting=accounting)
+
+with session_scope("alice"):
+    executor.execute("file_creation", filename="a.txt", content="hi")
+
+accounting.by_tool()["file_creation"].cpu_seconds
+accounting.by_session()["alice"].bytes_written
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Iterator
+
+try:
+    import resource
+except ImportError:                 # Windows
+    resource = None
+
+DEFAULT_SESSION = "default"
+
+_session: ContextVar[str] = ContextVar("gladden_session", default=DEFAULT_SESSION)
+
+# ru_maxrss is in KiB on Linux and in bytes on macOS.
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+_BLOCK_SIZE = 512
+_PROC_IO = "/proc/thread-self/io"
+# Per-thread usage where the platform has it (Linux), else the process's.
+_RUSAGE_THREAD = (
+    getattr(resource, "RUSAGE_THREAD", resource.RUSAGE_SELF) if resource is not None else None
+)
+
+
+def current_session() -> str:
+    """The session executions in this context are accounted to."""
+    return _session.get()
+
+
+@contextmanager
+def session_scope(session: str) -> Iterator[None]:
+    """Account executions in the enclosed block to `session`."""
+    reset = _session.set(session)
+    try:
+        yield
+    finally:
+        _session.reset(reset)
+
+
+def set_session(session: str) -> None:
+    """Account later executions in the current context to `session`."""
+    _session.set(session)
+
+
+# --------------------------------------------------------------------------- #
+#  Sampling                                                                    #
+# --------------------------------------------------------------------------- #
+
+class _ProcIO:
+    """This thread's /proc/thread-self/io, kept open (re-read with pread)."""
+
+    __slots__ = ("fd",)
+
+    def __init__(self) -> None:
+        self.fd = os.open(_PROC_IO, os.O_RDONLY)
+
+    def read(self) -> tuple[int, int]:
+        # "rchar: <n>\nwchar: <n>\n..." — only the first two fields are needed.
+        rchar, read, wchar, written = os.pread(self.fd, 64, 0).split(None, 4)[:4]
+        if rchar != b"rchar:" or wchar != b"wchar:":
+            raise ValueError(f"unexpected {_PROC_IO} layout")
+        return int(read), int(written)
+
+    def __del__(self) -> None:
+        fd = getattr(self, "fd", None)          # unset if os.open failed
+        if fd is not None:
+            os.close(fd)
+
+
+_local = threading.local()
+_proc_io_available = os.path.exists(_PROC_IO)
+
+
+def _io_bytes() -> tuple[int, int]:
+    """(bytes read, bytes written) by the calling thread so far."""
+    global _proc_io_available
+    if _proc_io_available:
+        try:
+            proc_io = getattr(_local, "proc_io", None)
+            if proc_io is None:
+                proc_io = _local.proc_io = _ProcIO()
+            return proc_io.read()
+        except (OSError, KeyError, ValueError):
+            _proc_io_available = False
+    if resource is not None:
+        usage = resource.getrusage(_RUSAGE_THREAD)
+        return usage.ru_inblock * _BLOCK_SIZE, usage.ru_oublock * _BLOCK_SIZE
+    return 0, 0
+
+
+def _peak_rss() -> int:
+    if resource is None:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT
+
+
+@dataclass
+class ResourceUsage:
+    """Resources one execution consumed (see the module docstring)."""
+
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_memory_delta: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "wall_seconds": self.wall_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "peak_memory_delta": self.peak_memory_delta,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+        }
+
+    def split(self, parts: int) -> "ResourceUsage":
+        """An equal share of this usage (for calls run as one batch)."""
+        return ResourceUsage(
+            wall_seconds=self.wall_seconds / parts,
+            cpu_seconds=self.cpu_seconds / parts,
+            peak_memory_delta=self.peak_memory_delta // parts,
+            bytes_read=self.bytes_read // parts,
+            bytes_written=self.bytes_written // parts,
+        )
+
+
+class Meter:
+    """Measures the resources used between its creation and `stop()`."""
+
+    __slots__ = ("_wall", "_cpu", "_rss", "_read", "_written")
+
+    def __init__(self) -> None:
+        self._rss = _peak_rss()
+        self._read, self._written = _io_bytes()
+        self._cpu = time.thread_time()
+        self._wall = time.perf_counter()
+
+    def stop(self) -> ResourceUsage:
+        wall = time.perf_counter() - self._wall
+        cpu = time.thread_time() - self._cpu
+        read, written = _io_bytes()
+        return ResourceUsage(
+            wall_seconds=wall,
+            cpu_seconds=cpu,
+            peak_memory_delta=max(0, _peak_rss() - self._rss),
+            bytes_read=read - self._read,
+            bytes_written=written - self._written,
+        )
+
+
+# --------------------------------------------------------------------------- #
+#  Aggregation                                                                 #
+# --------------------------------------------------------------------------- #
+
+@dataclass
+class ResourceTotals:
+    """Usage summed over many executions; `peak_memory_delta` is the largest seen."""
+
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_memory_delta: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+
+    def add(self, usage: ResourceUsage) -> None:
+        self.calls += 1
+        self.wall_seconds += usage.wall_seconds
+        self.cpu_seconds += usage.cpu_seconds
+        self.peak_memory_delta = max(self.peak_memory_delta, usage.peak_memory_delta)
+        self.bytes_read += usage.bytes_read
+        self.bytes_written += usage.bytes_written
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def _copy(totals: ResourceTotals) -> ResourceTotals:
+    return ResourceTotals(**asdict(totals))
+
+
+class ResourceAccounting:
+    """
+    Resource usage of tool executions, per tool and per session. Thread-safe.
+
+    Pass one to `ToolExecutor(accounting=...)`; the executor calls `meter()`
+    around each run and `record()` with the outcome.
+    """
+
+    def __init__(self) -> None:
+        self._by_tool: dict[str, ResourceTotals] = {}
+        self._by_session: dict[str, ResourceTotals] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def meter() -> Meter:
+        """Start measuring an execution on the calling thread."""
+        return Meter()
+
+    def record(self, tool_name: str, usage: ResourceUsage, session: str | None = None) -> None:
+        """Add one execution's usage (`session` defaults to the current one)."""
+        session = session if session is not None else _session.get()
+        with self._lock:
+            totals = self._by_tool.get(tool_name)
+            if totals is None:
+                totals = self._by_tool[tool_name] = ResourceTotals()
+            totals.add(usage)
+            totals = self._by_session.get(session)
+            if totals is None:
+                totals = self._by_session[session] = ResourceTotals()
+            totals.add(usage)
+
+    def by_tool(self) -> dict[str, ResourceTotals]:
+        """A copy of the totals per tool name."""
+        with self._lock:
+            return {name: _copy(totals) for name, totals in self._by_tool.items()}
+
+    def by_session(self) -> dict[str, ResourceTotals]:
+        """A copy of the totals per session."""
+        with self._lock:
+            return {name: _copy(totals) for name, totals in self._by_session.items()}
+
+    def total(self) -> ResourceTotals:
+        """Everything recorded so far."""
+        overall = ResourceTotals()
+        with self._lock:
+            for totals in self._by_tool.values():
+                overall.calls += totals.calls
+                overall.wall_seconds += totals.wall_seconds
+                overall.cpu_seconds += totals.cpu_seconds
+                overall.peak_memory_delta = max(overall.peak_memory_delta, totals.peak_memory_delta)
+                overall.bytes_read += totals.bytes_read
+                overall.bytes_written += totals.bytes_written
+        return overall
+
+    def reset(self) -> None:
+        with self._lock:
+            self._by_tool.clear()
+            self._by_session.clear()
+
+    def __repr__(self) -> str:
+        with self._lock:
+            return (
+                f"<ResourceAccounting tools={len(self._by_tool)} "
+                f"sessions={len(self._by_session)}>"
+            )
@@ -0,0 +1,311 @@
+"""
+execution/cache.py
+
+Content-addressed result cache for idempotent tools.
+
+A tool opts in by setting ``cacheable = True``. Its results are then keyed on
+a stable hash of (tool name, tool version, canonicalised arguments, tool
+supplied invalidation keys). Because invalidation keys — for example a
+file's mtime — are part of the hash, a change simply produces a new key and
+the stale entry ages out; nothing has to be purged explicitly.
+
+Tiers
+-----
+- memory : LRU dict bounded by `max_entries`, every entry expires after
+           `ttl_seconds`.
+- disk   : optional; one pickle per key under `directory`, same TTL. Hits
+           are promoted back into memory.
+
+Concurrent identical calls are coalesced: the first caller computes, the
+others block on the same Future and receive a copy of its result — when
+that result is one the cache would store; otherwise (a failure, an
+exception, a spilled output) they compute for themselves.
+
+Only successful results are stored — a failure is never replayed. Per-run
+metadata (``"resources"``, the usage measured for the run that produced the
+entry) is dropped before storing, so a hit never reports another run's
+usage. Results whose output was spilled to a file (`result.handle`) are
+neither stored nor handed to coalesced callers: each caller owns, and may
+delete, its own spill file, so those callers compute for themselves.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from core.tools.base import ToolResult
+
+if TYPE_CHECKING:
+    from core.tools.base import BaseTool
+
+logger = logging.getLogger(__name__)
+
+# Metadata describing one run rather than its result; never cached.
+_PER_RUN_METADATA = ("resources",)
+
+
+def _canonical(value: Any) -> str:
+    """Serialise `value` deterministically (sorted keys, no whitespace)."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=repr)
+
+
+def file_fingerprint(path: str | os.PathLike) -> tuple[str, int, int] | None:
+    """
+    Cheap invalidation key for a file: (resolved path, mtime_ns, size).
+
+    Returns None when the file does not exist, which is itself a valid key.
+    Intended for use inside `BaseTool.cache_keys`.
+    """
+    resolved = Path(path).resolve()
+    try:
+        stat = resolved.stat()
+    except OSError:
+        return None
+    return (str(resolved), stat.st_mtime_ns, stat.st_size)
+
+
+class ResultCache:
+    """
+    Two-tier (memory + optional disk) cache of successful ToolResults.
+
+    Parameters
+    ----------
+    max_entries : int          -- memory tier capacity (LRU eviction).
+    ttl_seconds : float        -- lifetime of every entry, in both tiers.
+    directory   : str | Path   -- enables the disk tier when given.
+
+    Example
+    -------
+    executor = ToolExecutor(registry, cache=ResultCache(ttl_seconds=60))
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300.0,
+        directory: str | os.PathLike | None = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive.")
+
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._directory = Path(directory) if directory is not None else None
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+
+        # key → (expires_at on the time.monotonic() clock, result)
+        self._memory: OrderedDict[str, tuple[float, ToolResult]] = OrderedDict()
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    # ------------------------------------------------------------------ #
+    #  Keys                                                                #
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def make_key(tool: "BaseTool", kwargs: dict[str, Any]) -> str:
+        """Stable content hash for a call to `tool` with `kwargs`."""
+        payload = _canonical([
+            tool.name,
+            tool.version,
+            kwargs,
+            list(tool.cache_keys(**kwargs)),
+        ])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------------ #
+    #  Lookup / store                                                      #
+    # ------------------------------------------------------------------ #
+
+    def get(self, key: str) -> ToolResult | None:
+        """Return a copy of the cached result, or None on a miss."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    return _copy_result(entry[1])
+                del self._memory[key]
+
+        result = self._disk_get(key)
+        if result is not None:
+            result = _stored_result(result)
+            self._memory_put(key, result)
+            return _copy_result(result)
+        return None
+
+    def put(self, key: str, result: ToolResult) -> None:
+        """Store a successful result. Failures and spilled outputs are ignored."""
+        if not result.success:
+            return
+        if result.handle is not None:
+            logger.debug("Not caching %s: its output was spilled to %s.", key[:12], result.handle.path)
+            return
+        stored = _stored_result(result)
+        self._memory_put(key, stored)
+        self._disk_put(key, stored)
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], ToolResult],
+    ) -> tuple[ToolResult, str]:
+        """
+        Return the cached result for `key`, computing it at most once.
+
+        Returns
+        -------
+        (result, source) where source is "hit", "coalesced" or "miss".
+        """
+        cached = self.get(key)
+        if cached is not None:
+            with self._lock:
+                self.hits += 1
+            return cached, "hit"
+
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            shared = future.result()
+            if shared is None:
+                # Nothing shareable: the leader failed, or spilled its output
+                # to a file that is not ours.
+                return compute(), "miss"
+            return _copy_result(shared), "coalesced"
+
+        try:
+            result = compute()
+            self.put(key, result)
+            shareable = result.success and result.handle is None
+            future.set_result(_stored_result(result) if shareable else None)
+            return result, "miss"
+        except BaseException:
+            future.set_result(None)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def invalidate(self, key: str) -> None:
+        """Drop `key` from both tiers."""
+        with self._lock:
+            self._memory.pop(key, None)
+        path = self._disk_path(key)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if self._directory is not None:
+            for path in self._directory.glob("*/*.pickle"):
+                path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------ #
+    #  Memory tier                                                         #
+    # ------------------------------------------------------------------ #
+
+    def _memory_put(self, key: str, result: ToolResult) -> None:
+        with self._lock:
+            self._memory[key] = (time.monotonic() + self._ttl, result)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._max_entries:
+                self._memory.popitem(last=False)
+
+    # ------------------------------------------------------------------ #
+    #  Disk tier                                                           #
+    #                                                                      #
+    #  Entries store a wall-clock expiry so they stay meaningful across    #
+    #  process restarts.                                                   #
+    # ------------------------------------------------------------------ #
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self._directory is None:
+            return None
+        return self._directory / key[:2] / f"{key}.pickle"
+
+    def _disk_get(self, key: str) -> ToolResult | None:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            with path.open("rb") as fh:
+                expires_at, result = pickle.load(fh)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Discarding unreadable cache entry %s: %s", path, exc)
+            path.unlink(missing_ok=True)
+            return None
+
+        if expires_at <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return result
+
+    def _disk_put(self, key: str, result: ToolResult) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    pickle.dump((time.time() + self._ttl, result), fh)
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Could not write cache entry %s: %s", path, exc)
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ResultCache entries={len(self)} hits={self.hits} "
+            f"misses={self.misses} coalesced={self.coalesced}>"
+        )
+
+
+def _copy_result(result: ToolResult) -> ToolResult:
+    """Copy with its own metadata dict so callers can't mutate the cache."""
+    return result.copy()
+
+
+def _stored_result(result: ToolResult) -> ToolResult:
+    """Copy of `result` without its per-run metadata."""
+    stored = result.copy()
+    if stored.has_metadata:
+        for key in _PER_RUN_METADATA:
+            stored.metadata.pop(key, None)
+    return stored
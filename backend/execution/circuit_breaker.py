@@ -0,0 +1,242 @@
+"""
+execution/circuit_breaker.py
+
+Per-tool circuit breakers.
+
+A tool that keeps failing — disk full, downstream down — would otherwise
+take the full lookup → validate → execute path on every call. Once its
+recent error rate (or slow-call rate) crosses a threshold, its breaker
+opens and ToolExecutor fails calls right after lookup with an
+`execution_short_circuited` event, without touching the tool. Breakers
+are keyed by the registered name, so a call through an alias or a
+corrected near-miss name hits the same breaker.
+
+States
+------
+    closed     normal operation; outcomes are recorded in a sliding
+               window of the last `window` executions.
+    open       every call is rejected until `open_seconds` have passed.
+    half_open  one probe call at a time is let through. `probes_to_close`
+               consecutive successful probes close the breaker; any failed
+               probe re-opens it. A probe that never reports back (e.g. it
+               failed validation) stops blocking after `open_seconds`.
+
+An execution counts as failed when the tool raised or returned
+`success=False`. It counts as slow when it took longer than
+`slow_call_seconds` (if set).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# While a half-open probe is in flight, rejected callers are told to retry
+# after this fraction of `open_seconds` (or when the probe counts as lost).
+PROBE_RETRY_FRACTION = 0.1
+
+
+class CircuitBreaker:
+    """
+    Breaker for a single tool. Thread-safe.
+
+    Parameters
+    ----------
+    name              : str          -- tool name, used in log messages.
+    failure_rate      : float        -- open when failures / window ≥ this.
+    slow_call_seconds : float | None -- executions slower than this are slow.
+    slow_call_rate    : float        -- open when slow calls / window ≥ this.
+    window            : int          -- number of recent executions considered.
+    min_calls         : int          -- don't judge until this many are recorded.
+    open_seconds      : float        -- how long to stay open before probing.
+    probes_to_close   : int          -- successful probes needed to close.
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        *,
+        failure_rate: float = 0.5,
+        slow_call_seconds: float | None = None,
+        slow_call_rate: float = 1.0,
+        window: int = 20,
+        min_calls: int = 5,
+        open_seconds: float = 30.0,
+        probes_to_close: int = 1,
+    ) -> None:
+        if not 0 < failure_rate <= 1 or not 0 < slow_call_rate <= 1:
+            raise ValueError("failure_rate and slow_call_rate must be in (0, 1].")
+        if window < 1 or not 1 <= min_calls <= window:
+            raise ValueError("Need window ≥ 1 and 1 ≤ min_calls ≤ window.")
+
+        self.name = name
+        self._failure_rate = failure_rate
+        self._slow_seconds = slow_call_seconds
+        self._slow_rate = slow_call_rate
+        self._min_calls = min_calls
+        self._open_seconds = open_seconds
+        self._probes_to_close = probes_to_close
+
+        self._lock = threading.Lock()
+        self._outcomes: deque[tuple[bool, bool]] = deque(maxlen=window)  # (failed, slow)
+        self._failures = 0
+        self._slow = 0
+        self._state = "closed"
+        self._opened_at = 0.0
+        self._probe_started_at: float | None = None
+        self._probe_successes = 0
+
+    @property
+    def state(self) -> str:
+        """Current state, advancing open → half_open once the cool-down passed."""
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            return self._state
+
+    def retry_after(self) -> float:
+        """
+        Seconds a rejected caller should wait: until the cool-down ends
+        when open, a short backoff while a half-open probe is in flight,
+        0 when a call would be let through.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._maybe_half_open(now)
+            if self._state == "open":
+                return max(0.0, self._opened_at + self._open_seconds - now)
+            if self._state == "half_open" and self._probe_started_at is not None:
+                lost_in = self._probe_started_at + self._open_seconds - now
+                return max(0.0, min(lost_in, self._open_seconds * PROBE_RETRY_FRACTION))
+            return 0.0
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed right now."""
+        with self._lock:
+            if self._state == "closed":
+                return True
+            now = time.monotonic()
+            self._maybe_half_open(now)
+            if self._state == "open":
+                return False
+            # half_open: one probe at a time; a probe that never reported
+            # back is considered lost after `open_seconds`.
+            if (
+                self._probe_started_at is None
+                or now - self._probe_started_at >= self._open_seconds
+            ):
+                self._probe_started_at = now
+                return True
+            return False
+
+    def record(self, success: bool, duration: float) -> None:
+        """Record the outcome of one execution."""
+        failed = not success
+        slow = self._slow_seconds is not None and duration > self._slow_seconds
+
+        with self._lock:
+            if self._state == "half_open":
+                self._probe_started_at = None
+                if failed or slow:
+                    self._trip("probe failed")
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self._probes_to_close:
+                        self._reset()
+                return
+            if self._state == "open":
+                return      # a call admitted before the breaker opened
+
+            if len(self._outcomes) == self._outcomes.maxlen:
+                old_failed, old_slow = self._outcomes[0]
+                self._failures -= old_failed
+                self._slow -= old_slow
+            self._outcomes.append((failed, slow))
+            self._failures += failed
+            self._slow += slow
+
+            calls = len(self._outcomes)
+            if calls < self._min_calls:
+                return
+            if self._failures / calls >= self._failure_rate:
+                self._trip(f"failure rate {self._failures}/{calls}")
+            elif self._slow_seconds is not None and self._slow / calls >= self._slow_rate:
+                self._trip(f"slow-call rate {self._slow}/{calls}")
+
+    # ------------------------------------------------------------------ #
+    #  Transitions (caller holds the lock)                                 #
+    # ------------------------------------------------------------------ #
+
+    def _maybe_half_open(self, now: float) -> None:
+        if self._state == "open" and now - self._opened_at >= self._open_seconds:
+            self._state = "half_open"
+            self._probe_started_at = None
+            self._probe_successes = 0
+
+    def _trip(self, reason: str) -> None:
+        logger.warning(
+            "Circuit for %r opened (%s); rejecting calls for %.1fs",
+            self.name, reason, self._open_seconds,
+        )
+        self._state = "open"
+        self._opened_at = time.monotonic()
+
+    def _reset(self) -> None:
+        logger.info("Circuit for %r closed after successful probe(s)", self.name)
+        self._state = "closed"
+        self._outcomes.clear()
+        self._failures = 0
+        self._slow = 0
+
+    def __repr__(self) -> str:
+        return f"<CircuitBreaker name={self.name!r} state={self.state!r}>"
+
+
+class CircuitBreakers:
+    """
+    One CircuitBreaker per tool name, created on the tool's first recorded
+    execution. Keyword arguments are the CircuitBreaker parameters applied
+    to every tool; `overrides` maps tool name → parameters for that tool.
+
+    Usage
+    -----
+    executor = ToolExecutor(
+        registry,
+        circuit_breakers=CircuitBreakers(failure_rate=0.5, open_seconds=10),
+    )
+    """
+
+    def __init__(self, *, overrides: dict[str, dict] | None = None, **defaults) -> None:
+        CircuitBreaker(**defaults)      # validate the parameters eagerly
+        self._defaults = defaults
+        self._overrides = dict(overrides or {})
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, tool_name: str) -> CircuitBreaker | None:
+        """The tool's breaker, or None if it has never executed."""
+        return self._breakers.get(tool_name)
+
+    def allow(self, tool_name: str) -> bool:
+        breaker = self._breakers.get(tool_name)
+        return breaker is None or breaker.allow()
+
+    def record(self, tool_name: str, success: bool, duration: float) -> None:
+        breaker = self._breakers.get(tool_name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(tool_name)
+                if breaker is None:
+                    params = {**self._defaults, **self._overrides.get(tool_name, {})}
+                    breaker = self._breakers[tool_name] = CircuitBreaker(tool_name, **params)
+        breaker.record(success, duration)
+
+    def states(self) -> dict[str, str]:
+        """Map of tool name → breaker state."""
+        return {name: breaker.state for name, breaker in self._breakers.items()}
+
+    def __repr__(self) -> str:
+        return f"<CircuitBreakers {self.states()}>"
@@ -0,0 +1,219 @@
+"""
+execution/events.py
+
+The record type of executor events.
+
+Events used to be plain dicts, built fresh with five keys for every stage
+of every call; at tens of thousands of executions per second that is a
+large share of the allocations the garbage collector has to walk. An
+Event keeps the standard fields in slots and allocates a dict only
+for extra keys ("progress", "chunk", "node", ...).
+
+Events stay dict-compatible: they are MutableMappings, so `event["stage"]`,
+`event.get(...)`, `event["node"] = ...`, `dict(event)` and `{**event}` all
+work as before. Consumers that serialise events (e.g. `json.dumps`) should
+go through `event.to_dict()`.
+
+Timing
+------
+Each execution has a Clock: one wall-clock anchor (`time.time_ns()`) taken
+together with a `time.perf_counter_ns()` reading. An event only records
+the monotonic nanosecond counter when it is created, plus the nanoseconds
+since the previous event of the same execution; stage durations are
+therefore exact and unaffected by wall-clock adjustments. The ISO-8601
+"timestamp" is derived from the anchor on first access and cached, so
+nothing is formatted for consumers that never read it.
+
+    offset_ns    nanoseconds since the execution started (its Clock)
+    elapsed_ns   nanoseconds since the previous event of the execution
+                 (since the start for the first one)
+
+ToolExecutor installs a Clock per `execute` / `execute_many` call with
+`clock_scope()`; events made outside one get a Clock of their own.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator
+
+FIELDS = ("type", "stage", "message", "tool", "timestamp", "offset_ns", "elapsed_ns")
+_FIELD_SET = frozenset(FIELDS)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class Clock:
+    """
+    Time base of one execution: a wall-clock anchor and the monotonic
+    reading taken with it.
+    """
+
+    __slots__ = ("wall_ns", "start_ns", "last_ns")
+
+    def __init__(self) -> None:
+        self.start_ns = time.perf_counter_ns()
+        self.wall_ns = time.time_ns()
+        self.last_ns = self.start_ns
+
+    def isoformat(self, ns: int) -> str:
+        """The monotonic reading `ns` as an ISO-8601 UTC timestamp (µs precision)."""
+        wall = self.wall_ns + (ns - self.start_ns)
+        return (_EPOCH + timedelta(microseconds=wall // 1000)).isoformat()
+
+
+_clock: ContextVar[Clock | None] = ContextVar("gladden_event_clock", default=None)
+
+
+def current_clock() -> Clock:
+    """The Clock of the execution in progress, or a new one."""
+    clock = _clock.get()
+    return clock if clock is not None else Clock()
+
+
+@contextmanager
+def clock_scope(clock: Clock | None = None) -> Iterator[Clock]:
+    """Time the events made in the enclosed block against one Clock."""
+    clock = clock if clock is not None else Clock()
+    reset = _clock.set(clock)
+    try:
+        yield clock
+    finally:
+        _clock.reset(reset)
+
+
+class Event(MutableMapping):
+    """
+    One execution event (see the event contract in execution/executor.py).
+
+    The standard fields are also available as attributes; `ns` is the
+    raw `perf_counter_ns()` reading the event was made at.
+    """
+
+    __slots__ = ("type", "stage", "message", "tool", "ns", "_previous_ns", "_clock",
+                 "_timestamp", "_extra")
+
+    def __init__(
+        self,
+        type: str,          # noqa: A002  (mirrors the "type" key)
+        stage: str,
+        message: str,
+        tool: str,
+        clock: Clock | None = None,
+        extra: dict[str, Any] | None = None,
+    ) -> None:
+        self.type = type
+        self.stage = stage
+        self.message = message
+        self.tool = tool
+        clock = self._clock = clock if clock is not None else current_clock()
+        # Keeps a reference to the previous reading rather than a second
+        # int. Progress events may come from a tool's own threads; a race
+        # here can only skew one `elapsed_ns`, never the offsets.
+        self._previous_ns = clock.last_ns
+        self.ns = clock.last_ns = time.perf_counter_ns()
+        self._timestamp: str | None = None
+        self._extra = extra
+
+    @property
+    def timestamp(self) -> str:
+        """ISO-8601 UTC time of the event, rendered on first access."""
+        timestamp = self._timestamp
+        if timestamp is None:
+            timestamp = self._timestamp = self._clock.isoformat(self.ns)
+        return timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: str) -> None:
+        self._timestamp = value
+
+    @property
+    def elapsed_ns(self) -> int:
+        return self.ns - self._previous_ns
+
+    @elapsed_ns.setter
+    def elapsed_ns(self, value: int) -> None:
+        self._previous_ns = self.ns - value
+
+    @property
+    def offset_ns(self) -> int:
+        return self.ns - self._clock.start_ns
+
+    @offset_ns.setter
+    def offset_ns(self, value: int) -> None:
+        self.ns = self._clock.start_ns + value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        if self._extra is not None:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _FIELD_SET:
+            setattr(self, key, value)
+        elif self._extra is None:
+            self._extra = {key: value}
+        else:
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in _FIELD_SET:
+            raise KeyError(f"{key!r} is a required event field")
+        if self._extra is None:
+            raise KeyError(key)
+        del self._extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from FIELDS
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return len(FIELDS) + (len(self._extra) if self._extra else 0)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _FIELD_SET or (self._extra is not None and key in self._extra)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def copy(self) -> "Event":
+        duplicate = Event.__new__(Event)
+        duplicate.type = self.type
+        duplicate.stage = self.stage
+        duplicate.message = self.message
+        duplicate.tool = self.tool
+        duplicate.ns = self.ns
+        duplicate._previous_ns = self._previous_ns
+        duplicate._clock = self._clock
+        duplicate._timestamp = self._timestamp
+        duplicate._extra = dict(self._extra) if self._extra else None
+        return duplicate
+
+    def to_dict(self) -> dict[str, Any]:
+        """A plain dict of every key (e.g. for JSON)."""
+        data = {
+            "type": self.type,
+            "stage": self.stage,
+            "message": self.message,
+            "tool": self.tool,
+            "timestamp": self.timestamp,
+            "offset_ns": self.offset_ns,
+            "elapsed_ns": self.elapsed_ns,
+        }
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def __repr__(self) -> str:
+        return f"Event({self.to_dict()!r})"
@@ -7,9 +7,44 @@ ever call tool.execute() directly.
 
 Responsibilities
 ----------------
-- Resolve a tool name to a registered BaseTool instance.
+- Resolve a tool name to a registered BaseTool instance, correcting
+  near-miss names ("File_Creation", "create_file") through
+  `ToolRegistry.resolve`; the correction is recorded in
+  ``result.metadata["name_resolution"]``.
+- Coerce inputs towards the tool's input_schema (e.g. "true" → True),
+  apply declared defaults and drop unknown keys.
 - Validate inputs before execution.
-- Run the tool and surface a standardised ToolResult.
+- Run the tool and surface a standardised ToolResult. The tool is leased
+  from the registry as it is looked up (`ToolRegistry.acquire`), so
+  replacing it (hot reload) defers its `teardown` until the execution is
+  over.
+- Serve repeated calls to cacheable tools from an optional ResultCache.
+- Run each invocation through the optional interceptors
+  (execution/interceptors.py) that apply to its tool: auth, rate limits,
+  auditing and the like, without touching this module.
+- Fail fast on tools whose optional circuit breaker is open.
+- Record per-stage latency histograms and outcome counters into an
+  optional MetricsRegistry.
+- Measure the CPU time, wall time, peak memory growth and I/O of each run
+  into ``result.metadata["resources"]``, aggregated per tool and session
+  by an optional ResourceAccounting.
+- Open tracing spans for each call and its stages. They nest under the
+  caller's trace (e.g. Agent.run) when one is in progress; an optional
+  Tracer lets the executor start traces of its own.
+- Profile selected executions (cProfile / tracemalloc) through an
+  optional Profiler.
+- Honour the run's CancellationToken (core/cancellation.py): calls are
+  refused once it is cancelled or past its deadline, and a tool raising
+  Cancelled yields a `cancelled` / `deadline_exceeded` result.
+- Turn progress reported by tools (core/tools/progress.py) into
+  rate-limited, coalesced `execution_progress` events.
+- Stream output from tools that implement `BaseTool.execute_stream`,
+  forwarding bounded `output_chunk` events.
+- Optionally spill outputs larger than `spill_threshold` to disk,
+  replacing them with an OutputHandle; logs and events only carry a
+  bounded preview.
+- Run many calls at once via `execute_many`, handing each tool's group to
+  `BaseTool.execute_batch` when the tool overrides it.
 - Catch and wrap any unexpected runtime exceptions so callers never
   receive a raw Python exception from tool code.
 - Emit structured execution events at every key stage via an optional
@@ -18,45 +53,93 @@ Responsibilities
 
 Event contract
 --------------
-Each event is a plain dict with a stable schema:
+Each event is an Event record (execution/events.py) — a slotted,
+dict-compatible mapping — with a stable schema:
 
     {
         "type":      "info" | "status" | "error",
         "stage":     "<stage_name>",
         "message":   "<human-readable description>",
         "tool":      "<tool_name>",
-        "timestamp": "<ISO-8601 UTC timestamp>"
+        "timestamp":  "<ISO-8601 UTC timestamp>",   ← rendered on first access
+        "offset_ns":  <ns since the call started>,
+        "elapsed_ns": <ns since the call's previous event>
     }
 
+Events are timed on the monotonic `perf_counter_ns()` clock against one
+wall-clock anchor per `execute` / `execute_many` call (execution/events.py),
+so stage durations are exact: `elapsed_ns` of `execution_completed` is the
+run time of the tool. In `execute_many` the offsets share the batch's
+anchor and `elapsed_ns` follows each call's own sequence of events.
+
 Stages emitted (in order of a successful execution):
     tool_lookup_started
+    tool_name_resolved      ← only when the requested name was not registered
+                              but resolved to a tool that is
     tool_lookup_completed
+    execution_short_circuited ← only when the resolved tool's circuit breaker
+                                is open; nothing else follows for that call
+    inputs_coerced          ← only when coercion changed at least one input
     validation_started
-    validation_failed       ← only when required inputs are missing
+    validation_failed       ← only when inputs are missing or malformed
+    cache_hit               ← only for cacheable tools; replaces the
+                              execution_* stages below
     execution_started
+    execution_progress      ← only when the tool reports progress; at most one
+                              per `progress_interval`, with a "progress" key
+                              holding done / total / unit / percent / message
+    output_chunk            ← streaming tools only, once per chunk; carries
+                              "chunk" (index) and "bytes" keys and at most
+                              CHUNK_PREVIEW_CHARS of the chunk as message
     execution_completed
     execution_failed        ← only when an unhandled exception is raised
+    execution_cancelled     ← instead of the remaining stages, when the run's
+                              token is cancelled or past its deadline;
+                              metadata["status"] is "cancelled" or
+                              "deadline_exceeded"
 """
 
 from __future__ import annotations
 
 import logging
+import time
 import traceback
-from datetime import datetime, timezone
-from typing import Any, Callable, Optional
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
 
-from core.tools.base import ToolResult
+from core.cancellation import Cancelled, current_token
+from core.tools.base import BaseTool, ToolResult
+from core.tools.progress import (
+    DEFAULT_MIN_INTERVAL,
+    ProgressReporter,
+    describe,
+    reset_reporter,
+    use_reporter,
+)
+from core.tools.output import PREVIEW_CHARS, OutputHandle, output_size, preview, spill
 from core.tools.registry import ToolRegistry
+from core.tools.resolver import DEFAULT_MIN_SCORE, NameMatch
+from core.tracing import Tracer, current_span, span
+from execution.accounting import Meter, ResourceAccounting
+from execution.cache import ResultCache
+from execution.circuit_breaker import CircuitBreakers
+from execution.events import Clock, Event, clock_scope
+from execution.interceptors import Handler, Interceptor, ToolCall, build_pipeline
+from execution.metrics import UNKNOWN_TOOL, MetricsRegistry
+from execution.profiling import Profiler
+from execution.streaming import OutputAssembler, chunk_preview
 
 logger = logging.getLogger(__name__)
 
 # Type alias for the callback — keeps signatures readable
-EventCallback = Optional[Callable[[dict], None]]
+EventCallback = Optional[Callable[[Event], None]]
 
 
-def _now() -> str:
-    """Return the current UTC time as an ISO-8601 string."""
-    return datetime.now(timezone.utc).isoformat()
+def _shown(output: Any) -> str:
+    """Output as shown in event messages: short text verbatim, else a preview."""
+    if isinstance(output, str) and len(output) <= PREVIEW_CHARS:
+        return output
+    return preview(output)
 
 
 def _make_event(
@@ -65,20 +148,17 @@ def _make_event(
     stage: str,
     message: str,
     tool: str,
-) -> dict:
+    clock: Clock | None = None,
+    **extra: Any,
+) -> Event:
     """
-    Build a fully-formed event dict.
+    Build a fully-formed event (a dict-compatible Event record).
 
     All fields are always present so consumers never have to guard against
-    missing keys.
+    missing keys. `extra` adds stage-specific keys ("progress", "chunk").
+    The event is timed against `clock`, by default the current call's.
     """
-    return {
-        "type":      type,
-        "stage":     stage,
-        "message":   message,
-        "tool":      tool,
-        "timestamp": _now(),
-    }
+    return Event(type, stage, message, tool, clock, extra or None)
 
 
 class ToolExecutor:
@@ -91,6 +171,39 @@ class ToolExecutor:
         The registry instance that holds all available tools.
         Injected at construction time so the executor is fully testable
         in isolation with a custom registry.
+    coerce_inputs : bool
+        Normalise inputs against the tool's input_schema before validation
+        (default True). Every change is listed in
+        ``result.metadata["coercions"]``.
+    cache : ResultCache, optional
+        Enables result caching for tools that declare ``cacheable = True``.
+        Omit to disable caching entirely.
+    circuit_breakers : CircuitBreakers, optional
+        Per-tool breakers, keyed by the registered tool name. A call that
+        resolves to a tool whose breaker is open is rejected right after
+        lookup with an ``execution_short_circuited`` event.
+    metrics : MetricsRegistry, optional
+        Receives lookup / validation / execution latency per tool and a
+        counter per outcome. Omit for zero recording overhead.
+    accounting : ResourceAccounting, optional
+        Measures the resources of every tool run (cache hits excluded) into
+        ``result.metadata["resources"]`` and totals them per tool and per
+        session. Omit to skip the measurement.
+    spill_threshold : int, optional
+        Outputs larger than this many bytes (streamed or returned) are
+        written to a file under `spill_dir` (default: the system temp
+        directory) and replaced by an OutputHandle. The file then belongs
+        to the caller, who must `delete()` the handle. Omit to keep every
+        output in memory.
+    resolve_names : bool
+        Run unknown tool names through `ToolRegistry.resolve` instead of
+        failing them (default True).
+    min_name_score : float
+        Similarity a fuzzy name match needs to be accepted.
+    interceptors : iterable of Interceptor, optional
+        Wrap every invocation, outermost first (see execution/interceptors.py).
+        Each tool's chain is built once, on its first call. Omit for zero
+        overhead.
 
     Example
     -------
@@ -114,15 +227,51 @@ class ToolExecutor:
     )
     """
 
-    def __init__(self, registry: ToolRegistry) -> None:
+    def __init__(
+        self,
+        registry: ToolRegistry,
+        *,
+        coerce_inputs: bool = True,
+        cache: ResultCache | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        metrics: MetricsRegistry | None = None,
+        accounting: ResourceAccounting | None = None,
+        tracer: Tracer | None = None,
+        profiler: Profiler | None = None,
+        spill_threshold: int | None = None,
+        spill_dir: str | Path | None = None,
+        progress_interval: float = DEFAULT_MIN_INTERVAL,
+        resolve_names: bool = True,
+        min_name_score: float = DEFAULT_MIN_SCORE,
+        interceptors: Iterable[Interceptor] = (),
+    ) -> None:
         self._registry = registry
+        self._coerce_inputs = coerce_inputs
+        self._cache = cache
+        self._breakers = circuit_breakers
+        self._metrics = metrics
+        self._accounting = accounting
+        # Without a tracer, spans only record inside a caller's trace.
+        self._span = tracer.start_span if tracer is not None else span
+        self._profiler = profiler
+        self._spill_threshold = spill_threshold
+        self._spill_dir = spill_dir
+        self._progress_interval = progress_interval
+        self._resolve_names = resolve_names
+        self._min_name_score = min_name_score
+        self._interceptors = tuple(interceptors)
+        # tool name → (instance, pipeline) for the registered instances only;
+        # pruned whenever the registry publishes a new snapshot, so replaced
+        # or unregistered tools (and their chains) are not kept alive.
+        self._pipelines: dict[str, tuple[BaseTool, Handler | None]] = {}
+        self._pipelines_version = -1
 
     # ------------------------------------------------------------------ #
     #  Internal helpers                                                    #
     # ------------------------------------------------------------------ #
 
     @staticmethod
-    def _emit(callback: EventCallback, event: dict) -> None:
+    def _emit(callback: EventCallback, event: Event) -> None:
         """
         Safely fire the callback with the event dict.
 
@@ -137,6 +286,20 @@ class ToolExecutor:
         except Exception as exc:  # noqa: BLE001
             logger.warning("event_callback raised an exception: %s", exc)
 
+    @staticmethod
+    def _with_resolution(result: ToolResult, requested: str, match: NameMatch | None) -> ToolResult:
+        """Record a corrected tool name in the result metadata."""
+        if match is not None:
+            result.metadata["name_resolution"] = match.describe(requested)
+        return result
+
+    @staticmethod
+    def _with_coercions(result: ToolResult, coercions: list[str]) -> ToolResult:
+        """Record the coercions applied to this call in the result metadata."""
+        if coercions:
+            result.metadata["coercions"] = coercions
+        return result
+
     # ------------------------------------------------------------------ #
     #  Public API                                                          #
     # ------------------------------------------------------------------ #
@@ -167,10 +330,285 @@ class ToolExecutor:
             Always returned — never raises.
         """
 
-        # ── Stage 1: tool_lookup_started ──────────────────────────────── #
         logger.info("Executor received request → tool=%r  inputs=%s",
                     tool_name, list(kwargs.keys()))
 
+        with self._span("tool.execute", tool=tool_name) as trace_span, clock_scope():
+            if self._profiler is None:
+                result = self._execute(tool_name, kwargs, event_callback)
+            else:
+                with self._profiler.profile(tool_name) as profile:
+                    result = self._execute(tool_name, kwargs, event_callback)
+                if profile is not None:
+                    result.metadata["profile_id"] = profile.id
+            if not result.success:
+                trace_span.record_error(result.error or "failed")
+            return result
+
+    def _execute(
+        self,
+        tool_name: str,
+        kwargs: dict[str, Any],
+        event_callback: EventCallback,
+    ) -> ToolResult:
+        """Body of `execute`, run inside its span."""
+        token = current_token()
+        if token.cancelled:
+            return self._cancelled(tool_name, token.status, token.reason, event_callback)
+
+        tool, match, failure = self._lookup(tool_name, event_callback)
+        if failure is not None:
+            return failure
+
+        # Leased by the lookup, so a hot-replaced tool is torn down only
+        # once this call is done with it.
+        try:
+            # Checked on the resolved name: outcomes are recorded under it.
+            if self._breakers is not None and not self._breakers.allow(tool.name):
+                result = self._short_circuit(tool.name, event_callback)
+                return self._with_resolution(result, tool_name, match)
+
+            kwargs, coercions, failure = self._prepare(tool, kwargs, event_callback)
+            if failure is not None:
+                result = failure
+            elif token.cancelled:
+                result = self._cancelled(tool.name, token.status, token.reason, event_callback)
+            else:
+                # ── Stage 4: execution (served from cache when possible) ── #
+                pipeline = self._pipeline(tool) if self._interceptors else None
+                if pipeline is not None:
+                    result = self._intercepted(pipeline, tool, kwargs, event_callback)
+                elif self._cache is not None and tool.cacheable:
+                    result = self._invoke_cached(tool, kwargs, event_callback)
+                else:
+                    result = self._invoke(tool, kwargs, event_callback)
+        finally:
+            self._registry.release(tool)
+
+        result = self._with_resolution(result, tool_name, match)
+        return self._with_coercions(result, coercions)
+
+    def execute_many(
+        self,
+        calls: Iterable[tuple[str, dict[str, Any]]],
+        *,
+        event_callback: EventCallback = None,
+    ) -> list[ToolResult]:
+        """
+        Execute many tool calls, amortising per-call overhead.
+
+        Calls are grouped by tool: each tool is looked up once and its
+        calls are coerced and validated together. When a tool overrides
+        `BaseTool.execute_batch`, all of its valid calls go to it in a
+        single invocation; otherwise they run one by one.
+
+        Parameters
+        ----------
+        calls : iterable of (tool_name, kwargs)
+            The calls to run.
+        event_callback : callable, optional
+            Receives the same per-call events as `execute` would emit.
+            Events are delivered once the batch finishes, grouped per call
+            and in input order.
+
+        Returns
+        -------
+        list[ToolResult]
+            One result per call, in input order — never raises.
+        """
+        calls = list(calls)
+        results: list[ToolResult | None] = [None] * len(calls)
+
+        # Per-call event buffers, flushed in input order at the end.
+        buffers: list[list[Event]] = [[] for _ in calls]
+        callbacks: list[EventCallback] = [
+            buffer.append if event_callback is not None else None
+            for buffer in buffers
+        ]
+
+        groups: dict[str, list[int]] = {}
+        for index, (tool_name, _) in enumerate(calls):
+            groups.setdefault(tool_name, []).append(index)
+
+        logger.info("Executor received batch → %d call(s) across tools=%s",
+                    len(calls), list(groups))
+
+        clock = Clock()
+        with self._span("tool.execute_many", calls=len(calls), tools=list(groups)):
+            with clock_scope(clock):
+                self._execute_groups(calls, groups, results, buffers, callbacks, event_callback)
+
+        if event_callback is not None:
+            for buffer in buffers:
+                previous = clock.start_ns
+                for event in buffer:
+                    # Calls interleave on the shared clock; time each
+                    # against its own previous event instead.
+                    event._previous_ns, previous = previous, event.ns
+                    self._emit(callback=event_callback, event=event)
+
+        return results  # type: ignore[return-value]
+
+    def _execute_groups(
+        self,
+        calls: list[tuple[str, dict[str, Any]]],
+        groups: dict[str, list[int]],
+        results: list[ToolResult | None],
+        buffers: list[list[Event]],
+        callbacks: list[EventCallback],
+        event_callback: EventCallback,
+    ) -> None:
+        """Run each tool's group of calls for `execute_many`."""
+        token = current_token()
+        for tool_name, indices in groups.items():
+            if token.cancelled:
+                for index in indices:
+                    results[index] = self._cancelled(
+                        tool_name, token.status, token.reason, callbacks[index]
+                    )
+                continue
+
+            # ── Stages 1–2: one lookup per tool ──────────────────────── #
+            lookup_events: list[Event] = []
+            tool, match, failure = self._lookup(
+                tool_name, lookup_events.append if event_callback is not None else None
+            )
+            for index in indices:
+                buffers[index].extend(event.copy() for event in lookup_events)
+            if failure is not None:
+                for index in indices:
+                    results[index] = ToolResult(success=False, error=failure.error)
+                continue
+
+            try:                    # the lookup leased the tool
+                self._run_group(tool, tool_name, match, calls, indices, results, callbacks)
+            finally:
+                self._registry.release(tool)
+
+    def _run_group(
+        self,
+        tool: BaseTool,
+        tool_name: str,
+        match: NameMatch | None,
+        calls: list[tuple[str, dict[str, Any]]],
+        indices: list[int],
+        results: list[ToolResult | None],
+        callbacks: list[EventCallback],
+    ) -> None:
+        """Run the calls of one looked-up (and leased) tool for `_execute_groups`."""
+        if self._breakers is not None and not self._breakers.allow(tool.name):
+            for index in indices:
+                result = self._short_circuit(tool.name, callbacks[index])
+                results[index] = self._with_resolution(result, tool_name, match)
+            return
+
+        # ── Stages 2a–3: coerce and validate each call ───────────── #
+        ready: list[tuple[int, dict[str, Any], list[str]]] = []
+        for index in indices:
+            kwargs, coercions, failure = self._prepare(
+                tool, calls[index][1], callbacks[index]
+            )
+            if failure is not None:
+                failure = self._with_resolution(failure, tool_name, match)
+                results[index] = self._with_coercions(failure, coercions)
+            else:
+                ready.append((index, kwargs, coercions))
+        if not ready:
+            return
+
+        # ── Stages 4–5: one batch, or one call at a time ─────────── #
+        # Intercepted tools run call by call: interceptors see single calls.
+        pipeline = self._pipeline(tool) if self._interceptors else None
+        batched = (
+            type(tool).execute_batch is not BaseTool.execute_batch
+            and not (self._cache is not None and tool.cacheable)
+            and pipeline is None
+        )
+        if pipeline is not None:
+            outcomes = [
+                self._intercepted(pipeline, tool, kwargs, callbacks[index])
+                for index, kwargs, _ in ready
+            ]
+        elif batched:
+            outcomes = self._invoke_batch(
+                tool,
+                [kwargs for _, kwargs, _ in ready],
+                [callbacks[index] for index, _, _ in ready],
+            )
+        else:
+            invoke = (
+                self._invoke_cached
+                if self._cache is not None and tool.cacheable
+                else self._invoke
+            )
+            outcomes = [
+                invoke(tool, kwargs, callbacks[index]) for index, kwargs, _ in ready
+            ]
+
+        for (index, _, coercions), result in zip(ready, outcomes):
+            result = self._with_resolution(result, tool_name, match)
+            results[index] = self._with_coercions(result, coercions)
+
+    # ------------------------------------------------------------------ #
+    #  Execution stages                                                    #
+    # ------------------------------------------------------------------ #
+
+    def _short_circuit(self, tool_name: str, event_callback: EventCallback) -> ToolResult:
+        """Reject a call because the tool's circuit breaker is open."""
+        breaker = self._breakers.get(tool_name)
+        retry_after = breaker.retry_after() if breaker is not None else 0.0
+        msg = (
+            f"Tool '{tool_name}' is temporarily unavailable: its circuit breaker is open "
+            f"after repeated failures. Retry in {retry_after:.1f}s."
+        )
+        logger.warning(msg)
+        self._count(tool_name, "short_circuited")
+        self._emit(callback=event_callback, event=_make_event(
+            type="error",
+            stage="execution_short_circuited",
+            message=msg,
+            tool=tool_name,
+        ))
+        return ToolResult(
+            success=False,
+            error=msg,
+            metadata={"circuit": "open", "retry_after": retry_after},
+        )
+
+    def _cancelled(
+        self,
+        tool_name: str,
+        status: str,
+        reason: str | None,
+        event_callback: EventCallback,
+    ) -> ToolResult:
+        """Finish a call whose run was cancelled or ran out of time."""
+        msg = f"Tool '{tool_name}' {status.replace('_', ' ')}: {reason or status}"
+        logger.warning(msg)
+        self._count(self._label(tool_name), status)      # may precede the lookup
+        self._emit(callback=event_callback, event=_make_event(
+            type="error",
+            stage="execution_cancelled",
+            message=msg,
+            tool=tool_name,
+        ))
+        return ToolResult(success=False, error=msg, metadata={"status": status})
+
+    def _lookup(
+        self,
+        tool_name: str,
+        event_callback: EventCallback,
+    ) -> tuple[BaseTool | None, NameMatch | None, ToolResult | None]:
+        """
+        Resolve the tool (stages 1–2).
+
+        Returns (tool, match, None) on success — match is set when the
+        name had to be corrected — or (None, None, failure) when no
+        registered tool fits the name. The tool is returned leased
+        (`ToolRegistry.acquire`); the caller must `release` it.
+        """
+
+        # ── Stage 1: tool_lookup_started ──────────────────────────────── #
         self._emit(callback=event_callback, event=_make_event(
             type="info",
             stage="tool_lookup_started",
@@ -178,13 +616,30 @@ class ToolExecutor:
             tool=tool_name,
         ))
 
-        tool = self._registry.get_or_none(tool_name)
+        with span("tool.lookup", tool=tool_name) as trace_span:
+            started = time.perf_counter()
+            tool = self._registry.acquire(tool_name)
+            match = None
+            if tool is None and self._resolve_names and tool_name not in self._registry:
+                match = self._registry.resolve(tool_name, self._min_name_score)
+                if match is not None:
+                    tool = self._registry.acquire(match.name)
+                    trace_span.set_attribute("resolved", match.name)
+            self._observe(
+                tool.name if tool is not None else self._label(tool_name),
+                "lookup",
+                time.perf_counter() - started,
+            )
 
         if tool is None:
-            msg = (
-                f"Tool '{tool_name}' is not registered. "
-                f"Available: {self._registry.list_names()}"
-            )
+            self._count(self._label(tool_name), "not_found")
+            if tool_name in self._registry:
+                msg = f"Tool '{tool_name}' is registered but failed to load; see the logs."
+            else:
+                msg = (
+                    f"Tool '{tool_name}' is not registered. "
+                    f"Available: {self._registry.list_names()}"
+                )
             logger.warning(msg)
             self._emit(callback=event_callback, event=_make_event(
                 type="error",
@@ -192,28 +647,80 @@ class ToolExecutor:
                 message=msg,
                 tool=tool_name,
             ))
-            return ToolResult(success=False, error=msg)
+            return None, None, ToolResult(success=False, error=msg)
+
+        # ── Stage 1a: tool_name_resolved ──────────────────────────────── #
+        if match is not None:
+            msg = (
+                f"Tool '{tool_name}' is not registered; using '{match.name}' "
+                f"({match.method} match, score {match.score:.2f})."
+            )
+            logger.info(msg)
+            if self._metrics is not None:
+                self._metrics.increment(
+                    "tool_name_resolutions_total", tool=match.name, method=match.method
+                )
+            self._emit(callback=event_callback, event=_make_event(
+                type="info",
+                stage="tool_name_resolved",
+                message=msg,
+                tool=match.name,
+            ))
 
         # ── Stage 2: tool_lookup_completed ────────────────────────────── #
         self._emit(callback=event_callback, event=_make_event(
             type="status",
             stage="tool_lookup_completed",
-            message=f"Tool '{tool_name}' found successfully.",
-            tool=tool_name,
+            message=f"Tool '{tool.name}' found successfully.",
+            tool=tool.name,
         ))
+        return tool, match, None
 
-        # ── Stage 3: validation_started ───────────────────────────────── #
-        self._emit(callback=event_callback, event=_make_event(
-            type="info",
-            stage="validation_started",
-            message=f"Validating inputs for tool '{tool_name}'.",
-            tool=tool_name,
-        ))
+    def _prepare(
+        self,
+        tool: BaseTool,
+        kwargs: dict[str, Any],
+        event_callback: EventCallback,
+    ) -> tuple[dict[str, Any], list[str], ToolResult | None]:
+        """
+        Coerce and validate inputs (stages 2a–3).
+
+        Returns (kwargs, coercions, failure) — failure is None when the
+        inputs are valid and the tool may run.
+        """
+        tool_name = tool.name
+        with span("tool.validate", tool=tool_name) as trace_span:
+            started = time.perf_counter()
 
-        missing = tool.validate_inputs(kwargs)
+            # ── Stage 2a: inputs_coerced ──────────────────────────────── #
+            coercions: list[str] = []
+            if self._coerce_inputs:
+                kwargs, coercions = tool.validator.coerce(kwargs)
+                if coercions:
+                    logger.info("Coerced inputs for %r: %s", tool_name, coercions)
+                    self._emit(callback=event_callback, event=_make_event(
+                        type="info",
+                        stage="inputs_coerced",
+                        message=f"Coerced inputs for '{tool_name}': {'; '.join(coercions)}",
+                        tool=tool_name,
+                    ))
 
-        if missing:
-            msg = f"Missing required input(s) for '{tool_name}': {', '.join(missing)}"
+            # ── Stage 3: validation_started ───────────────────────────── #
+            self._emit(callback=event_callback, event=_make_event(
+                type="info",
+                stage="validation_started",
+                message=f"Validating inputs for tool '{tool_name}'.",
+                tool=tool_name,
+            ))
+
+            errors = tool.validator.validate(kwargs)
+            self._observe(tool_name, "validation", time.perf_counter() - started)
+            if errors:
+                trace_span.set_attribute("errors", len(errors))
+
+        if errors:
+            self._count(tool_name, "invalid")
+            msg = f"Invalid input(s) for '{tool_name}': {'; '.join(errors)}"
             logger.warning(msg)
 
             # ── Stage 3a: validation_failed ───────────────────────────── #
@@ -223,7 +730,18 @@ class ToolExecutor:
                 message=msg,
                 tool=tool_name,
             ))
-            return ToolResult(success=False, error=msg)
+            return kwargs, coercions, ToolResult(success=False, error=msg)
+
+        return kwargs, coercions, None
+
+    def _invoke(
+        self,
+        tool: BaseTool,
+        kwargs: dict[str, Any],
+        event_callback: EventCallback,
+    ) -> ToolResult:
+        """Run the tool itself (stages 4–5), wrapping any exception."""
+        tool_name = tool.name
 
         # ── Stage 4: execution_started ────────────────────────────────── #
         self._emit(callback=event_callback, event=_make_event(
@@ -233,13 +751,30 @@ class ToolExecutor:
             tool=tool_name,
         ))
 
+        reporter = self._reporter(tool_name, event_callback)
+        token = use_reporter(reporter) if reporter is not None else None
+        meter = self._accounting.meter() if self._accounting is not None else None
+        started = time.perf_counter()
         try:
-            result = tool.execute(**kwargs)
+            with span("tool.run", tool=tool_name):
+                if type(tool).execute_stream is not BaseTool.execute_stream:
+                    result = self._stream(tool, kwargs, event_callback)
+                else:
+                    result = self._spill_large(tool.execute(**kwargs))
+            if reporter is not None:
+                reporter.flush()            # the last coalesced update
+
+        except Cancelled as exc:
+            self._observe(tool_name, "execution", time.perf_counter() - started)
+            return self._charge(
+                tool_name, meter, self._cancelled(tool_name, exc.status, str(exc), event_callback)
+            )
 
         except Exception as exc:  # noqa: BLE001
             tb = traceback.format_exc()
             msg = f"Unexpected error in tool '{tool_name}': {exc}"
             logger.error("%s\n%s", msg, tb)
+            self._record_outcome(tool_name, "error", time.perf_counter() - started)
 
             # ── Stage 4a: execution_failed ────────────────────────────── #
             self._emit(callback=event_callback, event=_make_event(
@@ -248,30 +783,324 @@ class ToolExecutor:
                 message=msg,
                 tool=tool_name,
             ))
-            return ToolResult(
-                success=False,
-                error=msg,
-                metadata={"traceback": tb},
+            return self._charge(
+                tool_name, meter, ToolResult(success=False, error=msg, metadata={"traceback": tb})
             )
 
+        finally:
+            if token is not None:
+                reset_reporter(token)
+
+        self._record_outcome(
+            tool_name,
+            "success" if result.success else "failure",
+            time.perf_counter() - started,
+        )
+        self._charge(tool_name, meter, result)
+
         # ── Stage 5: execution_completed ──────────────────────────────── #
+        self._completed(tool_name, result, event_callback)
+        return result
+
+    def _reporter(self, tool_name: str, event_callback: EventCallback) -> ProgressReporter | None:
+        """
+        A progress reporter that turns the tool's reports into
+        `execution_progress` events, or None when nobody is listening.
+        """
+        if event_callback is None:
+            return None
+
+        def emit(snapshot: dict[str, Any]) -> None:
+            self._emit(callback=event_callback, event=_make_event(
+                type="info",
+                stage="execution_progress",
+                message=f"Tool '{tool_name}': {describe(snapshot)}",
+                tool=tool_name,
+                progress=snapshot,
+            ))
+
+        return ProgressReporter(emit, min_interval=self._progress_interval)
+
+    def _stream(
+        self,
+        tool: BaseTool,
+        kwargs: dict[str, Any],
+        event_callback: EventCallback,
+    ) -> ToolResult:
+        """
+        Drive `tool.execute_stream`, emitting one `output_chunk` event per
+        chunk and assembling the output (spilled to disk past the
+        threshold). The run's token is checked between chunks. Exceptions
+        propagate to `_invoke` after any spill file is removed.
+        """
+        assembler = OutputAssembler(self._spill_threshold, self._spill_dir)
+        token = current_token()
+        stream = tool.execute_stream(**kwargs)
+        try:
+            while True:
+                try:
+                    chunk = next(stream)
+                except StopIteration as stop:
+                    returned = stop.value
+                    break
+                token.check()
+                size = assembler.size
+                assembler.write(chunk)
+                self._emit(callback=event_callback, event=_make_event(
+                    type="info",
+                    stage="output_chunk",
+                    message=chunk_preview(chunk),
+                    tool=tool.name,
+                    chunk=assembler.chunks - 1,
+                    bytes=assembler.size - size,    # encoded size, as in output_bytes
+                ))
+        except BaseException:
+            stream.close()
+            assembler.discard()
+            raise
+
+        result = returned if isinstance(returned, ToolResult) else ToolResult(success=True)
+        output = assembler.finish()
+        result.metadata.update(streamed_chunks=assembler.chunks, output_bytes=assembler.size)
+        if isinstance(output, OutputHandle):
+            result.metadata["spilled_to"] = str(output.path)
+        result.output = output
+        return result
+
+    def _spill_large(self, result: ToolResult) -> ToolResult:
+        """Replace a str/bytes output above the spill threshold with a handle."""
+        if self._spill_threshold is None:
+            return result
+        size = output_size(result.output)
+        if size is not None and size > self._spill_threshold:
+            handle = spill(result.output, self._spill_dir)
+            logger.info("Spilled %d-byte output to %s", size, handle.path)
+            result.output = handle
+            result.metadata.update(spilled_to=str(handle.path), output_bytes=size)
+        return result
+
+    def _record_outcome(self, tool_name: str, outcome: str, duration: float) -> None:
+        """
+        Feed an execution outcome ("success" | "failure" | "error") to the
+        tool's circuit breaker and to the metrics, if configured.
+        """
+        if self._breakers is not None:
+            self._breakers.record(tool_name, outcome == "success", duration)
+        self._observe(tool_name, "execution", duration)
+        self._count(tool_name, outcome)
+
+    def _charge(self, tool_name: str, meter: Meter | None, result: ToolResult) -> ToolResult:
+        """Stop `meter` and account the run's resources to `result` and the totals."""
+        if meter is not None:
+            usage = meter.stop()
+            result.metadata["resources"] = usage.as_dict()
+            self._accounting.record(tool_name, usage)
+        return result
+
+    def _charge_batch(
+        self,
+        tool_name: str,
+        meter: Meter | None,
+        results: list[ToolResult],
+    ) -> list[ToolResult]:
+        """Like `_charge`, splitting one batch's usage evenly across its calls."""
+        if meter is not None:
+            share = meter.stop().split(len(results))
+            for result in results:
+                result.metadata["resources"] = share.as_dict()
+                self._accounting.record(tool_name, share)
+        return results
+
+    def _label(self, tool_name: str) -> str:
+        """
+        Metrics label for a requested, unresolved name: the name when it is
+        registered, else UNKNOWN_TOOL — arbitrary names from the model must
+        not become label values.
+        """
+        return tool_name if tool_name in self._registry else UNKNOWN_TOOL
+
+    def _observe(self, tool_name: str, stage: str, seconds: float) -> None:
+        if self._metrics is not None:
+            self._metrics.observe(
+                "tool_stage_duration_seconds", seconds, tool=tool_name, stage=stage
+            )
+
+    def _count(self, tool_name: str, outcome: str) -> None:
+        if self._metrics is not None:
+            self._metrics.increment("tool_executions_total", tool=tool_name, outcome=outcome)
+
+    def _completed(self, tool_name: str, result: ToolResult, event_callback: EventCallback) -> None:
+        """Log the outcome and emit `execution_completed` (stage 5)."""
         log_fn = logger.info if result.success else logger.warning
         log_fn(
-            "Tool %r finished — success=%s  output=%r",
-            tool_name, result.success, result.output,
+            "Tool %r finished — success=%s  output=%s",
+            tool_name, result.success, preview(result.output),
         )
 
         self._emit(callback=event_callback, event=_make_event(
             type="status" if result.success else "error",
             stage="execution_completed",
             message=(
-                f"Tool '{tool_name}' completed successfully. Output: {result.output}"
+                f"Tool '{tool_name}' completed successfully. Output: {_shown(result.output)}"
                 if result.success
                 else f"Tool '{tool_name}' returned a failure: {result.error}"
             ),
             tool=tool_name,
         ))
 
+    def _invoke_batch(
+        self,
+        tool: BaseTool,
+        kwargs_list: list[dict[str, Any]],
+        callbacks: list[EventCallback],
+    ) -> list[ToolResult]:
+        """
+        Run a whole group through `tool.execute_batch` in one invocation.
+
+        Per-call events are still emitted through each call's own callback.
+        If the batch raises, every call in it fails with the same error.
+        """
+        tool_name = tool.name
+
+        for callback in callbacks:
+            self._emit(callback=callback, event=_make_event(
+                type="status",
+                stage="execution_started",
+                message=f"Executing tool '{tool_name}' (batch of {len(kwargs_list)}).",
+                tool=tool_name,
+            ))
+
+        meter = self._accounting.meter() if self._accounting is not None else None
+        started = time.perf_counter()
+        try:
+            with span("tool.run_batch", tool=tool_name, calls=len(kwargs_list)):
+                results = tool.execute_batch(kwargs_list)
+            if len(results) != len(kwargs_list):
+                raise RuntimeError(
+                    f"execute_batch returned {len(results)} result(s) "
+                    f"for {len(kwargs_list)} call(s)"
+                )
+
+        except Exception as exc:  # noqa: BLE001
+            tb = traceback.format_exc()
+            msg = f"Unexpected error in tool '{tool_name}': {exc}"
+            logger.error("%s\n%s", msg, tb)
+            per_call = (time.perf_counter() - started) / len(kwargs_list)
+            for _ in kwargs_list:
+                self._record_outcome(tool_name, "error", per_call)
+
+            for callback in callbacks:
+                self._emit(callback=callback, event=_make_event(
+                    type="error",
+                    stage="execution_failed",
+                    message=msg,
+                    tool=tool_name,
+                ))
+            failures = [
+                ToolResult(success=False, error=msg, metadata={"traceback": tb})
+                for _ in kwargs_list
+            ]
+            return self._charge_batch(tool_name, meter, failures)
+
+        per_call = (time.perf_counter() - started) / len(kwargs_list)
+        self._charge_batch(tool_name, meter, results)
+        for result, callback in zip(results, callbacks):
+            self._spill_large(result)
+            self._record_outcome(
+                tool_name, "success" if result.success else "failure", per_call
+            )
+            self._completed(tool_name, result, callback)
+        return results
+
+    def _pipeline(self, tool: BaseTool) -> Handler | None:
+        """The interceptor pipeline of this tool instance, built on first use."""
+        snapshot = self._registry.snapshot()
+        if snapshot.version != self._pipelines_version:
+            self._pipelines = {
+                name: entry for name, entry in self._pipelines.items()
+                if snapshot.tools.get(name) is entry[0]
+            }
+            self._pipelines_version = snapshot.version
+        entry = self._pipelines.get(tool.name)
+        if entry is not None and entry[0] is tool:
+            return entry[1]
+        invoke = self._invoke_cached if self._cache is not None and tool.cacheable else self._invoke
+
+        def terminal(call: ToolCall) -> ToolResult:
+            return invoke(call.tool, call.kwargs, call.event_callback)
+
+        pipeline = build_pipeline(self._interceptors, tool, terminal)
+        if snapshot.tools.get(tool.name) is tool:     # not an instance being retired
+            self._pipelines[tool.name] = (tool, pipeline)
+        return pipeline
+
+    def _intercepted(
+        self,
+        pipeline: Handler,
+        tool: BaseTool,
+        kwargs: dict[str, Any],
+        event_callback: EventCallback,
+    ) -> ToolResult:
+        """Run the call through its interceptors, wrapping any exception they raise."""
+        try:
+            result = pipeline(ToolCall(tool, kwargs, event_callback))
+            if not isinstance(result, ToolResult):
+                raise TypeError(f"an interceptor returned {type(result).__name__}, not a ToolResult")
+            return result
+
+        except Cancelled as exc:
+            return self._cancelled(tool.name, exc.status, str(exc), event_callback)
+
+        except Exception as exc:  # noqa: BLE001
+            tb = traceback.format_exc()
+            msg = f"Interceptor error for tool '{tool.name}': {exc}"
+            logger.error("%s\n%s", msg, tb)
+            self._count(tool.name, "interceptor_error")
+            self._emit(callback=event_callback, event=_make_event(
+                type="error",
+                stage="execution_failed",
+                message=msg,
+                tool=tool.name,
+            ))
+            return ToolResult(success=False, error=msg, metadata={"traceback": tb})
+
+    def _invoke_cached(
+        self,
+        tool: BaseTool,
+        kwargs: dict[str, Any],
+        event_callback: EventCallback,
+    ) -> ToolResult:
+        """
+        Serve the call from the result cache, running the tool on a miss.
+        If the key can't be computed (`cache_keys` raised), the call runs
+        uncached.
+        """
+        try:
+            key = self._cache.make_key(tool, kwargs)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "Cache key for tool %r failed (%s); running it uncached.", tool.name, exc
+            )
+            return self._invoke(tool, kwargs, event_callback)
+        result, source = self._cache.get_or_compute(
+            key, lambda: self._invoke(tool, kwargs, event_callback)
+        )
+        if source == "miss":
+            return result
+
+        current_span().set_attribute("cache", source)
+        self._count(tool.name, "cached")
+        logger.info("Tool %r served from cache (%s) key=%s", tool.name, source, key[:12])
+        self._emit(callback=event_callback, event=_make_event(
+            type="status",
+            stage="cache_hit",
+            message=(
+                f"Tool '{tool.name}' result served from cache"
+                + (" (coalesced with an in-flight call)." if source == "coalesced" else ".")
+            ),
+            tool=tool.name,
+        ))
+        result.metadata["cache"] = source
         return result
 
     # ------------------------------------------------------------------ #
@@ -0,0 +1,470 @@
+"""
+execution/graph.py
+
+Dependency-aware execution of a graph of tool calls.
+
+A ToolGraph is a set of named steps. A step's arguments may reference the
+`ToolResult.output` of earlier steps, either with `ref("step_id")` in Python
+or with `{"$ref": "step_id"}` in JSON-shaped plans (e.g. produced by the LLM).
+References may sit anywhere inside nested dicts/lists and may pick a key or
+index out of the output: `ref("stat", "size_bytes")` /
+`{"$ref": "stat", "key": "size_bytes"}`.
+
+GraphExecutor runs the graph through a ToolExecutor — every step still goes
+through lookup → coercion → validation → execution — dispatching each step
+to a thread pool as soon as all of its dependencies have finished, so
+independent branches run concurrently.
+
+Failure policies
+----------------
+    "fail_fast"        first failure stops scheduling; pending steps are
+                       reported as cancelled.
+    "skip_dependents"  (default) steps that depend, directly or
+                       transitively, on a failed step are skipped;
+                       everything else still runs.
+    "continue"         every step runs; references to a failed step
+                       resolve to None.
+
+Node events
+-----------
+Besides the executor's own per-stage events, each step emits node_started,
+node_completed, node_failed, node_skipped or node_cancelled. Every event
+from a graph run carries an extra "node" key with the step id. Callbacks are
+serialised, so consumers never see two events at once.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+from core.tools.base import ToolResult
+from execution.events import Clock, Event
+from execution.executor import EventCallback, ToolExecutor, _make_event
+
+logger = logging.getLogger(__name__)
+
+FAILURE_POLICIES = frozenset({"fail_fast", "skip_dependents", "continue"})
+
+# Parameters of ToolExecutor.execute; a step can't pass them as tool inputs.
+RESERVED_ARGUMENTS = frozenset({"tool_name", "event_callback"})
+
+
+# --------------------------------------------------------------------------- #
+#  Graph definition                                                            #
+# --------------------------------------------------------------------------- #
+
+@dataclass(frozen=True)
+class StepRef:
+    """Placeholder for another step's output (optionally one key/index of it)."""
+
+    step_id: str
+    key: Any = None
+
+
+def ref(step_id: str, key: Any = None) -> StepRef:
+    """Reference the output of `step_id` inside another step's arguments."""
+    return StepRef(step_id, key)
+
+
+@dataclass
+class Step:
+    """One node of a ToolGraph."""
+
+    id: str
+    tool: str
+    arguments: dict[str, Any] = field(default_factory=dict)
+    depends_on: frozenset[str] = frozenset()
+
+
+def _as_ref(value: Any) -> StepRef | None:
+    if isinstance(value, StepRef):
+        return value
+    if isinstance(value, dict) and "$ref" in value and set(value) <= {"$ref", "key"}:
+        return StepRef(value["$ref"], value.get("key"))
+    return None
+
+
+def _collect_refs(value: Any, found: set[str]) -> None:
+    """Gather every step id referenced anywhere inside `value`."""
+    reference = _as_ref(value)
+    if reference is not None:
+        found.add(reference.step_id)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collect_refs(item, found)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _collect_refs(item, found)
+
+
+def _resolve_refs(value: Any, outputs: dict[str, Any]) -> Any:
+    """Return a copy of `value` with every reference replaced by its output."""
+    reference = _as_ref(value)
+    if reference is not None:
+        output = outputs.get(reference.step_id)
+        if reference.key is None or output is None:
+            return output
+        return output[reference.key]
+    if isinstance(value, dict):
+        return {k: _resolve_refs(v, outputs) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_resolve_refs(v, outputs) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_resolve_refs(v, outputs) for v in value)
+    return value
+
+
+class ToolGraph:
+    """
+    A directed acyclic graph of tool calls.
+
+    Usage
+    -----
+    graph = ToolGraph()
+    graph.add("notes", "file_creation", {"filename": "notes.txt", "content": "hi"})
+    graph.add("index", "file_creation",
+              {"filename": "index.txt", "content": ref("notes")})
+    """
+
+    def __init__(self) -> None:
+        self._steps: dict[str, Step] = {}
+
+    def add(
+        self,
+        step_id: str,
+        tool: str,
+        arguments: dict[str, Any] | None = None,
+        *,
+        after: tuple[str, ...] | list[str] = (),
+    ) -> Step:
+        """
+        Add a step. Dependencies are inferred from references in
+        `arguments`; `after` adds ordering-only dependencies.
+
+        Raises:
+            ValueError: If `step_id` is empty or already used, or an
+                        argument name is reserved (RESERVED_ARGUMENTS).
+        """
+        if not step_id:
+            raise ValueError("step_id must not be empty.")
+        if step_id in self._steps:
+            raise ValueError(f"A step named {step_id!r} already exists.")
+
+        arguments = dict(arguments or {})
+        reserved = RESERVED_ARGUMENTS.intersection(arguments)
+        if reserved:
+            raise ValueError(
+                f"Step {step_id!r} uses reserved argument name(s): {sorted(reserved)}"
+            )
+        deps: set[str] = set(after)
+        _collect_refs(arguments, deps)
+        step = Step(step_id, tool, arguments, frozenset(deps))
+        self._steps[step_id] = step
+        return step
+
+    @classmethod
+    def from_plan(cls, plan: list[dict[str, Any]]) -> "ToolGraph":
+        """
+        Build a graph from a JSON-shaped plan:
+
+            [{"id": "a", "tool": "file_creation", "arguments": {...},
+              "after": ["b"]}, ...]
+        """
+        graph = cls()
+        for entry in plan:
+            graph.add(
+                entry["id"],
+                entry["tool"],
+                entry.get("arguments"),
+                after=entry.get("after", ()),
+            )
+        return graph
+
+    def topological_order(self) -> list[str]:
+        """
+        Return step ids in a valid execution order.
+
+        Raises:
+            ValueError: On references to unknown steps or on cycles.
+        """
+        for step in self._steps.values():
+            unknown = step.depends_on - self._steps.keys()
+            if unknown:
+                raise ValueError(
+                    f"Step {step.id!r} depends on unknown step(s): {sorted(unknown)}"
+                )
+
+        remaining = {sid: len(step.depends_on) for sid, step in self._steps.items()}
+        dependents = self.dependents()
+        order = [sid for sid, count in remaining.items() if count == 0]
+        for sid in order:               # `order` grows while we iterate
+            for child in dependents[sid]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    order.append(child)
+
+        if len(order) != len(self._steps):
+            cyclic = sorted(set(self._steps) - set(order))
+            raise ValueError(f"Graph contains a cycle among steps: {cyclic}")
+        return order
+
+    def dependents(self) -> dict[str, list[str]]:
+        """Map each step id to the ids of the steps that depend on it."""
+        children: dict[str, list[str]] = {sid: [] for sid in self._steps}
+        for step in self._steps.values():
+            for dep in step.depends_on:
+                children[dep].append(step.id)
+        return children
+
+    def __getitem__(self, step_id: str) -> Step:
+        return self._steps[step_id]
+
+    def __iter__(self):
+        return iter(self._steps.values())
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __repr__(self) -> str:
+        return f"<ToolGraph steps={list(self._steps)}>"
+
+
+# --------------------------------------------------------------------------- #
+#  Execution                                                                   #
+# --------------------------------------------------------------------------- #
+
+class _EventSink:
+    """
+    Serialises events from worker threads onto the user's callback and
+    stamps each one with the step id it belongs to.
+    """
+
+    def __init__(self, callback: EventCallback) -> None:
+        self._callback = callback
+        self._lock = threading.Lock()
+        self._clock = Clock()           # node events are timed from the run's start
+
+    def _deliver(self, event: Event) -> None:
+        with self._lock:
+            ToolExecutor._emit(self._callback, event)
+
+    def node(self, step: Step, type_: str, stage: str, message: str) -> None:
+        """Emit a node-level event for `step`."""
+        if self._callback is None:
+            return
+        event = _make_event(
+            type=type_, stage=stage, message=message, tool=step.tool, clock=self._clock
+        )
+        event["node"] = step.id
+        self._deliver(event)
+
+    def tagged(self, step_id: str) -> EventCallback:
+        """Callback for the executor that forwards its events for `step_id`."""
+        if self._callback is None:
+            return None
+
+        def callback(event: Event) -> None:
+            event["node"] = step_id
+            self._deliver(event)
+
+        return callback
+
+
+@dataclass
+class GraphResult:
+    """
+    Outcome of a graph run.
+
+    Attributes:
+        results:  step id → ToolResult (skipped/cancelled steps get a
+                  failed ToolResult explaining why).
+        status:   step id → "completed" | "failed" | "skipped" | "cancelled".
+        duration: wall-clock seconds for the whole run.
+    """
+
+    results: dict[str, ToolResult]
+    status: dict[str, str]
+    duration: float
+
+    @property
+    def success(self) -> bool:
+        return all(state == "completed" for state in self.status.values())
+
+    def __repr__(self) -> str:
+        counts: dict[str, int] = {}
+        for state in self.status.values():
+            counts[state] = counts.get(state, 0) + 1
+        return f"GraphResult(success={self.success}, status={counts}, duration={self.duration:.3f}s)"
+
+
+class GraphExecutor:
+    """
+    Runs a ToolGraph through a ToolExecutor with maximal parallelism.
+
+    Parameters
+    ----------
+    executor       : ToolExecutor -- every step is dispatched through it.
+    max_workers    : int          -- size of the worker thread pool.
+    failure_policy : str          -- "fail_fast" | "skip_dependents" | "continue".
+    """
+
+    def __init__(
+        self,
+        executor: ToolExecutor,
+        *,
+        max_workers: int = 8,
+        failure_policy: str = "skip_dependents",
+    ) -> None:
+        if failure_policy not in FAILURE_POLICIES:
+            raise ValueError(
+                f"Unknown failure_policy {failure_policy!r}; "
+                f"expected one of {sorted(FAILURE_POLICIES)}"
+            )
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self._executor = executor
+        self._max_workers = max_workers
+        self._failure_policy = failure_policy
+
+    def run(self, graph: ToolGraph, *, event_callback: EventCallback = None) -> GraphResult:
+        """
+        Execute every step of `graph`, honouring dependencies.
+
+        Returns
+        -------
+        GraphResult -- always returned; per-step failures never raise.
+
+        Raises:
+            ValueError: If the graph has unknown dependencies or a cycle
+                        (checked before anything runs).
+        """
+        graph.topological_order()
+        started_at = time.perf_counter()
+
+        dependents = graph.dependents()
+        waiting = {step.id: len(step.depends_on) for step in graph}
+        outputs: dict[str, Any] = {}
+        results: dict[str, ToolResult] = {}
+        status: dict[str, str] = {}
+        sink = _EventSink(event_callback)
+        emit = sink.node
+
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="tool-graph"
+        ) as pool:
+            running: dict[Future, str] = {}
+
+            def submit(step_id: str) -> None:
+                step = graph[step_id]
+                emit(step, "info", "node_started", f"Step '{step_id}' started.")
+                try:
+                    arguments = _resolve_refs(step.arguments, outputs)
+                except (KeyError, IndexError, TypeError) as exc:
+                    future: Future = Future()
+                    future.set_result(ToolResult(
+                        success=False,
+                        error=f"Could not resolve references for step '{step_id}': {exc!r}",
+                    ))
+                else:
+                    # Run in a copy of the caller's context so the step's
+                    # spans join the caller's trace.
+                    future = pool.submit(
+                        contextvars.copy_context().run,
+                        self._run_step,
+                        step.tool,
+                        arguments,
+                        sink.tagged(step_id),
+                    )
+                running[future] = step_id
+
+            def release(step_id: str) -> None:
+                for child in dependents[step_id]:
+                    waiting[child] -= 1
+                    if waiting[child] == 0 and child not in status:
+                        submit(child)
+
+            def skip(step_id: str, reason: str) -> None:
+                stack = [step_id]
+                while stack:
+                    sid = stack.pop()
+                    if sid in status:
+                        continue
+                    status[sid] = "skipped"
+                    results[sid] = ToolResult(success=False, error=f"Skipped: {reason}")
+                    emit(graph[sid], "error", "node_skipped", f"Step '{sid}' skipped: {reason}")
+                    stack.extend(dependents[sid])
+
+            for step_id, count in waiting.items():
+                if count == 0:
+                    submit(step_id)
+
+            aborted = False
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step_id = running.pop(future)
+                    step = graph[step_id]
+                    try:
+                        result = future.result()
+                    except Exception as exc:  # noqa: BLE001
+                        # ToolExecutor never raises; this is a bad call into it.
+                        logger.exception("Step %r could not be executed", step_id)
+                        result = ToolResult(
+                            success=False,
+                            error=f"Step '{step_id}' could not be executed: {exc!r}",
+                        )
+                    results[step_id] = result
+
+                    if result.success:
+                        status[step_id] = "completed"
+                        outputs[step_id] = result.output
+                        emit(step, "status", "node_completed", f"Step '{step_id}' completed.")
+                        if not aborted:
+                            release(step_id)
+                        continue
+
+                    status[step_id] = "failed"
+                    emit(step, "error", "node_failed", f"Step '{step_id}' failed: {result.error}")
+                    if self._failure_policy == "fail_fast":
+                        aborted = True
+                    elif self._failure_policy == "skip_dependents":
+                        for child in dependents[step_id]:
+                            skip(child, f"dependency '{step_id}' failed.")
+                    elif not aborted:
+                        release(step_id)
+
+        for step in graph:
+            if step.id not in status:
+                status[step.id] = "cancelled"
+                results[step.id] = ToolResult(
+                    success=False, error="Cancelled: an earlier step failed (fail_fast)."
+                )
+                emit(step, "error", "node_cancelled", f"Step '{step.id}' cancelled.")
+
+        graph_result = GraphResult(
+            results={step.id: results[step.id] for step in graph},
+            status={step.id: status[step.id] for step in graph},
+            duration=time.perf_counter() - started_at,
+        )
+        logger.info("Graph finished — %r", graph_result)
+        return graph_result
+
+    def _run_step(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        event_callback: EventCallback,
+    ) -> ToolResult:
+        return self._executor.execute(tool_name, event_callback=event_callback, **arguments)
+
+    def __repr__(self) -> str:
+        return (
+            f"<GraphExecutor workers={self._max_workers} "
+            f"failure_policy={self._failure_policy!r}>"
+        )
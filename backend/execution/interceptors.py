@@ -0,0 +1,194 @@
+"""
+execution/interceptors.py
+
+Interceptors: cross-cutting behaviour around tool invocations.
+
+Auth, rate limiting, auditing, custom metrics or argument rewriting used
+to mean editing ToolExecutor or monkey-patching `execute`. An Interceptor
+wraps the invocation stage instead, in the style of gRPC server
+interceptors:
+
+    class Audit(Interceptor):
+        def intercept(self, call, proceed):
+            logger.info("%s(%s)", call.tool_name, sorted(call.kwargs))
+            return proceed(call)
+
+    executor = ToolExecutor(registry, interceptors=[Audit(), RateLimit(5.0)])
+
+An interceptor runs after lookup, coercion and validation, with the tool
+leased, and sees every call that would reach the tool — including calls
+served from the result cache. It may change `call.kwargs`, return a
+ToolResult of its own without calling `proceed` (short-circuit), or
+post-process the result `proceed` returns. The first interceptor listed is
+the outermost.
+
+The chain is resolved once per registered tool instance into a flat
+pipeline of bound calls: interceptors whose `applies_to(tool)` is False
+are dropped, and a tool no interceptor applies to takes the executor's
+plain path. An executor without interceptors pays nothing for any of this.
+
+An exception raised by an interceptor fails the call with an
+`execution_failed` event, just like one raised by the tool; Cancelled
+yields the usual `cancelled` / `deadline_exceeded` result.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+
+from core.tools.base import ToolResult
+from execution.events import Event
+
+if TYPE_CHECKING:
+    from core.tools.base import BaseTool
+
+EventCallback = Optional[Callable[[Event], None]]
+
+
+class ToolCall:
+    """
+    One invocation travelling through an interceptor pipeline.
+
+    Attributes
+    ----------
+    tool           : BaseTool       -- the resolved, leased tool.
+    kwargs         : dict           -- validated inputs; interceptors may
+                                       replace or edit them.
+    event_callback : callable | None -- the caller's event callback.
+    """
+
+    __slots__ = ("tool", "kwargs", "event_callback")
+
+    def __init__(
+        self,
+        tool: "BaseTool",
+        kwargs: dict[str, Any],
+        event_callback: EventCallback,
+    ) -> None:
+        self.tool = tool
+        self.kwargs = kwargs
+        self.event_callback = event_callback
+
+    @property
+    def tool_name(self) -> str:
+        return self.tool.name
+
+    def __repr__(self) -> str:
+        return f"ToolCall(tool={self.tool.name!r}, kwargs={sorted(self.kwargs)})"
+
+
+Handler = Callable[[ToolCall], ToolResult]
+
+
+class Interceptor:
+    """
+    Base class for interceptors. Override `intercept`, and `applies_to`
+    to restrict the interceptor to some tools.
+    """
+
+    def applies_to(self, tool: "BaseTool") -> bool:
+        """Whether calls to `tool` go through this interceptor (default: all)."""
+        return True
+
+    def intercept(self, call: ToolCall, proceed: Handler) -> ToolResult:
+        """
+        Handle `call`. Return `proceed(call)` to continue down the chain,
+        or a ToolResult of your own to stop here.
+        """
+        return proceed(call)
+
+
+def _link(interceptor: Interceptor, proceed: Handler) -> Handler:
+    intercept = interceptor.intercept
+
+    def handler(call: ToolCall) -> ToolResult:
+        return intercept(call, proceed)
+
+    return handler
+
+
+def build_pipeline(
+    interceptors: Iterable[Interceptor],
+    tool: "BaseTool",
+    terminal: Handler,
+) -> Handler | None:
+    """
+    Compose the interceptors that apply to `tool` around `terminal`.
+
+    Returns:
+        The outermost handler, or None when no interceptor applies.
+    """
+    chain = [interceptor for interceptor in interceptors if interceptor.applies_to(tool)]
+    if not chain:
+        return None
+    handler = terminal
+    for interceptor in reversed(chain):
+        handler = _link(interceptor, handler)
+    return handler
+
+
+# --------------------------------------------------------------------------- #
+#  Built-in interceptors                                                       #
+# --------------------------------------------------------------------------- #
+
+class RateLimit(Interceptor):
+    """
+    Token-bucket rate limit per tool. Thread-safe.
+
+    Calls beyond the limit fail immediately with
+    ``metadata["rate_limited"] = True`` and ``metadata["retry_after"]``.
+
+    Parameters
+    ----------
+    rate  : float               -- calls per second allowed per tool.
+    burst : int, optional       -- bucket size (default: max(1, rate)).
+    tools : iterable of str     -- limit only these tools (default: all).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        burst: int | None = None,
+        tools: Iterable[str] | None = None,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("RateLimit rate must be positive.")
+        self._rate = rate
+        self._burst = float(burst if burst is not None else max(1, int(rate)))
+        self._tools = frozenset(tools) if tools is not None else None
+        self._buckets: dict[str, list[float]] = {}      # tool → [tokens, updated_at]
+        self._lock = threading.Lock()
+
+    def applies_to(self, tool: "BaseTool") -> bool:
+        return self._tools is None or tool.name in self._tools
+
+    def intercept(self, call: ToolCall, proceed: Handler) -> ToolResult:
+        retry_after = self._take(call.tool.name)
+        if retry_after > 0.0:
+            return ToolResult(
+                success=False,
+                error=(
+                    f"Tool '{call.tool.name}' is rate limited to {self._rate:g} call(s)/s. "
+                    f"Retry in {retry_after:.2f}s."
+                ),
+                metadata={"rate_limited": True, "retry_after": round(retry_after, 3)},
+            )
+        return proceed(call)
+
+    def _take(self, tool_name: str) -> float:
+        """Take a token; returns 0.0, or the seconds until one is available."""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(tool_name)
+            if bucket is None:
+                bucket = self._buckets[tool_name] = [self._burst, now]
+            tokens = min(self._burst, bucket[0] + (now - bucket[1]) * self._rate)
+            bucket[1] = now
+            if tokens >= 1.0:
+                bucket[0] = tokens - 1.0
+                return 0.0
+            bucket[0] = tokens
+            return (1.0 - tokens) / self._rate
@@ -0,0 +1,523 @@
+"""
+execution/job_queue.py
+
+Durable, SQLite-backed queue of tool executions.
+
+Without it, an instruction and its in-flight tool call live only on the
+stack of `ToolExecutor.execute` — if the process dies, they are gone. Jobs
+put on this queue survive restarts and are delivered at least once.
+
+Model
+-----
+- enqueue / enqueue_many : insert jobs (one transaction per batch).
+- dequeue                : lease up to N ready jobs to a worker for
+                           `lease_seconds`. A job is ready when it is
+                           pending, or leased with an expired lease (its
+                           worker died or stalled) — that is the
+                           redelivery path.
+- heartbeat              : extend the leases a worker still holds.
+- complete_many          : store results; only the current lease owner
+                           may complete a job. A successful result marks
+                           the job done. A failure that would recur
+                           (unknown tool, invalid input, a failure the
+                           tool reported) marks it dead at once; a
+                           transient one (the tool raised, was cancelled
+                           or timed out, or hit an open circuit breaker or
+                           rate limit) hands it back for redelivery after
+                           a backoff.
+- recover                : on single-node restart, hand every leased job
+                           back immediately instead of waiting for leases
+                           to expire.
+
+A job that has been delivered `max_attempts` times and still failed —
+transiently, or by losing its lease — is moved to "dead" rather than
+redelivered forever. The last failed result is kept. Retries wait
+`retry_backoff` seconds, doubling with each attempt up to
+`max_retry_backoff`, or the `retry_after` the result asks for.
+
+Results are stored as JSON. An output spilled to a file (OutputHandle) is
+stored as a reference to that file, not its contents; the file stays the
+caller's to delete.
+
+The database runs in WAL mode with synchronous=NORMAL, so readers never
+block the writer and a commit costs no fsync of the main database file.
+Each thread gets its own connection.
+
+JobWorker drains the queue through a ToolExecutor in batches, using
+`execute_many`, while a background thread heartbeats its leases.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+from core.cancellation import CANCELLED, DEADLINE_EXCEEDED
+from core.tools.base import ToolResult
+from core.tools.output import OutputHandle
+from execution.executor import ToolExecutor
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    tool          TEXT    NOT NULL,
+    arguments     TEXT    NOT NULL,
+    status        TEXT    NOT NULL DEFAULT 'pending',
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    lease_owner   TEXT,
+    lease_expires REAL,
+    result        TEXT,
+    not_before    REAL,
+    created_at    REAL    NOT NULL,
+    updated_at    REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, lease_expires, id);
+"""
+
+# pending → leased → done, or leased → pending (released / recovered /
+# failed transiently), or leased → dead (failed for good, or failed or lost
+# its lease on the last attempt).
+JOB_STATUSES = ("pending", "leased", "done", "dead")
+
+
+@dataclass
+class Job:
+    """A queued tool execution, as stored in the database."""
+
+    id: int
+    tool: str
+    arguments: dict[str, Any]
+    status: str
+    attempts: int
+    result: ToolResult | None = None
+
+
+def _dump_result(result: ToolResult) -> str:
+    data = {
+        "success": result.success,
+        "output": result.output,
+        "error": result.error,
+        "metadata": result.metadata,
+    }
+    handle = result.handle
+    if handle is not None:
+        data["output"] = None
+        data["output_file"] = {
+            "path": str(handle.path),
+            "size": handle.size,
+            "encoding": handle.encoding,
+        }
+    return json.dumps(data, default=repr)
+
+
+def _load_result(raw: str | None) -> ToolResult | None:
+    if raw is None:
+        return None
+    data = json.loads(raw)
+    output = data["output"]
+    spilled = data.get("output_file")
+    if spilled is not None:
+        output = OutputHandle(spilled["path"], size=spilled["size"], encoding=spilled["encoding"])
+    return ToolResult(
+        success=data["success"],
+        output=output,
+        error=data["error"],
+        metadata=data["metadata"],
+    )
+
+
+def _transient(result: ToolResult) -> bool:
+    """
+    Whether a failed result is worth another delivery: the run itself went
+    wrong. Anything else would fail the same way again.
+    """
+    if not result.has_metadata:
+        return False
+    metadata = result.metadata
+    return (
+        "traceback" in metadata                                 # the tool raised
+        or metadata.get("status") in (CANCELLED, DEADLINE_EXCEEDED)
+        or metadata.get("circuit") == "open"
+        or metadata.get("rate_limited") is True
+    )
+
+
+class JobQueue:
+    """
+    Durable job queue stored in a single SQLite database file.
+
+    Parameters
+    ----------
+    path              : str | PathLike -- database file (created if missing).
+    max_attempts      : int            -- deliveries before a job is marked dead.
+    retry_backoff     : float          -- delay before the first retry of a
+                                          transient failure; doubles per attempt.
+    max_retry_backoff : float          -- cap on that delay.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        *,
+        max_attempts: int = 5,
+        retry_backoff: float = 1.0,
+        max_retry_backoff: float = 300.0,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        if retry_backoff < 0 or max_retry_backoff < retry_backoff:
+            raise ValueError("Need 0 ≤ retry_backoff ≤ max_retry_backoff.")
+        self._path = os.fspath(path)
+        self._max_attempts = max_attempts
+        self._retry_backoff = retry_backoff
+        self._max_retry_backoff = max_retry_backoff
+        self._local = threading.local()
+        conn = self._conn()
+        conn.executescript(_SCHEMA)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+        if "not_before" not in columns:                     # databases from before retries
+            conn.execute("ALTER TABLE jobs ADD COLUMN not_before REAL")
+
+    # ------------------------------------------------------------------ #
+    #  Connection handling                                                 #
+    # ------------------------------------------------------------------ #
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction that takes the database write lock up front."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ------------------------------------------------------------------ #
+    #  Producer API                                                        #
+    # ------------------------------------------------------------------ #
+
+    def enqueue(self, tool_name: str, **kwargs: Any) -> int:
+        """Add one job and return its id."""
+        return self.enqueue_many([(tool_name, kwargs)])[0]
+
+    def enqueue_many(self, calls: Iterable[tuple[str, dict[str, Any]]]) -> list[int]:
+        """Add many jobs in a single transaction; returns their ids in order."""
+        now = time.time()
+        ids: list[int] = []
+        with self._transaction() as conn:
+            for tool_name, kwargs in calls:
+                cursor = conn.execute(
+                    "INSERT INTO jobs (tool, arguments, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (tool_name, json.dumps(kwargs), now, now),
+                )
+                ids.append(cursor.lastrowid)
+        return ids
+
+    # ------------------------------------------------------------------ #
+    #  Worker API                                                          #
+    # ------------------------------------------------------------------ #
+
+    def dequeue(self, worker_id: str, *, limit: int = 32, lease_seconds: float = 30.0) -> list[Job]:
+        """
+        Lease up to `limit` ready jobs to `worker_id`, oldest first.
+
+        Jobs whose lease expired are redelivered here (attempts + 1), or
+        marked dead once they have been delivered `max_attempts` times.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            dead = conn.execute(
+                "UPDATE jobs SET status = 'dead', lease_owner = NULL, updated_at = ? "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, now, self._max_attempts),
+            ).rowcount
+            if dead:
+                logger.warning("Marked %d job(s) dead after %d attempt(s)", dead, self._max_attempts)
+
+            rows = conn.execute(
+                "SELECT id, tool, arguments, attempts FROM jobs "
+                "WHERE (status = 'pending' AND (not_before IS NULL OR not_before <= ?)) "
+                "OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY id LIMIT ?",
+                (now, now, limit),
+            ).fetchall()
+            if not rows:
+                return []
+
+            conn.executemany(
+                "UPDATE jobs SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                [(worker_id, now + lease_seconds, now, row[0]) for row in rows],
+            )
+
+        redelivered = sum(1 for row in rows if row[3] > 0)
+        if redelivered:
+            logger.info("Redelivering %d job(s) to %s", redelivered, worker_id)
+
+        return [
+            Job(id=row[0], tool=row[1], arguments=json.loads(row[2]),
+                status="leased", attempts=row[3] + 1)
+            for row in rows
+        ]
+
+    def heartbeat(self, worker_id: str, job_ids: Iterable[int], *, lease_seconds: float = 30.0) -> int:
+        """Extend the leases `worker_id` still holds. Returns how many were extended."""
+        now = time.time()
+        with self._transaction() as conn:
+            return conn.executemany(
+                "UPDATE jobs SET lease_expires = ?, updated_at = ? "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                [(now + lease_seconds, now, job_id, worker_id) for job_id in job_ids],
+            ).rowcount
+
+    def complete_many(self, worker_id: str, outcomes: Iterable[tuple[int, ToolResult]]) -> int:
+        """
+        Store results for jobs leased by `worker_id` in one transaction.
+
+        A successful result marks its job done. A transient failure returns
+        the job to pending, ready again after the retry backoff, or marks
+        it dead once it has been delivered `max_attempts` times. Any other
+        failure marks it dead at once.
+
+        Results for jobs the worker no longer owns (lease lost and
+        redelivered elsewhere) are dropped. Returns how many were stored.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            return conn.executemany(
+                # status: 'done' / 'dead' when final, else retry while attempts remain.
+                # not_before: now + the result's retry_after, or the
+                # exponential backoff for this attempt.
+                "UPDATE jobs SET "
+                "status = COALESCE(?, CASE WHEN attempts >= ? THEN 'dead' ELSE 'pending' END), "
+                "not_before = ? + COALESCE(?, MIN(?, ? * (1 << MIN(attempts - 1, 30)))), "
+                "result = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                [
+                    (
+                        "done" if result.success else None if _transient(result) else "dead",
+                        self._max_attempts,
+                        now,
+                        result.metadata.get("retry_after") if result.has_metadata else None,
+                        self._max_retry_backoff,
+                        self._retry_backoff,
+                        _dump_result(result),
+                        now,
+                        job_id,
+                        worker_id,
+                    )
+                    for job_id, result in outcomes
+                ],
+            ).rowcount
+
+    def complete(self, worker_id: str, job_id: int, result: ToolResult) -> bool:
+        """Store the result of a single job (see `complete_many`). False if the lease was lost."""
+        return self.complete_many(worker_id, [(job_id, result)]) == 1
+
+    def release(self, worker_id: str, job_ids: Iterable[int]) -> None:
+        """Hand leased jobs back to the queue without counting an attempt."""
+        now = time.time()
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE jobs SET status = 'pending', lease_owner = NULL, lease_expires = NULL, "
+                "attempts = MAX(attempts - 1, 0), updated_at = ? "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                [(now, job_id, worker_id) for job_id in job_ids],
+            )
+
+    def recover(self) -> int:
+        """
+        Return every leased job to pending immediately.
+
+        Only safe when no other worker process shares this database — e.g.
+        at startup of a single-node deployment after a crash. Multi-worker
+        setups should rely on lease expiry instead.
+        """
+        with self._transaction() as conn:
+            count = conn.execute(
+                "UPDATE jobs SET status = 'pending', lease_owner = NULL, "
+                "lease_expires = NULL, updated_at = ? WHERE status = 'leased'",
+                (time.time(),),
+            ).rowcount
+        if count:
+            logger.info("Recovered %d unfinished job(s)", count)
+        return count
+
+    # ------------------------------------------------------------------ #
+    #  Introspection                                                       #
+    # ------------------------------------------------------------------ #
+
+    def get(self, job_id: int) -> Job | None:
+        """Return a job by id, including its latest result."""
+        row = self._conn().execute(
+            "SELECT id, tool, arguments, status, attempts, result FROM jobs WHERE id = ?",
+            (job_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return Job(
+            id=row[0], tool=row[1], arguments=json.loads(row[2]),
+            status=row[3], attempts=row[4], result=_load_result(row[5]),
+        )
+
+    def stats(self) -> dict[str, int]:
+        """Count jobs per status."""
+        counts = dict.fromkeys(JOB_STATUSES, 0)
+        for status, count in self._conn().execute(
+            "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+        ):
+            counts[status] = count
+        return counts
+
+    def __repr__(self) -> str:
+        return f"<JobQueue path={self._path!r} {self.stats()}>"
+
+
+class JobWorker:
+    """
+    Drains a JobQueue through a ToolExecutor.
+
+    Each iteration leases a batch, runs it with `executor.execute_many`
+    and stores all results in one transaction; transiently failed jobs
+    are retried, after a backoff, up to the queue's `max_attempts`. While a batch runs, a
+    heartbeat thread keeps its leases alive.
+
+    Parameters
+    ----------
+    queue         : JobQueue
+    executor      : ToolExecutor
+    worker_id     : str    -- defaults to "<hostname>-<pid>-<random>".
+    batch_size    : int    -- jobs leased per iteration.
+    lease_seconds : float  -- lease length; heartbeats run every third of it.
+    poll_interval : float  -- sleep between polls when the queue is empty.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        executor: ToolExecutor,
+        *,
+        worker_id: str | None = None,
+        batch_size: int = 32,
+        lease_seconds: float = 30.0,
+        poll_interval: float = 0.1,
+    ) -> None:
+        self._queue = queue
+        self._executor = executor
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._batch_size = batch_size
+        self._lease_seconds = lease_seconds
+        self._poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> int:
+        """Process one batch. Returns the number of jobs handled."""
+        jobs = self._queue.dequeue(
+            self.worker_id, limit=self._batch_size, lease_seconds=self._lease_seconds
+        )
+        if not jobs:
+            return 0
+
+        done = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=([job.id for job in jobs], done), daemon=True
+        )
+        heartbeat.start()
+        try:
+            results = self._executor.execute_many(
+                (job.tool, job.arguments) for job in jobs
+            )
+        finally:
+            done.set()
+            heartbeat.join()
+
+        stored = self._queue.complete_many(
+            self.worker_id, zip((job.id for job in jobs), results)
+        )
+        failed = sum(1 for result in results if not result.success)
+        if failed:
+            logger.info("%s: %d job(s) failed; transient failures go back to "
+                        "the queue, the rest are dead", self.worker_id, failed)
+        if stored != len(jobs):
+            logger.warning(
+                "%s lost the lease on %d job(s); they will be redelivered",
+                self.worker_id, len(jobs) - stored,
+            )
+        return len(jobs)
+
+    def run_until_empty(self) -> int:
+        """Process batches until the queue has nothing ready. Returns jobs handled."""
+        total = 0
+        while (handled := self.run_once()):
+            total += handled
+        return total
+
+    def start(self) -> None:
+        """Start draining the queue in a background thread."""
+        if self._thread is not None:
+            raise RuntimeError("Worker already started.")
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name=f"job-worker-{self.worker_id}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Finish the current batch, then stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if not self.run_once():
+                    self._stop.wait(self._poll_interval)
+            except Exception:  # noqa: BLE001
+                logger.exception("%s failed to process a batch", self.worker_id)
+                self._stop.wait(self._poll_interval)
+        self._queue.close()
+
+    def _heartbeat(self, job_ids: list[int], done: threading.Event) -> None:
+        interval = self._lease_seconds / 3
+        while not done.wait(interval):
+            try:
+                self._queue.heartbeat(self.worker_id, job_ids, lease_seconds=self._lease_seconds)
+            except sqlite3.Error as exc:
+                logger.warning("%s heartbeat failed: %s", self.worker_id, exc)
+        self._queue.close()
+
+    def __repr__(self) -> str:
+        return f"<JobWorker id={self.worker_id!r}>"
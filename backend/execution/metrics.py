@@ -0,0 +1,270 @@
+"""
+execution/metrics.py
+
+Low-overhead latency histograms and counters, with a Prometheus text
+exposition.
+
+Design
+------
+- Histograms use fixed log-scale buckets (two per power of two, from 1µs
+  to ~2 minutes), so recording is a `bisect` plus two additions, and any
+  quantile can be estimated to within ~41% relative error with no
+  per-sample storage.
+- Recording is sharded per thread: each thread writes only to its own
+  shard, so concurrent executions never contend on a lock. Readers merge
+  all shards; a read racing a write may miss that single sample. When a
+  thread exits, its shard is folded into a shared total and dropped, so
+  short-lived threads don't accumulate shards.
+- Everything is keyed by (metric name, label values). The `tool` label is
+  always a registered tool name; calls to names that match no tool are
+  recorded under UNKNOWN_TOOL, which keeps the label set bounded.
+
+Metrics recorded by the stack
+-----------------------------
+    tool_stage_duration_seconds{tool, stage}     lookup | validation | execution
+    tool_executions_total{tool, outcome}         success | failure | error |
+                                                 invalid | not_found |
+                                                 short_circuited | cached |
+                                                 cancelled | deadline_exceeded
+    llm_request_duration_seconds{model}          Agent → Groq round-trip
+    agent_runs_total{outcome}                    success | failure
+
+Usage
+-----
+metrics = MetricsRegistry()
+executor = ToolExecutor(registry, metrics=metrics)
+print(metrics.render_prometheus())
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from bisect import bisect_left
+from typing import Iterable
+
+# Upper bounds (seconds) of the histogram buckets: 1µs · √2^i.
+BUCKET_BOUNDS: tuple[float, ...] = tuple(1e-6 * 2 ** (i / 2) for i in range(55))
+
+# `tool` label of calls whose name matched no registered tool.
+UNKNOWN_TOOL = "<unknown>"
+
+_HELP = {
+    "tool_stage_duration_seconds": "Time spent in each executor stage, per tool.",
+    "tool_executions_total": "Tool calls handled by the executor, by outcome.",
+    "llm_request_duration_seconds": "Latency of LLM chat-completion requests.",
+    "agent_runs_total": "Agent.run invocations, by outcome.",
+}
+
+_Key = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def _key(name: str, labels: dict[str, str]) -> _Key:
+    return name, tuple(sorted(labels.items()))
+
+
+class _Shard:
+    """One thread's private slice of every metric."""
+
+    __slots__ = ("histograms", "counters")
+
+    def __init__(self) -> None:
+        # key → [bucket counts..., +Inf count, sum]
+        self.histograms: dict[_Key, list[float]] = {}
+        self.counters: dict[_Key, float] = {}
+
+    def merge_into(
+        self,
+        histograms: dict[_Key, list[float]],
+        counters: dict[_Key, float],
+    ) -> None:
+        """Add this shard's values to `histograms` and `counters`."""
+        for key, row in list(self.histograms.items()):
+            merged = histograms.get(key)
+            if merged is None:
+                histograms[key] = list(row)
+            else:
+                for i, value in enumerate(row):
+                    merged[i] += value
+        for key, value in list(self.counters.items()):
+            counters[key] = counters.get(key, 0.0) + value
+
+
+class _ThreadExit:
+    """Lives in a thread's local storage; collected when the thread exits."""
+
+    __slots__ = ("__weakref__",)
+
+
+def _fold(registry_ref: "weakref.ref[MetricsRegistry]", shard: _Shard) -> None:
+    registry = registry_ref()
+    if registry is not None:
+        registry._retire(shard)
+
+
+class MetricsRegistry:
+    """Per-thread sharded histograms and counters."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        self._retired = _Shard()               # folded shards of exited threads
+        self._lock = threading.Lock()          # only taken to add or retire a shard
+
+    # ------------------------------------------------------------------ #
+    #  Recording (hot path)                                                #
+    # ------------------------------------------------------------------ #
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+            # Thread-local values are released when their thread exits.
+            exit_marker = self._local.exit_marker = _ThreadExit()
+            weakref.finalize(exit_marker, _fold, weakref.ref(self), shard)
+        return shard
+
+    def _retire(self, shard: _Shard) -> None:
+        """Fold an exited thread's shard into the retired total."""
+        with self._lock:
+            try:
+                self._shards.remove(shard)
+            except ValueError:
+                return
+            shard.merge_into(self._retired.histograms, self._retired.counters)
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """Record one duration sample in the histogram `name{labels}`."""
+        histograms = self._shard().histograms
+        key = _key(name, labels)
+        row = histograms.get(key)
+        if row is None:
+            row = histograms[key] = [0.0] * (len(BUCKET_BOUNDS) + 2)
+        row[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        row[-1] += seconds
+
+    def increment(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        """Add `amount` to the counter `name{labels}`."""
+        counters = self._shard().counters
+        key = _key(name, labels)
+        counters[key] = counters.get(key, 0.0) + amount
+
+    # ------------------------------------------------------------------ #
+    #  Reading                                                             #
+    # ------------------------------------------------------------------ #
+
+    def _merged(self) -> tuple[dict[_Key, list[float]], dict[_Key, float]]:
+        histograms: dict[_Key, list[float]] = {}
+        counters: dict[_Key, float] = {}
+        with self._lock:
+            shards = list(self._shards)
+            self._retired.merge_into(histograms, counters)
+        for shard in shards:
+            shard.merge_into(histograms, counters)
+        return histograms, counters
+
+    def counter(self, name: str, **labels: str) -> float:
+        """Current value of a counter (0 if never incremented)."""
+        return self._merged()[1].get(_key(name, labels), 0.0)
+
+    def summary(self, name: str, **labels: str) -> dict[str, float]:
+        """
+        Count, sum and estimated p50/p90/p99 of one histogram.
+
+        Quantiles are reported as the upper bound of the bucket that holds
+        them, so they never under-state latency.
+        """
+        row = self._merged()[0].get(_key(name, labels))
+        if row is None:
+            return {"count": 0, "sum": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0}
+        return {
+            "count": sum(row[:-1]),
+            "sum": row[-1],
+            "p50": _quantile(row, 0.50),
+            "p90": _quantile(row, 0.90),
+            "p99": _quantile(row, 0.99),
+        }
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        histograms, counters = self._merged()
+        lines: list[str] = []
+
+        for name, keys in _group(counters):
+            lines.append(f"# HELP {name} {_HELP.get(name, name)}")
+            lines.append(f"# TYPE {name} counter")
+            for key in keys:
+                lines.append(f"{name}{_labels(key[1])} {_number(counters[key])}")
+
+        for name, keys in _group(histograms):
+            lines.append(f"# HELP {name} {_HELP.get(name, name)}")
+            lines.append(f"# TYPE {name} histogram")
+            for key in keys:
+                row = histograms[key]
+                cumulative = 0.0
+                for bound, count in zip(BUCKET_BOUNDS, row):
+                    cumulative += count
+                    lines.append(
+                        f"{name}_bucket{_labels(key[1], le=f'{bound:.6g}')} "
+                        f"{_number(cumulative)}"
+                    )
+                total = cumulative + row[-2]
+                lines.append(f"{name}_bucket{_labels(key[1], le='+Inf')} {_number(total)}")
+                lines.append(f"{name}_sum{_labels(key[1])} {row[-1]:.9g}")
+                lines.append(f"{name}_count{_labels(key[1])} {_number(total)}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Forget every recorded sample (all threads)."""
+        with self._lock:
+            for shard in (*self._shards, self._retired):
+                shard.histograms.clear()
+                shard.counters.clear()
+
+    def __repr__(self) -> str:
+        histograms, counters = self._merged()
+        return f"<MetricsRegistry histograms={len(histograms)} counters={len(counters)}>"
+
+
+# --------------------------------------------------------------------------- #
+#  Helpers                                                                     #
+# --------------------------------------------------------------------------- #
+
+def _quantile(row: list[float], fraction: float) -> float:
+    total = sum(row[:-1])
+    if not total:
+        return 0.0
+    target = fraction * total
+    seen = 0.0
+    for bound, count in zip(BUCKET_BOUNDS, row):
+        seen += count
+        if seen >= target:
+            return bound
+    return float("inf")
+
+
+def _group(table: dict[_Key, object]) -> Iterable[tuple[str, list[_Key]]]:
+    by_name: dict[str, list[_Key]] = {}
+    for key in table:
+        by_name.setdefault(key[0], []).append(key)
+    for name in sorted(by_name):
+        yield name, sorted(by_name[name])
+
+
+def _labels(pairs: tuple[tuple[str, str], ...], **extra: str) -> str:
+    items = list(pairs) + list(extra.items())
+    if not items:
+        return ""
+    rendered = ",".join(f'{k}="{_escape(str(v))}"' for k, v in items)
+    return "{" + rendered + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
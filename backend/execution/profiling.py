@@ -0,0 +1,326 @@
+"""
+execution/profiling.py
+
+On-demand profiling of individual executions, switchable at runtime.
+
+A Profiler is shared by ToolExecutor and Agent. It decides which
+executions to profile, wraps each selected one with cProfile and/or
+tracemalloc, and keeps the resulting Profiles in a bounded in-memory store.
+
+Selection
+---------
+An execution is profiled when any of these holds:
+- it was explicitly requested (`Agent.run(..., profile=True)`), or
+  `arm(n)` was called and fewer than `n` executions have been profiled
+  since;
+- the profiler is enabled, the execution matches its `tools` filter
+  (None = every tool, and whole agent runs), and it wins the
+  `sample_rate` draw.
+
+Only one profile runs per thread at a time: an agent run that is being
+profiled already covers its tool call, so the executor does not start a
+nested profile. tracemalloc is process-wide, so at most one memory
+profile runs at a time; concurrent selections get CPU profiling only.
+
+Results
+-------
+    profiler.last().stats_text(sort="cumulative", limit=25)   pstats report
+    profiler.last().allocations_text(limit=10)                top allocations
+    profiler.last().dump("slow.prof")                         for snakeviz etc.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import itertools
+import logging
+import pstats
+import random
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+_TRACEMALLOC_FRAMES = 10
+
+
+@dataclass
+class Profile:
+    """One profiled execution."""
+
+    id: int
+    label: str                              # tool name, or "agent.run"
+    started_at: str                         # ISO-8601 UTC
+    duration: float = 0.0
+    cpu: cProfile.Profile | None = field(default=None, repr=False)
+    # (location, size delta in bytes, allocation-count delta), largest first.
+    allocations: list[tuple[str, int, int]] = field(default_factory=list)
+    peak_memory: int | None = None
+
+    def stats(self) -> pstats.Stats:
+        """
+        The CPU profile as a pstats.Stats object.
+
+        Raises:
+            ValueError: If CPU was not profiled.
+        """
+        if self.cpu is None:
+            raise ValueError(f"Profile {self.id} has no CPU profile.")
+        return pstats.Stats(self.cpu)
+
+    def stats_text(self, sort: str = "cumulative", limit: int = 25) -> str:
+        """The pstats report, sorted by `sort` and cut to `limit` rows."""
+        if self.cpu is None:
+            return "(no CPU profile recorded)"
+        stream = io.StringIO()
+        pstats.Stats(self.cpu, stream=stream).sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+    def allocations_text(self, limit: int = 10) -> str:
+        """Top-N allocation sites by net size growth during the execution."""
+        if self.peak_memory is None:
+            return "(no memory profile recorded)"
+        lines = [f"peak traced memory: {_size(self.peak_memory)}"]
+        for location, size, count in self.allocations[:limit]:
+            lines.append(f"{_size(size):>10}  {count:+7d} blocks  {location}")
+        return "\n".join(lines)
+
+    def dump(self, path: str | Path) -> Path:
+        """
+        Write the CPU profile in the binary pstats format to `path` and,
+        when memory was profiled, the allocation summary next to it
+        (`<path>.alloc.txt`). Returns the pstats path.
+
+        Raises:
+            ValueError: If neither CPU nor memory was profiled.
+        """
+        path = Path(path)
+        if self.cpu is None and self.peak_memory is None:
+            raise ValueError(f"Profile {self.id} holds no data to dump.")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self.cpu is not None:
+            self.cpu.dump_stats(str(path))
+        if self.peak_memory is not None:
+            path.with_name(path.name + ".alloc.txt").write_text(
+                self.allocations_text(limit=len(self.allocations)), encoding="utf-8"
+            )
+        return path
+
+
+class Profiler:
+    """
+    Runtime-switchable profiler with a bounded store of recent Profiles.
+
+    Parameters
+    ----------
+    capacity        : int -- how many profiles to keep (oldest dropped first).
+    top_allocations : int -- allocation sites kept per memory profile.
+
+    Usage
+    -----
+    profiler = Profiler()
+    executor = ToolExecutor(registry, profiler=profiler)
+    profiler.enable(tools={"file_creation"}, sample_rate=0.05, memory=True)
+    ...
+    print(profiler.last().stats_text())
+    """
+
+    def __init__(self, *, capacity: int = 16, top_allocations: int = 25) -> None:
+        self._profiles: deque[Profile] = deque(maxlen=capacity)
+        self._top_allocations = top_allocations
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._memory_lock = threading.Lock()    # one tracemalloc user at a time
+        self._local = threading.local()
+
+        self.enabled = False
+        self._tools: frozenset[str] | None = None
+        self._sample_rate = 1.0
+        self._cpu = True
+        self._memory = False
+        self._armed = 0
+
+    # ------------------------------------------------------------------ #
+    #  Switches                                                            #
+    # ------------------------------------------------------------------ #
+
+    def enable(
+        self,
+        *,
+        tools: set[str] | None = None,
+        sample_rate: float = 1.0,
+        cpu: bool = True,
+        memory: bool = False,
+    ) -> None:
+        """
+        Start profiling matching executions.
+
+        Args:
+            tools:       Tool names to profile; None profiles every tool and
+                         whole agent runs.
+            sample_rate: Fraction of matching executions to profile.
+            cpu:         Record a cProfile profile.
+            memory:      Record tracemalloc allocation deltas.
+
+        Raises:
+            ValueError: On a sample_rate outside [0, 1] or nothing to record.
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1.")
+        if not (cpu or memory):
+            raise ValueError("Enable at least one of cpu or memory profiling.")
+        with self._lock:
+            self._tools = frozenset(tools) if tools is not None else None
+            self._sample_rate = sample_rate
+            self._cpu = cpu
+            self._memory = memory
+            self.enabled = True
+        logger.info(
+            "Profiling enabled — tools=%s sample_rate=%s cpu=%s memory=%s",
+            sorted(tools) if tools is not None else "all", sample_rate, cpu, memory,
+        )
+
+    def disable(self) -> None:
+        """Stop selecting executions (explicit and armed requests still apply)."""
+        with self._lock:
+            self.enabled = False
+        logger.info("Profiling disabled")
+
+    def arm(self, count: int = 1) -> None:
+        """Profile the next `count` executions regardless of the filters."""
+        with self._lock:
+            self._armed += count
+
+    # ------------------------------------------------------------------ #
+    #  Hook used by ToolExecutor and Agent                                 #
+    # ------------------------------------------------------------------ #
+
+    @contextmanager
+    def profile(
+        self,
+        label: str,
+        *,
+        tool: bool = True,
+        force: bool = False,
+    ) -> Iterator[Profile | None]:
+        """
+        Profile the enclosed block if it is selected; yields the Profile
+        being recorded, or None when the block is not profiled.
+
+        `tool` is False for agent runs, which only match a profiler that
+        has no tool filter.
+        """
+        if getattr(self._local, "active", False) or not self._select(label, tool, force):
+            yield None
+            return
+
+        memory = self._memory and self._memory_lock.acquire(blocking=False)
+        profile = Profile(
+            id=next(self._ids),
+            label=label,
+            started_at=datetime.now(timezone.utc).isoformat(),
+        )
+        self._local.active = True
+        raw = self._start_cpu() if self._cpu or not memory else None
+        started_tracemalloc = False
+        before = None
+        if memory:
+            started_tracemalloc = not tracemalloc.is_tracing()
+            if started_tracemalloc:
+                tracemalloc.start(_TRACEMALLOC_FRAMES)
+            tracemalloc.reset_peak()
+            before = tracemalloc.take_snapshot()
+        started = time.perf_counter()
+        try:
+            yield profile
+        finally:
+            profile.duration = time.perf_counter() - started
+            if raw is not None:
+                raw.disable()
+                profile.cpu = raw
+            if memory:
+                after = tracemalloc.take_snapshot()
+                profile.peak_memory = tracemalloc.get_traced_memory()[1]
+                if started_tracemalloc:
+                    tracemalloc.stop()
+                self._memory_lock.release()
+                profile.allocations = [
+                    (str(diff.traceback[0]), diff.size_diff, diff.count_diff)
+                    for diff in after.compare_to(before, "lineno")[: self._top_allocations]
+                    if diff.size_diff
+                ]
+            self._local.active = False
+            self._profiles.append(profile)
+            logger.info("Recorded profile #%d for %r (%.3fs)", profile.id, label, profile.duration)
+
+    def _select(self, label: str, tool: bool, force: bool) -> bool:
+        if force:
+            return True
+        with self._lock:
+            if self._armed:
+                self._armed -= 1
+                return True
+            if not self.enabled:
+                return False
+            if self._tools is not None and (not tool or label not in self._tools):
+                return False
+        return self._sample_rate >= 1.0 or random.random() < self._sample_rate
+
+    @staticmethod
+    def _start_cpu() -> cProfile.Profile | None:
+        raw = cProfile.Profile()
+        try:
+            raw.enable()
+        except ValueError as exc:   # another profiler is active (3.12+ is process-wide)
+            logger.warning("CPU profiling skipped: %s", exc)
+            return None
+        return raw
+
+    # ------------------------------------------------------------------ #
+    #  Store                                                               #
+    # ------------------------------------------------------------------ #
+
+    def last(self) -> Profile | None:
+        """The most recently recorded profile, if any."""
+        return self._profiles[-1] if self._profiles else None
+
+    def get(self, profile_id: int) -> Profile:
+        """
+        Raises:
+            KeyError: If the profile is unknown or has been evicted.
+        """
+        for profile in self._profiles:
+            if profile.id == profile_id:
+                return profile
+        raise KeyError(f"No profile with id {profile_id} in the store.")
+
+    def profiles(self) -> list[Profile]:
+        """Stored profiles, oldest first."""
+        return list(self._profiles)
+
+    def clear(self) -> None:
+        self._profiles.clear()
+
+    def __repr__(self) -> str:
+        return (
+            f"<Profiler enabled={self.enabled} armed={self._armed} "
+            f"stored={len(self._profiles)}>"
+        )
+
+
+def _size(n: int) -> str:
+    sign = "-" if n < 0 else ""
+    n = abs(n)
+    for unit in ("B", "KiB", "MiB"):
+        if n < 1024:
+            return f"{sign}{n:.0f} {unit}" if unit == "B" else f"{sign}{n:.1f} {unit}"
+        n /= 1024
+    return f"{sign}{n:.1f} GiB"
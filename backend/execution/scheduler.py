@@ -0,0 +1,345 @@
+"""
+execution/scheduler.py
+
+Priority- and fairness-aware scheduling of tool executions across sessions.
+
+Once many users share one backend, a single heavy session must not be able
+to monopolise the executor. ExecutionScheduler sits in front of a
+ToolExecutor and decides which queued call runs next.
+
+Policy
+------
+1. Priority classes. Every call belongs to a class (by default
+   "interactive", "default", "batch"). Higher classes are served first.
+2. Fairness within a class. Each session (or tenant) has its own FIFO
+   queue, and sessions are served by deficit round-robin (DRR): on each
+   visit a session earns `quantum × weight` credit and may dispatch calls
+   while its credit covers their cost (1 per call unless given). A
+   session that submits 1000 calls therefore gets no more turns than one
+   that submits 10 — only more calls queued.
+3. Starvation protection. A call that has waited longer than
+   `max_wait_seconds` is dispatched ahead of everything else, so lower
+   classes still make progress under sustained high-priority load.
+
+Metrics
+-------
+`metrics()` reports, per class: queued, dispatched, and queue latency
+(mean / max / p50 / p95 / p99 over a recent window).
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any
+
+from core.tools.base import ToolResult
+from execution.accounting import set_session
+from execution.executor import EventCallback, ToolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Highest priority first.
+DEFAULT_PRIORITIES = ("interactive", "default", "batch")
+
+_LATENCY_WINDOW = 1024
+
+
+@dataclass
+class _Ticket:
+    """One queued call."""
+
+    session: str
+    priority: str
+    tool_name: str
+    kwargs: dict[str, Any]
+    event_callback: EventCallback
+    cost: float
+    enqueued_at: float
+    future: Future = field(default_factory=Future)
+    # The submitter's context, so the call's spans join its trace.
+    context: contextvars.Context = field(default_factory=contextvars.copy_context)
+
+
+class _ClassQueue:
+    """Per-priority-class state: one FIFO per session, served by DRR."""
+
+    def __init__(self) -> None:
+        self.sessions: dict[str, deque[_Ticket]] = {}
+        self.active: deque[str] = deque()       # round-robin order
+        self.deficit: dict[str, float] = {}
+        self.size = 0
+        self.dispatched = 0
+        self.latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+
+
+class ExecutionScheduler:
+    """
+    Fair, prioritised front-end for a ToolExecutor.
+
+    Parameters
+    ----------
+    executor         : ToolExecutor
+    workers          : int              -- concurrent executions.
+    priorities       : sequence[str]    -- class names, highest first.
+    quantum          : float            -- DRR credit granted per visit.
+    max_wait_seconds : float            -- starvation threshold.
+    session_weights  : dict[str, float] -- optional per-session DRR weight
+                                           (default 1.0).
+
+    Usage
+    -----
+    scheduler = ExecutionScheduler(executor, workers=4)
+    future = scheduler.submit("file_creation", session="alice",
+                              priority="interactive",
+                              filename="a.txt", content="hi")
+    result = future.result()
+    scheduler.shutdown()
+    """
+
+    def __init__(
+        self,
+        executor: ToolExecutor,
+        *,
+        workers: int = 4,
+        priorities: tuple[str, ...] | list[str] = DEFAULT_PRIORITIES,
+        quantum: float = 1.0,
+        max_wait_seconds: float = 5.0,
+        session_weights: dict[str, float] | None = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        if not priorities:
+            raise ValueError("At least one priority class is required.")
+        if not (math.isfinite(quantum) and quantum > 0):
+            raise ValueError("quantum must be a positive finite number.")
+        if not all(math.isfinite(w) and w > 0 for w in (session_weights or {}).values()):
+            raise ValueError("session weights must be positive finite numbers.")
+
+        self._executor = executor
+        self._priorities = tuple(priorities)
+        self._classes = {name: _ClassQueue() for name in self._priorities}
+        self._quantum = quantum
+        self._max_wait = max_wait_seconds
+        self._weights = dict(session_weights or {})
+
+        self._cond = threading.Condition()
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"tool-scheduler-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    # ------------------------------------------------------------------ #
+    #  Public API                                                          #
+    # ------------------------------------------------------------------ #
+
+    def submit(
+        self,
+        tool_name: str,
+        *,
+        session: str = "default",
+        priority: str = "default",
+        cost: float = 1.0,
+        event_callback: EventCallback = None,
+        **kwargs: Any,
+    ) -> "Future[ToolResult]":
+        """
+        Queue a call and return a Future resolving to its ToolResult.
+
+        Raises:
+            ValueError:   If `priority` is not a configured class, or `cost`
+                          is not a positive finite number.
+            RuntimeError: If the scheduler has been shut down.
+        """
+        if not (math.isfinite(cost) and cost > 0):
+            raise ValueError(f"cost must be a positive finite number, got {cost!r}")
+        queue = self._classes.get(priority)
+        if queue is None:
+            raise ValueError(
+                f"Unknown priority {priority!r}; expected one of {list(self._priorities)}"
+            )
+
+        ticket = _Ticket(
+            session=session,
+            priority=priority,
+            tool_name=tool_name,
+            kwargs=kwargs,
+            event_callback=event_callback,
+            cost=cost,
+            enqueued_at=time.monotonic(),
+        )
+        ticket.context.run(set_session, session)      # resource accounting
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Scheduler has been shut down.")
+            pending = queue.sessions.get(session)
+            if pending is None:
+                pending = queue.sessions[session] = deque()
+                queue.active.append(session)
+                queue.deficit[session] = 0.0
+            pending.append(ticket)
+            queue.size += 1
+            self._cond.notify()
+        return ticket.future
+
+    def set_weight(self, session: str, weight: float) -> None:
+        """Give `session` a larger (or smaller) share of its class."""
+        if not (math.isfinite(weight) and weight > 0):
+            raise ValueError("weight must be a positive finite number.")
+        with self._cond:
+            self._weights[session] = weight
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting calls; workers drain what is already queued."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def metrics(self) -> dict[str, dict[str, float]]:
+        """Per-class queue depth, throughput and queue latency (seconds)."""
+        report: dict[str, dict[str, float]] = {}
+        with self._cond:
+            for name, queue in self._classes.items():
+                window = sorted(queue.latencies)
+                report[name] = {
+                    "queued": queue.size,
+                    "dispatched": queue.dispatched,
+                    "latency_mean": (
+                        queue.total_latency / queue.dispatched if queue.dispatched else 0.0
+                    ),
+                    "latency_max": queue.max_latency,
+                    "latency_p50": _percentile(window, 0.50),
+                    "latency_p95": _percentile(window, 0.95),
+                    "latency_p99": _percentile(window, 0.99),
+                }
+        return report
+
+    # ------------------------------------------------------------------ #
+    #  Scheduling                                                          #
+    # ------------------------------------------------------------------ #
+
+    def _next_ticket(self) -> _Ticket | None:
+        """Pick the next call to run. Caller must hold `self._cond`."""
+        now = time.monotonic()
+
+        # Starvation protection: the oldest overdue call goes first,
+        # whatever its class.
+        overdue: tuple[_ClassQueue, str] | None = None
+        oldest = now - self._max_wait
+        for queue in self._classes.values():
+            for session, pending in queue.sessions.items():
+                if pending[0].enqueued_at <= oldest:
+                    oldest = pending[0].enqueued_at
+                    overdue = (queue, session)
+        if overdue is not None:
+            return self._pop(*overdue)
+
+        for queue in self._classes.values():
+            if queue.size:
+                return self._drr(queue)
+        return None
+
+    def _drr(self, queue: _ClassQueue) -> _Ticket:
+        """Deficit round-robin over the class's sessions."""
+        skipped = False
+        while True:
+            session = queue.active[0]
+            head = queue.sessions[session][0]
+            if queue.deficit[session] >= head.cost:
+                queue.deficit[session] -= head.cost
+                return self._pop(queue, session)
+            if not skipped:
+                self._skip_rounds(queue)
+                skipped = True
+            # The current session's turn is over; the next one starts its
+            # turn with a fresh quantum of credit.
+            queue.active.rotate(-1)
+            upcoming = queue.active[0]
+            queue.deficit[upcoming] += self._quantum * self._weights.get(upcoming, 1.0)
+
+    def _skip_rounds(self, queue: _ClassQueue) -> None:
+        """
+        Grant at once the credit of the full rounds in which no session
+        could dispatch its head call, instead of rotating through them one
+        quantum at a time (a call costing 1e9 quanta would take 1e9 turns).
+        """
+        rounds = min(
+            math.ceil(
+                (queue.sessions[session][0].cost - queue.deficit[session])
+                / (self._quantum * self._weights.get(session, 1.0))
+            )
+            for session in queue.active
+        ) - 1
+        if rounds > 0:
+            for session in queue.active:
+                queue.deficit[session] += rounds * self._quantum * self._weights.get(session, 1.0)
+
+    @staticmethod
+    def _pop(queue: _ClassQueue, session: str) -> _Ticket:
+        pending = queue.sessions[session]
+        ticket = pending.popleft()
+        queue.size -= 1
+        if not pending:
+            # An idle session forfeits its remaining credit (standard DRR).
+            del queue.sessions[session]
+            del queue.deficit[session]
+            queue.active.remove(session)
+
+        latency = time.monotonic() - ticket.enqueued_at
+        queue.dispatched += 1
+        queue.latencies.append(latency)
+        queue.total_latency += latency
+        queue.max_latency = max(queue.max_latency, latency)
+        return ticket
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                ticket = self._next_ticket()
+                while ticket is None:
+                    if self._closed:
+                        return
+                    self._cond.wait()
+                    ticket = self._next_ticket()
+
+            if not ticket.future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = ticket.context.run(
+                    self._executor.execute,
+                    ticket.tool_name,
+                    event_callback=ticket.event_callback,
+                    **ticket.kwargs,
+                )
+            except BaseException as exc:  # noqa: BLE001
+                # execute() never raises by contract; if it does anyway,
+                # fail this call rather than the worker thread.
+                logger.exception("Scheduled call to %r raised", ticket.tool_name)
+                ticket.future.set_exception(exc)
+                continue
+            ticket.future.set_result(result)
+
+    def __repr__(self) -> str:
+        queued = {name: queue.size for name, queue in self._classes.items()}
+        return f"<ExecutionScheduler workers={len(self._threads)} queued={queued}>"
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
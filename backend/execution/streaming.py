@@ -0,0 +1,138 @@
+"""
+execution/streaming.py
+
+Assembly of streamed tool output (see `BaseTool.execute_stream`).
+
+OutputAssembler collects the chunks a streaming tool yields. With a
+`spill_threshold`, chunks are kept in memory until their total size passes
+it; from then on everything is written to a spill file instead (returned
+as an OutputHandle), so the memory held per execution stays bounded
+however large the output grows. Without one, the output stays in memory.
+
+`chunk_preview` produces the bounded text carried by `output_chunk`
+events, so a huge chunk never ends up copied into an event whole.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import BinaryIO
+
+from core.tools.output import OutputHandle
+
+# Largest slice of a chunk copied into an `output_chunk` event message.
+CHUNK_PREVIEW_CHARS = 1024
+
+
+def chunk_preview(chunk: str | bytes, limit: int = CHUNK_PREVIEW_CHARS) -> str:
+    """At most `limit` characters of `chunk`, noting how much was cut."""
+    if isinstance(chunk, bytes):
+        text = chunk[:limit].decode("utf-8", errors="replace")
+    else:
+        text = chunk[:limit]
+    if len(chunk) > limit:
+        text += f"… (+{len(chunk) - limit} more)"
+    return text
+
+
+class OutputAssembler:
+    """
+    Accumulates streamed chunks, spilling to disk past a size threshold.
+
+    Parameters
+    ----------
+    spill_threshold : int | None -- bytes held in memory before spilling
+                                   (None: never spill).
+    spill_dir       : str | Path -- where spill files go (default: system temp).
+
+    Text chunks are UTF-8 encoded once the output spills or is mixed with
+    bytes chunks; an all-text output that stays in memory is returned as str.
+    """
+
+    def __init__(
+        self,
+        spill_threshold: int | None = None,
+        spill_dir: str | Path | None = None,
+    ) -> None:
+        self._threshold = spill_threshold
+        self._spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self._chunks: list[str | bytes] = []
+        self._buffered = 0
+        self._text_only = True
+        self._file: BinaryIO | None = None
+        self.chunks = 0
+        self.size = 0                           # bytes received so far
+
+    @property
+    def spilled(self) -> bool:
+        return self._file is not None
+
+    def write(self, chunk: str | bytes) -> None:
+        if isinstance(chunk, str):
+            size = len(chunk.encode("utf-8")) if not chunk.isascii() else len(chunk)
+        elif isinstance(chunk, (bytes, bytearray, memoryview)):
+            chunk = bytes(chunk)
+            size = len(chunk)
+            self._text_only = False
+        else:
+            raise TypeError(
+                f"execute_stream must yield str or bytes chunks, got {type(chunk).__name__}"
+            )
+        self.chunks += 1
+        self.size += size
+
+        if self._file is not None:
+            self._file.write(_encode(chunk))
+            return
+        self._chunks.append(chunk)
+        self._buffered += size
+        if self._threshold is not None and self._buffered > self._threshold:
+            self._spill()
+
+    def _spill(self) -> None:
+        if self._spill_dir is not None:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+        self._file = tempfile.NamedTemporaryFile(
+            mode="wb",
+            prefix="gladden-",
+            suffix=".out",
+            dir=self._spill_dir,
+            delete=False,
+        )
+        for chunk in self._chunks:
+            self._file.write(_encode(chunk))
+        self._chunks.clear()
+        self._buffered = 0
+
+    def finish(self) -> str | bytes | OutputHandle:
+        """
+        The assembled output: str or bytes when it stayed in memory,
+        otherwise a handle to the (closed) spill file.
+        """
+        if self._file is not None:
+            self._file.close()
+            return OutputHandle(
+                self._file.name,
+                size=self.size,
+                encoding="utf-8" if self._text_only else None,
+            )
+        if self._text_only:
+            return "".join(self._chunks)        # type: ignore[arg-type]
+        return b"".join(_encode(chunk) for chunk in self._chunks)
+
+    def discard(self) -> None:
+        """Drop everything collected, deleting the spill file if any."""
+        self._chunks.clear()
+        if self._file is not None:
+            self._file.close()
+            try:
+                os.unlink(self._file.name)
+            except OSError:
+                pass
+            self._file = None
+
+
+def _encode(chunk: str | bytes) -> bytes:
+    return chunk.encode("utf-8") if isinstance(chunk, str) else chunk
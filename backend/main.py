@@ -20,12 +20,21 @@ Setup
     python main.py
 
 Type  'quit' or 'exit'  to stop.
+Press Ctrl-C            to cancel the instruction that is running.
+Set GLADDEN_TOOLS_DIR   to load tools from a directory and hot-reload them
+                        whenever its files change.
 Type  'tools'           to list registered tools.
+Type  'metrics'         to print latency histograms and counters.
+Type  'trace'           to print the spans of the last instruction.
+Type  'profile ...'     to profile instructions (on [memory] | off | next |
+                        show | dump <path>).
 """
 
 import logging
 import os
 import sys
+import threading
+from pathlib import Path
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -45,9 +54,32 @@ logger = logging.getLogger("main")
 # --------------------------------------------------------------------------- #
 from core.tools import FileCreationTool
 from core.tools.registry import ToolRegistry
+from core.tools.watcher import ToolWatcher
 from execution.executor import ToolExecutor
+from execution.metrics import MetricsRegistry
+from execution.profiling import Profiler
+from core.cancellation import CancellationToken
+from core.tools.base import ToolResult
+from core.tracing import RingBufferExporter, Tracer
 from agent.agent import Agent
 
+# Recent spans, for the REPL's `trace` command.
+trace_buffer = RingBufferExporter(capacity=1024)
+
+# Deadline for one instruction (Groq request + tool call), in seconds.
+INSTRUCTION_TIMEOUT = float(os.environ.get("AGENT_TIMEOUT_SECONDS", "120"))
+
+# How long Ctrl-C waits for the instruction to stop before giving up on it.
+CANCEL_GRACE_SECONDS = 2.0
+
+# Registry snapshot reused across starts while no tool source has changed
+# (see core/tools/persistence.py). Set GLADDEN_REGISTRY_SNAPSHOT to "" to
+# always register tools from scratch.
+REGISTRY_SNAPSHOT = os.environ.get(
+    "GLADDEN_REGISTRY_SNAPSHOT",
+    str(Path(__file__).resolve().parent / ".gladden" / "registry.snapshot"),
+).strip()
+
 
 # --------------------------------------------------------------------------- #
 #  Event callback                                                               #
@@ -98,6 +130,40 @@ def console_event_callback(event: dict) -> None:
 #  Bootstrap                                                                    #
 # --------------------------------------------------------------------------- #
 
+def build_registry() -> ToolRegistry:
+    """
+    Register the built-in, manifest and plugin tools — from the registry
+    snapshot when it is still current, otherwise from scratch (and then
+    save a new snapshot).
+    """
+    registry = ToolRegistry()
+
+    # Extra tools are registered lazily: described up front, imported on
+    # first use. GLADDEN_TOOL_MANIFEST points at a JSON manifest; installed
+    # packages can also publish tools under the "gladden.tools" entry point.
+    manifest = os.environ.get("GLADDEN_TOOL_MANIFEST", "").strip()
+    # The snapshot is tied to the manifest used and goes stale when it or a
+    # package in site-packages changes.
+    key = f"manifest={manifest}"
+    sources = [manifest] if manifest else []
+    sources += [entry for entry in sys.path if entry.endswith("site-packages") and os.path.isdir(entry)]
+
+    if REGISTRY_SNAPSHOT and registry.load_snapshot(REGISTRY_SNAPSHOT, key=key):
+        return registry
+
+    registry.register(FileCreationTool())
+    if manifest:
+        registry.register_manifest(manifest)
+    registry.discover_plugins()
+
+    if REGISTRY_SNAPSHOT:
+        try:
+            registry.save_snapshot(REGISTRY_SNAPSHOT, key=key, extra_sources=sources)
+        except (OSError, ValueError) as exc:
+            logger.warning("Could not save the registry snapshot: %s", exc)
+    return registry
+
+
 def build_agent() -> Agent:
     """Wire up the full stack and return a ready Agent."""
 
@@ -108,11 +174,32 @@ def build_agent() -> Agent:
         print("        Then set it:  export GROQ_API_KEY=your_key_here")
         sys.exit(1)
 
-    registry = ToolRegistry()
-    registry.register(FileCreationTool())
-
-    executor = ToolExecutor(registry)
-    agent    = Agent(registry=registry, executor=executor, api_key=api_key)
+    registry = build_registry()
+
+    # GLADDEN_TOOLS_DIR: a directory of tool modules that is watched and
+    # hot-reloaded while the REPL runs, without restarting it.
+    tools_dir = os.environ.get("GLADDEN_TOOLS_DIR", "").strip()
+    if tools_dir:
+        ToolWatcher(registry, tools_dir).start()
+
+    # GLADDEN_WARM_UP=1: import and set up lazily registered tools in the
+    # background now, instead of on their first call.
+    if os.environ.get("GLADDEN_WARM_UP", "").strip() in {"1", "true", "yes"}:
+        threading.Thread(target=registry.warm_up, name="tool-warm-up", daemon=True).start()
+
+    metrics  = MetricsRegistry()
+    tracer   = Tracer([trace_buffer])
+    profiler = Profiler()
+    executor = ToolExecutor(registry, metrics=metrics, profiler=profiler)
+    agent    = Agent(
+        registry=registry,
+        executor=executor,
+        api_key=api_key,
+        metrics=metrics,
+        tracer=tracer,
+        profiler=profiler,
+        timeout=INSTRUCTION_TIMEOUT,
+    )
 
     return agent
 
@@ -127,6 +214,11 @@ BANNER = """
 ╠══════════════════════════════════════════════════════════════╣
 ║  Commands:                                                  ║
 ║    tools        → list available tools                      ║
+║    metrics      → show latency histograms and counters      ║
+║    trace        → show spans of the last instruction        ║
+║    profile on [memory] / off / next → profile instructions  ║
+║    profile show / dump <path>       → inspect last profile  ║
+║    Ctrl-C       → cancel the running instruction            ║
 ║    quit / exit  → exit                                      ║
 ║    <anything else> → sent to the agent as an instruction    ║
 ╚══════════════════════════════════════════════════════════════╝
@@ -145,6 +237,97 @@ def print_result(result) -> None:
         print(f"  Error    : {result.error}")
 
 
+def print_last_trace() -> None:
+    """Print the most recent trace as an indented span tree with timings."""
+    traces = trace_buffer.traces()
+    if not traces:
+        print("  No traces recorded yet.\n")
+        return
+    spans = max(traces.values(), key=lambda spans: spans[0].start_unix_ns)
+    depth: dict[str, int] = {}
+    for span in spans:
+        depth[span.span_id] = depth.get(span.parent_id, -1) + 1
+        marker = "❌" if span.status == "error" else "  "
+        print(
+            f"  {marker} {'   ' * depth[span.span_id]}{span.name:<{32 - 3 * depth[span.span_id]}}"
+            f"{(span.duration or 0) * 1000:9.2f} ms  {span.attributes or ''}"
+        )
+    print()
+
+
+PROFILE_ACTIONS = {"on", "off", "next", "show", "dump"}
+
+
+def profile_command(profiler: Profiler, args: list[str]) -> None:
+    """Handle `profile on [memory] | off | next | show | dump <path>`."""
+    action = args[0].lower() if args else "show"
+
+    if action == "on":
+        profiler.enable(memory="memory" in args[1:])
+        print("  Profiling every instruction until 'profile off'.\n")
+    elif action == "off":
+        profiler.disable()
+        print("  Profiling off.\n")
+    elif action == "next":
+        profiler.arm(1)
+        print("  The next instruction will be profiled.\n")
+    elif action in {"show", "dump"}:
+        profile = profiler.last()
+        if profile is None:
+            print("  No profile recorded yet.\n")
+        elif action == "show":
+            print(f"  Profile #{profile.id}  {profile.label}  {profile.duration * 1000:.1f} ms\n")
+            print(profile.stats_text(limit=20))
+            if profile.peak_memory is not None:
+                print(profile.allocations_text(limit=10))
+            print()
+        elif len(args) < 2:
+            print("  Usage: profile dump <path>\n")
+        else:
+            path = profile.dump(args[1])
+            print(f"  Profile #{profile.id} written to {path.resolve()}\n")
+    else:
+        print("  Usage: profile on [memory] | off | next | show | dump <path>\n")
+
+
+def run_cancellable(agent: Agent, instruction: str) -> ToolResult:
+    """
+    Run one instruction on a worker thread so Ctrl-C cancels just that
+    instruction. The agent and tools stop at their next cancellation check;
+    if they haven't within CANCEL_GRACE_SECONDS the REPL stops waiting.
+    """
+    token = CancellationToken()
+    outcome: list[ToolResult] = []
+    # An Event rather than Thread.join: a join interrupted by Ctrl-C can
+    # return immediately on the next call.
+    done = threading.Event()
+
+    def work() -> None:
+        try:
+            outcome.append(agent.run(instruction, token=token))
+        finally:
+            done.set()
+
+    threading.Thread(target=work, name="instruction", daemon=True).start()
+    try:
+        while not done.wait(0.1):
+            pass
+    except KeyboardInterrupt:
+        token.cancel("Interrupted by user (Ctrl-C).")
+        print("\n  ⏹  Cancelling…")
+        try:
+            done.wait(CANCEL_GRACE_SECONDS)
+        except KeyboardInterrupt:
+            pass
+    if outcome:
+        return outcome[0]
+    return ToolResult(
+        success=False,
+        error="Instruction cancelled by user (Ctrl-C).",
+        metadata={"status": "cancelled"},
+    )
+
+
 def repl(agent: Agent) -> None:
     print(BANNER)
     print(f"  Agent   : {agent}")
@@ -171,6 +354,29 @@ def repl(agent: Agent) -> None:
             print()
             continue
 
+        if raw.lower() == "metrics":
+            print()
+            if agent.metrics is None:
+                print("  Metrics are not enabled.\n")
+            else:
+                print(agent.metrics.render_prometheus())
+            continue
+
+        if raw.lower() == "trace":
+            print()
+            print_last_trace()
+            continue
+
+        words = raw.split()
+        if (
+            words[0].lower() == "profile"
+            and agent.profiler is not None
+            and (len(words) == 1 or words[1].lower() in PROFILE_ACTIONS)
+        ):
+            print()
+            profile_command(agent.profiler, words[1:])
+            continue
+
         # ---------------------------------------------------------------- #
         # Run the agent.                                                    #
         #                                                                   #
@@ -196,7 +402,7 @@ def repl(agent: Agent) -> None:
 
         print()
         print("  ── Execution events ─────────────────────────────────────")
-        result = agent.run(raw)
+        result = run_cancellable(agent, raw)
         print("  ─────────────────────────────────────────────────────────")
         print_result(result)
 
@@ -211,4 +417,7 @@ def repl(agent: Agent) -> None:
 
 if __name__ == "__main__":
     agent = build_agent()
-    repl(agent)
\ No newline at end of file
+    try:
+        repl(agent)
+    finally:
+        agent._registry.close()         # tool teardown, shared pools closed
\ No newline at end of file